@@ -1,2 +1,17 @@
+from .search_algorithm import SearchAlgorithm
 from .breadth_first_search import BreadthFirstSearch
-from .depth_first_search import DepthFirstSearch
\ No newline at end of file
+from .depth_first_search import DepthFirstSearch
+from .parallel_breadth_first_search import ParallelBreadthFirstSearch
+from .depth_limited_search import DepthLimitedSearch
+from .iterative_deepening_search import IterativeDeepeningSearch
+from .uniform_cost_search import UniformCostSearch
+from .greedy_best_first_search import GreedyBestFirstSearch
+from .a_star_search import AStarSearch
+from .bidirectional_search import BidirectionalSearch
+from .external_breadth_first_search import ExternalBreadthFirstSearch
+from .instrumentation import SearchObserver, PhaseProfiler
+from .visited import VisitedStore, ExactVisitedSet, HashedVisitedSet, BloomVisitedFilter, BitmapVisitedSet, EncodedVisitedSet
+from .frontier import EncodedQueue
+from .async_search import AsyncSearchAlgorithm, AsyncBreadthFirstSearch, AsyncDepthFirstSearch, AsyncBestFirstSearch
+from .batch_solver import BatchSolver, JobResult, shared_array
+from .monte_carlo_tree_search import MonteCarloTreeSearch
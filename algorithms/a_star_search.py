@@ -0,0 +1,11 @@
+from .best_first_search import BestFirstSearch
+
+class AStarSearch(BestFirstSearch):
+    """A* Search, expanding states in order of path cost plus `heuristic` estimate.
+    Returns a cheapest goal when the heuristic never overestimates the remaining cost."""
+
+    def __init__(self, heuristic):
+        super().__init__(heuristic)
+
+    def priority(self, state, path_cost):
+        return path_cost + self.heuristic(state)
@@ -0,0 +1,196 @@
+from .search_algorithm import SearchBookkeeping
+from .best_first_search import PriorityFrontier
+from abc import ABC, abstractmethod
+from collections import deque
+from itertools import islice
+import asyncio
+
+
+class AsyncSearchAlgorithm(SearchBookkeeping, ABC):
+    """Base class for searches over an `AsyncProblem`, driven with `await algorithm.search(problem)`.
+
+    The loop is the `SearchAlgorithm` template (`next_node` / `evaluate_node` / `expand_node`),
+    and states are expanded in exactly the same order as the synchronous algorithm, so results,
+    paths and node counters match it. Concurrency comes from prefetching: when a state is
+    expanded, the expansion of the next `max_concurrency - 1` states the algorithm will retrieve
+    is started as well, and at most `max_concurrency` problem calls run at any time. Prefetched
+    expansions of states that end up never retrieved are cancelled when the search finishes.
+    Goal tests, parent links and visited checks are the shared `SearchBookkeeping` ones, so
+    `goal_test` and `goal_tests` behave as in the synchronous searches.
+    """
+
+    def __init__(self, max_concurrency=8):
+        super().__init__()
+        self.max_concurrency = max_concurrency
+
+    async def search(self, problem):
+        """Run the search on `problem` and return True if a goal was found."""
+        self.check_goal_test()
+        self.initialize(problem)
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.pending = {}  # id(state) -> (state, expansion task)
+        try:
+            while not self.is_search_complete():
+                self.next_node()
+                self.evaluate_node()
+                await self.expand_node()
+        finally:
+            self.finish()
+        return self.retrieve_result() is not None
+
+    async def successors(self, state, upcoming=()):
+        """Return `[(action, child, cost), ...]` for `state` in `get_actions` order, and start
+        expanding the first states of `upcoming` (the next ones to be retrieved) concurrently."""
+        for other in islice(upcoming, self.max_concurrency - 1):
+            if id(other) not in self.pending:
+                self.pending[id(other)] = (other, asyncio.ensure_future(self._expand(other)))
+        entry = self.pending.pop(id(state), None)
+        if entry is None or entry[0] is not state:
+            return await self._expand(state)
+        return await entry[1]
+
+    async def _expand(self, state):
+        async with self.semaphore:
+            actions = await self.problem.get_actions(state)
+        results = await asyncio.gather(*(self._result(state, action) for action in actions))
+        return [(action, new_state, cost) for action, (new_state, cost) in zip(actions, results)]
+
+    async def _result(self, state, action):
+        async with self.semaphore:
+            return await self.problem.get_result(state, action)
+
+    def finish(self):
+        """Cancel the prefetched expansions that were not used."""
+        for _, task in self.pending.values():
+            task.cancel()
+        self.pending = {}
+
+    def report_goal(self, state):
+        """Make `state` the result; returns True as the search stops on the first goal."""
+        self.result = state
+        return True
+
+    def retrieve_result(self):
+        return self.result
+
+    @abstractmethod
+    def initialize(self, problem):
+        """Initialize search-specific structures (e.g., queue, priority structures)."""
+        pass
+
+    @abstractmethod
+    def is_search_complete(self):
+        """Check if search should terminate."""
+        pass
+
+    @abstractmethod
+    def next_node(self):
+        """Set the next node to visit by updating self.current_state."""
+        self.nodes_retrieved += 1
+
+    @abstractmethod
+    def evaluate_node(self):
+        """Goal-check the current node where the algorithm does so on retrieval."""
+        self.nodes_evaluated += 1
+
+    @abstractmethod
+    async def expand_node(self):
+        """Expand the current node by adding its neighbors."""
+        self.nodes_expanded += 1
+
+
+class AsyncBreadthFirstSearch(AsyncSearchAlgorithm):
+    """Asynchronous `BreadthFirstSearch`, with a visited set and the `goal_test` policy."""
+
+    def initialize(self, problem):
+        """Set up search structures based on the specific problem instance."""
+        self.start_search(problem)
+        self.queue = deque([self.initial_state])
+        self.visited = set()
+        self.test_initial_state()
+
+    def is_search_complete(self):
+        return not self.queue or self.result is not None
+
+    def next_node(self):
+        super().next_node()
+        self.current_state = self.queue.popleft()
+
+    def evaluate_node(self):
+        super().evaluate_node()
+        self.test_current_state()  # Goal-checking occurs in `expand_node`, unless it is deferred to retrieval
+
+    async def expand_node(self):
+        """Generate child states and add them to the queue if they haven't been visited."""
+        if self.result is not None:
+            return  # The current state is a goal found on retrieval
+        await super().expand_node()
+        children = await self.successors(self.current_state, self.queue)
+        self.add_children(self.current_state, self.goal_tested(children, self.visited), self.visited, self.queue.append)
+
+
+class AsyncDepthFirstSearch(AsyncSearchAlgorithm):
+    """Asynchronous `DepthFirstSearch`: the most recently discovered state is expanded first."""
+
+    def initialize(self, problem):
+        """Set up search structures based on the specific problem instance."""
+        self.start_search(problem)
+        self.queue = deque([self.initial_state])
+        self.visited = set()
+        self.test_initial_state()
+
+    def is_search_complete(self):
+        return not self.queue or self.result is not None
+
+    def next_node(self):
+        super().next_node()
+        self.current_state = self.queue.pop()
+
+    def evaluate_node(self):
+        super().evaluate_node()
+        self.test_current_state()  # Goal-checking occurs in `expand_node`, unless it is deferred to retrieval
+
+    async def expand_node(self):
+        """Generate child states and push them so that the first one is retrieved first."""
+        if self.result is not None:
+            return  # The current state is a goal found on retrieval
+        await super().expand_node()
+        add_to_queue = []
+        children = await self.successors(self.current_state, reversed(self.queue))
+        if not self.add_children(self.current_state, self.goal_tested(children, self.visited), self.visited,
+                                 add_to_queue.append):
+            self.queue.extend(reversed(add_to_queue))
+
+
+def path_cost_priority(state, path_cost):
+    """Default `AsyncBestFirstSearch` priority: the path cost, as in uniform-cost search."""
+    return path_cost
+
+
+class AsyncBestFirstSearch(PriorityFrontier, AsyncSearchAlgorithm):
+    """Asynchronous `BestFirstSearch` retrieving the state with the lowest `priority(state, path_cost)`.
+
+    The default priority is the path cost (uniform-cost search); pass
+    `lambda state, cost: cost + heuristic(state)` for A*. The frontier is the shared
+    `PriorityFrontier`, so states are goal-checked when retrieved. The states prefetched are
+    those of the top entries of the heap array that are not stale, which are cheap to read
+    and usually among the next ones retrieved.
+    """
+
+    def __init__(self, priority=None, max_concurrency=8):
+        super().__init__(max_concurrency)
+        self.priority = priority if priority is not None else path_cost_priority
+
+    def initialize(self, problem):
+        """Set up search structures based on the specific problem instance."""
+        self.start_search(problem)
+        self.start_frontier()
+
+    async def expand_node(self):
+        """Push the children of the current state that were reached through a cheaper path."""
+        if self.result is not None:
+            return
+        await super().expand_node()
+        # Stale entries (see `PriorityFrontier`) are never retrieved, so they are not prefetched
+        upcoming = (entry[3] for entry in self.frontier if entry[2] <= self.best_cost[entry[3]])
+        self.add_cheaper_children(await self.successors(self.current_state, upcoming))
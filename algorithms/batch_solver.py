@@ -0,0 +1,156 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from collections import namedtuple
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+import os
+import time
+
+JobResult = namedtuple("JobResult", ["index", "found", "result", "path", "nodes_retrieved", "nodes_expanded",
+                                     "nodes_evaluated", "seconds", "suspended", "error"])
+
+_worker_algorithm = None  # Algorithm factory and budgets of the current batch, set once per worker process
+_worker_budgets = None
+_shared_arrays = {}  # name -> read-only array backed by shared memory
+_shared_blocks = []  # Keeps the shared memory mappings of this process open
+
+
+def shared_array(name):
+    """Return the read-only array published as `name` by the running `BatchSolver`.
+
+    Problems solved in a batch call this (e.g. lazily, on first use) to reach large shared
+    data such as transition tables without carrying it in their own pickled state.
+    """
+    return _shared_arrays[name]
+
+
+def _init_worker(algorithm, budgets, specs):
+    global _worker_algorithm, _worker_budgets
+    _worker_algorithm = algorithm
+    _worker_budgets = budgets
+    for name, (block_name, shape, dtype) in specs.items():
+        block = SharedMemory(name=block_name)
+        array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        array.flags.writeable = False
+        _shared_arrays[name] = array
+        _shared_blocks.append(block)
+
+
+def _run_job(index, problem):
+    """Worker entry point: solve one problem with the worker's algorithm factory and budgets."""
+    return run_job(_worker_algorithm, index, problem, **_worker_budgets)
+
+
+def run_job(algorithm, index, problem, max_nodes=None, max_seconds=None, max_memory=None):
+    """Solve `problem` with a fresh `algorithm()` and return its `JobResult`.
+
+    Exceptions raised by the problem, the algorithm or its factory are reported in `error`
+    instead of aborting the batch.
+    """
+    start = time.perf_counter()
+    search = None
+    try:
+        search = algorithm()
+        found = search.search(problem, max_nodes=max_nodes, max_seconds=max_seconds, max_memory=max_memory)
+        try:
+            path = search.retrieve_path() if found else None
+        except NotImplementedError:
+            path = None  # The algorithm keeps no parent links
+        error = None
+    except Exception as exception:
+        found, path, error = False, None, f"{type(exception).__name__}: {exception}"
+    if search is None:  # The factory failed, so no search ran
+        return JobResult(index, False, None, None, 0, 0, 0, time.perf_counter() - start, False, error)
+    return JobResult(index, found, search.retrieve_result() if found else None, path, search.nodes_retrieved,
+                     search.nodes_expanded, search.nodes_evaluated, time.perf_counter() - start,
+                     search.suspended, error)
+
+
+class BatchSolver:
+    """Solves many problem instances with one algorithm across a pool of worker processes.
+
+    `algorithm` is a picklable zero-argument factory (e.g. `BreadthFirstSearch` or a
+    `functools.partial`) called once per job. It is sent to each worker once, together with
+    the per-job budgets (`max_nodes`, `max_seconds`, `max_memory`, as in `search`); problems
+    are pickled per job. Jobs are handed out one at a time as workers become idle, so a few
+    slow instances do not hold back the others, and at most `prefetch` jobs per worker are
+    queued, so the input iterable is consumed lazily.
+
+    `shared` maps names to NumPy arrays that are copied once into shared memory; workers map
+    them read-only and problems reach them through `shared_array(name)`. With `max_workers=0`
+    jobs run in the calling process.
+    """
+
+    def __init__(self, algorithm, max_workers=None, max_nodes=None, max_seconds=None, max_memory=None,
+                 shared=None, prefetch=2, mp_context=None):
+        self.algorithm = algorithm
+        self.max_workers = max_workers if max_workers is not None else os.cpu_count() or 1
+        self.budgets = {"max_nodes": max_nodes, "max_seconds": max_seconds, "max_memory": max_memory}
+        self.shared = shared or {}
+        self.prefetch = prefetch
+        self.mp_context = mp_context
+
+    def solve(self, problems, ordered=False):
+        """Yield a `JobResult` per problem as soon as it is solved.
+
+        Results come in completion order, each carrying the `index` of its problem in
+        `problems`; with `ordered=True` they are yielded in input order instead.
+        """
+        blocks, specs = self._share()
+        try:
+            if self.max_workers == 0:
+                _init_worker(self.algorithm, self.budgets, specs)
+                results = (_run_job(index, problem) for index, problem in enumerate(problems))
+            else:
+                results = self._run_pool(problems, specs)
+            if ordered:
+                results = self._in_order(results)
+            yield from results
+        finally:
+            _shared_arrays.clear()
+            for block in _shared_blocks:
+                block.close()
+            _shared_blocks.clear()
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    def solve_all(self, problems):
+        """Return the `JobResult`s of all problems, in input order."""
+        return list(self.solve(problems, ordered=True))
+
+    def _share(self):
+        blocks, specs = [], {}
+        for name, array in self.shared.items():
+            array = np.ascontiguousarray(array)
+            block = SharedMemory(create=True, size=max(array.nbytes, 1))
+            np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+            blocks.append(block)
+            specs[name] = (block.name, array.shape, array.dtype.str)
+        return blocks, specs
+
+    def _run_pool(self, problems, specs):
+        jobs = enumerate(problems)
+        with ProcessPoolExecutor(self.max_workers, mp_context=self.mp_context, initializer=_init_worker,
+                                 initargs=(self.algorithm, self.budgets, specs)) as executor:
+            running = set()
+            for index, problem in jobs:
+                running.add(executor.submit(_run_job, index, problem))
+                if len(running) >= self.max_workers * self.prefetch:
+                    break
+            while running:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for index, problem in jobs:
+                        running.add(executor.submit(_run_job, index, problem))
+                        break
+                    yield future.result()
+
+    @staticmethod
+    def _in_order(results):
+        waiting = {}
+        next_index = 0
+        for result in results:
+            waiting[result.index] = result
+            while next_index in waiting:
+                yield waiting.pop(next_index)
+                next_index += 1
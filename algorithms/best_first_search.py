@@ -0,0 +1,106 @@
+from .search_algorithm import SearchAlgorithm
+from abc import abstractmethod
+from itertools import count
+import heapq
+
+
+def zero_heuristic(state):
+    """Default heuristic: no estimate (a module function, so searches stay picklable)."""
+    return 0.0
+
+
+class PriorityFrontier:
+    """Frontier of the best-first searches, shared by `BestFirstSearch` and `AsyncBestFirstSearch`.
+
+    The frontier is a `heapq` of `(priority, tie_breaker, path_cost, state)` entries. Instead
+    of a decrease-key operation, a state reached through a cheaper path is pushed again and
+    `best_cost` (the cheapest known path cost per state) marks the older entries as stale;
+    they are dropped when they reach the top of the heap. States are goal-checked when
+    retrieved, which is what keeps uniform-cost and A* answers optimal. Parent links follow
+    the cheapest known path to each state.
+
+    It provides the template steps except `expand_node`, which passes the children of the
+    current state to `add_cheaper_children`. Classes using it define `priority(state, path_cost)`.
+    """
+
+    goal_test = "retrieval"
+    goal_test_policies = ("retrieval",)
+
+    def start_frontier(self):
+        """Reset the frontier to the initial state alone."""
+        self.frontier = []
+        self.tie_breaker = count()  # Keeps equal priorities in insertion order
+        self.best_cost = {}
+        self.result_cost = None
+        self.push(self.initial_state, 0.0)
+
+    def push(self, state, path_cost):
+        """Record `path_cost` as the best known cost of `state` and add it to the frontier."""
+        self.best_cost[state] = path_cost
+        heapq.heappush(self.frontier, (self.priority(state, path_cost), next(self.tie_breaker), path_cost, state))
+
+    def is_search_complete(self):
+        """Drop stale entries from the top of the frontier, then check if it is empty or a result was found."""
+        while self.frontier and self.frontier[0][2] > self.best_cost[self.frontier[0][3]]:
+            heapq.heappop(self.frontier)
+        return not self.frontier or self.result is not None
+
+    def next_node(self):
+        """Pop the state with the lowest priority from the frontier."""
+        super().next_node()
+        _, _, self.current_cost, self.current_state = heapq.heappop(self.frontier)
+
+    def evaluate_node(self):
+        """Check if the retrieved state is a goal."""
+        super().evaluate_node()
+        if self.is_goal(self.current_state) and self.report_goal(self.current_state):
+            self.result_cost = self.current_cost
+
+    def add_cheaper_children(self, children):
+        """Push the `(action, child, cost)` children of the current state that were reached
+        through a cheaper path. Transition costs are accumulated into the path cost."""
+        for action, new_state, cost in children:
+            new_cost = self.current_cost + cost
+            if new_state not in self.best_cost or new_cost < self.best_cost[new_state]:
+                self.parents[new_state] = (self.current_state, action, new_cost)
+                self.push(new_state, new_cost)
+
+
+class BestFirstSearch(PriorityFrontier, SearchAlgorithm):
+    """Best-First Search, always retrieving the frontier state with the lowest `priority`
+    (see `PriorityFrontier`).
+
+    `heuristic` is a callable estimating the remaining cost from a state to a goal.
+    """
+
+    def __init__(self, heuristic=None):
+        super().__init__()
+        self.heuristic = heuristic if heuristic is not None else zero_heuristic
+
+    @abstractmethod
+    def priority(self, state, path_cost):
+        """Return the frontier priority of `state` reached with `path_cost` (lower is retrieved first)."""
+        pass
+
+    def initialize(self, problem):
+        """Set up search structures based on the specific problem instance."""
+        self.start_search(problem)
+        self.prepare_successors(self.problem)
+        self.start_frontier()
+
+    def expand_node(self):
+        """Push the children of the current state that were reached through a cheaper path."""
+        if self.result is not None:
+            return  # The current state is the goal, nothing left to expand
+        super().expand_node()
+        self.add_cheaper_children(self.successors(self.current_state))
+
+    def frontier_size(self):
+        return len(self.frontier)
+
+    def visited_size(self):
+        return len(self.best_cost)
+
+    def retrieve_result(self):
+        """Return the final state or result based on the search completion."""
+        return self.result
@@ -0,0 +1,102 @@
+from .search_algorithm import SearchAlgorithm
+from collections import deque
+
+class BidirectionalSearch(SearchAlgorithm):
+    """Bidirectional Breadth-First Search, growing one frontier from the initial state and one
+    from the goal state until they meet.
+
+    Requires a problem implementing the `get_goal_state` and `get_predecessors` hooks. Each
+    iteration expands one state from the smaller frontier (forward on ties), so the search
+    explores about 2 * b^(d/2) states instead of b^d. Forward links are kept in `parents`
+    and backward links (state -> next state towards the goal) in `successor_links`; the
+    search stops as soon as a generated state is known to the other side.
+
+    The path found joins the two searches at the first meeting state, so it is not
+    guaranteed to be the shortest one. As the goal is a single state, streaming with
+    `search_iter` is not supported.
+    """
+
+    supports_streaming = False
+    goal_test_policies = ("generation",)  # The frontiers meet at a generated state
+
+    def initialize(self, problem):
+        """Set up both frontiers based on the specific problem instance."""
+        if not (problem.implements("get_goal_state") and problem.implements("get_predecessors")):
+            raise ValueError("BidirectionalSearch requires a problem implementing get_goal_state and get_predecessors.")
+        self.problem = problem
+        self.initial_state = self.problem.get_initial_state()
+        self.goal_state = self.problem.get_goal_state()
+        self.forward_queue = deque([self.initial_state])
+        self.backward_queue = deque([self.goal_state])
+        self.successor_links = {self.goal_state: (None, None, 0.0)}  # state -> (next state, action, cost to goal)
+        self.meeting_state = None
+        self.result = None
+        self.prepare_successors(self.problem)
+        self.reset_parents(self.initial_state)
+        if self.initial_state == self.goal_state:
+            self.meeting_state = self.initial_state
+            self.result = self.goal_state
+
+    def is_search_complete(self):
+        """Check if either frontier is exhausted (no path exists) or if the frontiers met."""
+        return not self.forward_queue or not self.backward_queue or self.result is not None
+
+    def next_node(self):
+        """Pop the next state from the smaller frontier."""
+        super().next_node()
+        self.forward = len(self.forward_queue) <= len(self.backward_queue)
+        queue = self.forward_queue if self.forward else self.backward_queue
+        self.current_state = queue.popleft()
+
+    def evaluate_node(self):
+        """Goal-checking occurs in `expand_node`, when the frontiers meet."""
+        super().evaluate_node()
+
+    def expand_node(self):
+        """Expand the current state in its search direction, stopping if a child is known to the other side."""
+        super().expand_node()
+        if self.forward:
+            for action, new_state, cost in self.successors(self.current_state, self.forward_queue):
+                if new_state in self.successor_links:
+                    self.record_parent(new_state, self.current_state, action, cost)
+                    self.meet(new_state)
+                    return
+                if new_state not in self.parents:
+                    self.record_parent(new_state, self.current_state, action, cost)
+                    self.forward_queue.append(new_state)
+        else:
+            cost_to_goal = self.successor_links[self.current_state][2]
+            for new_state, action, cost in self.problem.get_predecessors(self.current_state):
+                if new_state in self.parents:
+                    self.successor_links.setdefault(new_state, (self.current_state, action, cost_to_goal + cost))
+                    self.meet(new_state)
+                    return
+                if new_state not in self.successor_links:
+                    self.successor_links[new_state] = (self.current_state, action, cost_to_goal + cost)
+                    self.backward_queue.append(new_state)
+
+    def meet(self, state):
+        """Record the state where both searches met; the result is the goal state."""
+        self.meeting_state = state
+        self.result = self.goal_state
+
+    def frontier_size(self):
+        return len(self.forward_queue) + len(self.backward_queue)
+
+    def visited_size(self):
+        return len(self.parents) + len(self.successor_links)
+
+    def retrieve_result(self):
+        """Return the goal state once the frontiers met, None otherwise."""
+        return self.result
+
+    def retrieve_path(self, state=None):
+        """Return `(actions, path_cost)` from the initial state to the goal through the meeting state."""
+        if self.result is None or state not in (None, self.result):
+            return None
+        actions, path_cost = super().retrieve_path(self.meeting_state)
+        next_state, action, cost_to_goal = self.successor_links[self.meeting_state]
+        while next_state is not None:
+            actions.append(action)
+            next_state, action, _ = self.successor_links[next_state]
+        return actions, path_cost + cost_to_goal
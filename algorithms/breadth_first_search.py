@@ -1,19 +1,36 @@
 from .search_algorithm import SearchAlgorithm
+from .frontier import EncodedQueue
+from .visited import EncodedVisitedSet
 from collections import deque
 
 class BreadthFirstSearch(SearchAlgorithm):
     """Breadth-First Search algorithm, exploring nodes layer-by-layer from the start state."""
 
+    def __init__(self, visited=None, encoded=False):
+        """`visited` is an optional zero-argument factory for the visited store
+        (see `algorithms.visited`); a plain set is used by default.
+
+        With `encoded=True`, and a problem implementing `encode` / `decode`, the frontier is an
+        `EncodedQueue` and the default visited store an `EncodedVisitedSet`, so pending and
+        visited states are kept as NumPy encodings and rebuilt only when expanded.
+        """
+        super().__init__()
+        self.visited_factory = visited
+        self.encoded = encoded
+
 
     def initialize(self, problem):
         """Set up search structures based on the specific problem instance."""
-        self.problem = problem  
-        self.initial_state = self.problem.get_initial_state()
-        self.queue = deque([self.initial_state])   
-        self.visited = set()
-        self.result = None
-        if self.problem.is_goal(self.initial_state):  # Check if the initial state is the goal
-            self.result = self.initial_state  # Set the result directly if goal is found
+        self.start_search(problem)
+        if self.encoded and problem.implements("encode") and problem.implements("decode"):
+            self.queue = EncodedQueue(problem.encode, problem.decode)
+            self.queue.append(self.initial_state)
+            self.visited = self.visited_factory() if self.visited_factory else EncodedVisitedSet(problem.encode)
+        else:
+            self.queue = deque([self.initial_state])
+            self.visited = self.visited_factory() if self.visited_factory else set()
+        self.prepare_successors(self.problem)
+        self.test_initial_state()
 
     def is_search_complete(self):
         """Check if the search queue is empty or if a result has been found."""
@@ -27,19 +44,65 @@ class BreadthFirstSearch(SearchAlgorithm):
     def evaluate_node(self):
         """Evaluate if the current state meets the goal conditions (now only for non-goal states)."""
         super().evaluate_node()
-        # This method can remain empty or be skipped, as goal-checking occurs in `expand_node`.
+        self.test_current_state()  # Goal-checking occurs in `expand_node`, unless it is deferred to retrieval
 
     def expand_node(self):
         """Generate child states and add them to the queue if they haven't been visited."""
+        if self.result is not None:
+            return  # The current state is a goal found on retrieval
         super().expand_node()
-        for action in self.problem.get_actions(self.current_state):
-            new_state, _ = self.problem.get_result(self.current_state, action)
-            if self.problem.is_goal(new_state):  # Check if the child is the goal
-                self.result = new_state
-                return  # Stop expanding further if goal is found
-            if new_state not in self.visited:
-                self.visited.add(new_state)
-                self.queue.append(new_state) # Add new states to the end of the queue
+        # Encoded queues decode a new object per read, so they cannot feed the batch lookahead
+        upcoming = () if isinstance(self.queue, EncodedQueue) else self.queue
+        tested = self.tested_successors(self.current_state, upcoming, self.visited)
+        self.add_children(self.current_state, tested, self.visited, self.queue.append)
+
+    def fused_loop(self):
+        """Run `next_node` / `evaluate_node` / `expand_node` inlined, with the structures and
+        problem methods cached in local variables. Same order, result and counters.
+
+        Problems expanded through `expand_batch` already amortize the per-node overhead and
+        keep the template loop, as do subclasses that customize its steps and the goal test
+        policies other than "generation".
+        """
+        if self.overrides_template(BreadthFirstSearch) or self.use_batch or self.goal_test != "generation":
+            return False
+        queue, visited, parents = self.queue, self.visited, self.parents
+        is_goal, iter_successors = self.problem.is_goal, self.problem.iter_successors
+        popleft, append, add = queue.popleft, queue.append, visited.add
+        record_paths = self.record_paths
+        nodes = tests = 0
+        try:
+            while queue and self.result is None:
+                state = popleft()
+                nodes += 1
+                path_cost = parents[state][2] if record_paths else 0.0
+                for action, new_state, cost in iter_successors(state):
+                    if new_state in visited:
+                        continue
+                    tests += 1
+                    if is_goal(new_state):
+                        if record_paths and new_state not in parents:
+                            parents[new_state] = (state, action, path_cost + cost)
+                        if self.report_goal(new_state):
+                            return True
+                    if new_state not in visited:
+                        add(new_state)
+                        if record_paths and new_state not in parents:
+                            parents[new_state] = (state, action, path_cost + cost)
+                        append(new_state)
+        finally:
+            # Every retrieved node is also evaluated and expanded, as in the template loop
+            self.nodes_retrieved += nodes
+            self.nodes_evaluated += nodes
+            self.nodes_expanded += nodes
+            self.goal_tests += tests
+        return True
+
+    def frontier_size(self):
+        return len(self.queue)
+
+    def visited_size(self):
+        return len(self.visited)
 
     def retrieve_result(self):
         """Return the final state or result based on the search completion."""
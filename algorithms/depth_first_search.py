@@ -1,47 +1,161 @@
 from .search_algorithm import SearchAlgorithm
+from .frontier import EncodedQueue
+from .visited import EncodedVisitedSet
 from collections import deque
 
 class DepthFirstSearch(SearchAlgorithm):
-    """Breadth-First Search algorithm, exploring nodes layer-by-layer from the start state."""
+    """Depth-First Search algorithm, always exploring the most recently discovered state first."""
+
+    def __init__(self, visited=None, encoded=False, lazy=False):
+        """`visited` is an optional zero-argument factory for the visited store
+        (see `algorithms.visited`); a plain set is used by default.
+
+        With `encoded=True`, and a problem implementing `encode` / `decode`, the frontier is an
+        `EncodedQueue` and the default visited store an `EncodedVisitedSet`, so pending and
+        visited states are kept as NumPy encodings and rebuilt only when expanded.
+
+        With `lazy=True` the search backtracks classically: the frontier is a stack holding one
+        successor generator per state on the current path, and the search descends into each
+        child as soon as it is generated, before generating its siblings. Each iteration then
+        retrieves a single child, and the frontier grows with the depth of the search instead
+        of with depth times branching factor. Generators cannot be pickled, so a lazy search
+        cannot be checkpointed, and as children are tested one by one it does not support the
+        "batch" goal test policy.
+        """
+        super().__init__()
+        self.visited_factory = visited
+        self.encoded = encoded
+        self.lazy = lazy
 
 
     def initialize(self, problem):
         """Set up search structures based on the specific problem instance."""
-        self.problem = problem  
-        self.initial_state = self.problem.get_initial_state()
-        self.queue = deque([self.initial_state])   
-        self.visited = set()
-        self.result = None
-        if self.problem.is_goal(self.initial_state):  # Check if the initial state is the goal
-            self.result = self.initial_state  # Set the result directly if goal is found
+        if self.lazy and self.goal_test == "batch":
+            raise ValueError("DepthFirstSearch(lazy=True) generates one child at a time and cannot batch goal tests.")
+        self.start_search(problem)
+        if self.encoded and problem.implements("encode") and problem.implements("decode"):
+            self.queue = EncodedQueue(problem.encode, problem.decode)
+            self.queue.append(self.initial_state)
+            self.visited = self.visited_factory() if self.visited_factory else EncodedVisitedSet(problem.encode)
+        else:
+            self.queue = deque([self.initial_state])
+            self.visited = self.visited_factory() if self.visited_factory else set()
+        self.prepare_successors(self.problem)
+        if self.lazy:
+            self.stack = []  # (state, generator of its remaining successors) for each state on the path
+            self.visited.add(self.initial_state)
+            self.next_child = (None, None, self.initial_state, 0.0)  # (parent, action, child, cost) retrieved next
+        self.test_initial_state()
 
     def is_search_complete(self):
         """Check if the search queue is empty or if a result has been found."""
+        if self.lazy:
+            return self.next_child is None or self.result is not None
         return not self.queue or self.result is not None
 
     def next_node(self):
         """Pop the next node from the queue for exploration."""
         super().next_node()
+        if self.lazy:
+            parent, action, self.current_state, cost = self.next_child
+            self.current_is_child = parent is not None  # False for the initial state
+            if self.current_is_child:
+                self.record_parent(self.current_state, parent, action, cost)
+            return
         self.current_state = self.queue.pop()  # Set current state by removing from the back of the queue
 
     def evaluate_node(self):
         """Evaluate if the current state meets the goal conditions (now only for non-goal states)."""
         super().evaluate_node()
-        # This method can remain empty or be skipped, as goal-checking occurs in `expand_node`.
+        # Goal-checking occurs in `expand_node`, unless it is deferred to retrieval.
+        # In lazy mode each child is retrieved as soon as it is generated, so it is checked here.
+        if (self.goal_test == "retrieval" or (self.lazy and self.current_is_child)) and self.is_goal(self.current_state):
+            self.report_goal(self.current_state)
 
     def expand_node(self):
         """Generate child states and add them to the queue if they haven't been visited."""
+        if self.result is not None:
+            return  # The current state is a goal found on retrieval
         super().expand_node()
+        if self.lazy:
+            self.stack.append((self.current_state, iter(self.successors(self.current_state))))
+            self.advance()
+            return
         add_to_queue = []
-        for action in self.problem.get_actions(self.current_state):
-            new_state, _ = self.problem.get_result(self.current_state, action)
-            if self.problem.is_goal(new_state):  # Check if the child is the goal
-                self.result = new_state
-                return  # Stop expanding further if goal is found
-            if new_state not in self.visited:
-                self.visited.add(new_state)
-                add_to_queue.insert(0, new_state) # First state discovered, will be first state retrueved
-        self.queue.extend(add_to_queue)
+        # Encoded queues decode a new object per read, so they cannot feed the batch lookahead
+        upcoming = () if isinstance(self.queue, EncodedQueue) else reversed(self.queue)
+        tested = self.tested_successors(self.current_state, upcoming, self.visited)
+        if not self.add_children(self.current_state, tested, self.visited, add_to_queue.append):
+            self.queue.extend(reversed(add_to_queue))  # First state discovered, will be first state retrieved
+
+    def save_checkpoint(self, path):
+        if self.lazy and getattr(self, "stack", None):
+            raise NotImplementedError("DepthFirstSearch(lazy=True) keeps successor generators on its stack "
+                                      "and cannot be checkpointed.")
+        super().save_checkpoint(path)
+
+    def advance(self):
+        """Lazy mode: pull successors of the deepest state that has any left, backtracking over
+        exhausted ones, until an unvisited child is found to retrieve next."""
+        self.next_child = None
+        while self.stack:
+            parent, successors = self.stack[-1]
+            for action, new_state, cost in successors:
+                if new_state not in self.visited:
+                    self.visited.add(new_state)
+                    self.next_child = (parent, action, new_state, cost)
+                    return
+            self.stack.pop()
+
+    def fused_loop(self):
+        """Run `next_node` / `evaluate_node` / `expand_node` inlined, with the structures and
+        problem methods cached in local variables. Same order, result and counters.
+
+        Problems expanded through `expand_batch` already amortize the per-node overhead and
+        keep the template loop, as do subclasses that customize its steps and the goal test
+        policies other than "generation".
+        """
+        if self.overrides_template(DepthFirstSearch) or self.use_batch or self.goal_test != "generation" or self.lazy:
+            return False
+        queue, visited, parents = self.queue, self.visited, self.parents
+        is_goal, iter_successors = self.problem.is_goal, self.problem.iter_successors
+        pop, extend, add = queue.pop, queue.extend, visited.add
+        record_paths = self.record_paths
+        nodes = tests = 0
+        try:
+            while queue and self.result is None:
+                state = pop()
+                nodes += 1
+                path_cost = parents[state][2] if record_paths else 0.0
+                add_to_queue = []
+                for action, new_state, cost in iter_successors(state):
+                    if new_state in visited:
+                        continue
+                    tests += 1
+                    if is_goal(new_state):
+                        if record_paths and new_state not in parents:
+                            parents[new_state] = (state, action, path_cost + cost)
+                        if self.report_goal(new_state):
+                            return True
+                    if new_state not in visited:
+                        add(new_state)
+                        if record_paths and new_state not in parents:
+                            parents[new_state] = (state, action, path_cost + cost)
+                        add_to_queue.append(new_state)
+                extend(reversed(add_to_queue))
+        finally:
+            # Every retrieved node is also evaluated and expanded, as in the template loop
+            self.nodes_retrieved += nodes
+            self.nodes_evaluated += nodes
+            self.nodes_expanded += nodes
+            self.goal_tests += tests
+        return True
+
+    def frontier_size(self):
+        return len(self.stack) if self.lazy else len(self.queue)
+
+    def visited_size(self):
+        return len(self.visited)
 
     def retrieve_result(self):
         """Return the final state or result based on the search completion."""
@@ -0,0 +1,99 @@
+from .search_algorithm import SearchAlgorithm
+
+class DepthLimitedSearch(SearchAlgorithm):
+    """Depth-First Search that does not expand states deeper than `depth_limit` and only remembers
+    the current path.
+
+    Instead of a `visited` set holding every generated state, cycles are detected against the
+    states on the path from the initial state to the current one, so memory grows with the
+    search depth (the path plus the pending siblings of each state on it) rather than with the
+    size of the search space. Children are explored in the same order as `DepthFirstSearch`,
+    and, as there, goal-checked when generated, so goals up to `depth_limit` deep are found.
+    The solution path is read off the current path when the goal is found, so no parent
+    table is kept. `cutoff_occurred` is set as soon as a state at the limit is retrieved,
+    without asking the problem whether it has any children.
+    """
+
+    goal_test_policies = ("generation",)
+
+    def __init__(self, depth_limit):
+        super().__init__()
+        self.depth_limit = depth_limit
+
+    def initialize(self, problem):
+        """Set up search structures based on the specific problem instance."""
+        self.problem = problem
+        self.initial_state = self.problem.get_initial_state()
+        self.result = None
+        self.result_path = None
+        self.prepare_successors(self.problem)
+        self.start_iteration()
+        if self.is_goal(self.initial_state):  # Check if the initial state is the goal
+            if self.report_goal(self.initial_state, ([], 0.0)):  # Set the result directly if goal is found
+                self.result_path = ([], 0.0)
+
+    def start_iteration(self):
+        """Reset the frontier to the initial state for a new depth-limited pass."""
+        # frontier[d]: unexplored (state, action, path cost) entries at depth d, next one last
+        self.frontier = [[(self.initial_state, None, 0.0)]]
+        self.path = []  # (state, action, path cost) entries from the initial state down to the current one
+        self.on_path = set()
+        self.cutoff_occurred = False  # Whether a state at the limit was left unexpanded
+
+    def is_search_complete(self):
+        """Check if the frontier is exhausted or if a result has been found."""
+        return not self.frontier or self.result is not None
+
+    def next_node(self):
+        """Pop the next state from the deepest level and make it the tip of the current path."""
+        super().next_node()
+        self.current_depth = len(self.frontier) - 1
+        entry = self.frontier[self.current_depth].pop()
+        self.current_state, _, self.current_cost = entry
+        for state, _, _ in self.path[self.current_depth:]:  # Backtrack to the parent of the new state
+            self.on_path.discard(state)
+        del self.path[self.current_depth:]
+        self.path.append(entry)
+        self.on_path.add(self.current_state)
+
+    def evaluate_node(self):
+        """Evaluate if the current state meets the goal conditions (now only for non-goal states)."""
+        super().evaluate_node()
+        # This method can remain empty or be skipped, as goal-checking occurs in `expand_node`.
+
+    def expand_node(self):
+        """Generate the children of the current state unless it sits at the depth limit."""
+        if self.current_depth < self.depth_limit:
+            super().expand_node()
+            children = []
+            for action, new_state, cost in self.successors(self.current_state):
+                if self.is_goal(new_state):  # Check if the child is the goal
+                    path = ([a for _, a, _ in self.path[1:]] + [action], self.current_cost + cost)
+                    if self.report_goal(new_state, path):
+                        self.result_path = path
+                        return  # Stop expanding further if goal is found
+                if new_state not in self.on_path:
+                    children.append((new_state, action, self.current_cost + cost))
+            children.reverse()  # First state discovered, will be first state retrieved
+            self.frontier.append(children)
+        else:
+            # Conservative: the state might have no children, but finding out would cost a successor call
+            self.cutoff_occurred = True
+        while self.frontier and not self.frontier[-1]:  # Drop exhausted levels
+            self.frontier.pop()
+
+    def frontier_size(self):
+        return sum(len(level) for level in self.frontier)
+
+    def visited_size(self):
+        return len(self.on_path)
+
+    def retrieve_result(self):
+        """Return the final state or result based on the search completion."""
+        return self.result
+
+    def retrieve_path(self, state=None):
+        """Return `(actions, path_cost)` leading to the result, recorded when it was found."""
+        if state is not None and state != self.result:
+            return None
+        return self.result_path
@@ -0,0 +1,214 @@
+from .search_algorithm import SearchAlgorithm
+import os
+import shutil
+import tempfile
+import numpy as np
+
+class ExternalBreadthFirstSearch(SearchAlgorithm):
+    """Breadth-First Search whose frontier and visited set live on disk, for state spaces larger than RAM.
+
+    Requires a problem implementing the `encode` / `decode` hooks with fixed-width encodings;
+    states are stored as their raw encoding bytes (NumPy void records) in segment files under
+    `workdir` and are only decoded while being expanded. Duplicates are detected with
+    delayed duplicate detection: children of the current layer are buffered in RAM up to
+    `ram_budget` bytes, then sorted, deduplicated and spilled as a sorted run. When the
+    layer is exhausted, the runs are merged in vectorized chunks of `read_chunk` records per
+    run, states already visited are removed with binary searches in the memory-mapped visited
+    file, and the result is written as the next layer and appended to the visited file as
+    one more sorted run, so the visited file is never rewritten. Memory use is therefore
+    bounded by `ram_budget` plus `read_chunk` records per open run, and disk use by the
+    current layer, the next one and the visited file.
+
+    New states are goal-tested once they survived duplicate detection, in batches with
+    `are_goals`, so goals are found when the layer before them is closed and duplicates are
+    never tested. Each layer is expanded in sorted encoding order. No parent links are kept,
+    so `retrieve_path` is not available.
+    """
+
+    supports_streaming = False
+    goal_test = "batch"
+    goal_test_policies = ("batch",)
+
+    def __init__(self, workdir=None, ram_budget=64 * 2 ** 20, read_chunk=65536):
+        super().__init__()
+        self.workdir = workdir
+        self.ram_budget = ram_budget
+        self.read_chunk = read_chunk  # Records read from each run at a time while merging
+
+    def initialize(self, problem):
+        """Set up the on-disk layers based on the specific problem instance."""
+        if not (problem.implements("encode") and problem.implements("decode")):
+            raise ValueError("ExternalBreadthFirstSearch requires a problem implementing encode and decode.")
+        self.problem = problem
+        self.initial_state = self.problem.get_initial_state()
+        initial_encoding = np.ascontiguousarray(self.problem.encode(self.initial_state))
+        self.encoding_dtype = initial_encoding.dtype
+        self.encoding_length = len(initial_encoding)
+        self.record_dtype = np.dtype((np.void, initial_encoding.nbytes))
+        self.buffer_capacity = max(1, self.ram_budget // initial_encoding.nbytes)
+        # Children are buffered as rows of one preallocated array, so the budget is the actual footprint
+        self.buffer = np.empty((self.buffer_capacity, self.encoding_length), dtype=self.encoding_dtype)
+        self.buffer_size = 0
+        self.owns_workdir = self.workdir is None
+        self.directory = tempfile.mkdtemp(prefix="external-bfs-") if self.owns_workdir else self.workdir
+        os.makedirs(self.directory, exist_ok=True)
+        self.depth = 0
+        self.runs = []
+        self.layer_path = None  # Segment file of the current layer (the first layer is only in RAM)
+        self.result = None
+        self.prepare_successors(self.problem)
+
+        first_layer = initial_encoding.view(self.record_dtype)
+        self.visited_path = os.path.join(self.directory, "visited.bin")
+        first_layer.tofile(self.visited_path)
+        self.visited_runs = [(0, 1)]  # (start, end) records of each sorted run of the visited file
+        self.open_layer(first_layer)
+        if self.is_goal(self.initial_state):  # Check if the initial state is the goal
+            self.report_goal(self.initial_state)  # Set the result directly if goal is found
+
+    def segment_path(self, kind, index):
+        return os.path.join(self.directory, f"{kind}-{self.depth}-{index}.bin")
+
+    def open_layer(self, records):
+        self.layer = records
+        self.layer_position = 0
+
+    def is_search_complete(self):
+        """Check if the current layer was the last one or if a result has been found."""
+        return self.layer_position >= len(self.layer) or self.result is not None
+
+    def next_node(self):
+        """Read and decode the next state of the current layer."""
+        super().next_node()
+        record = self.layer[self.layer_position]
+        self.layer_position += 1
+        self.current_state = self.problem.decode(np.frombuffer(record.tobytes(), dtype=self.encoding_dtype))
+
+    def evaluate_node(self):
+        """Evaluate if the current state meets the goal conditions (now only for non-goal states)."""
+        super().evaluate_node()
+        # This method can remain empty or be skipped, as goal-checking occurs in `close_layer`.
+
+    def expand_node(self):
+        """Buffer the encodings of the children, spilling sorted runs, and close the layer once it is exhausted."""
+        super().expand_node()
+        for _, new_state, _ in self.successors(self.current_state):
+            self.buffer[self.buffer_size] = self.problem.encode(new_state)
+            self.buffer_size += 1
+            if self.buffer_size >= self.buffer_capacity:
+                self.spill_run()
+        if self.layer_position >= len(self.layer):
+            self.close_layer()
+
+    def spill_run(self):
+        """Sort and deduplicate the buffered children and write them as a sorted run."""
+        if not self.buffer_size:
+            return
+        run = np.unique(self.buffer[:self.buffer_size].view(self.record_dtype).ravel())
+        path = self.segment_path("run", len(self.runs))
+        run.tofile(path)
+        self.runs.append(path)
+        self.buffer_size = 0
+
+    def close_layer(self):
+        """Merge the runs into the next layer, dropping visited states and goal-testing the new
+        ones, and append the layer to the visited file."""
+        self.spill_run()
+        layer_path = self.segment_path("layer", 0)
+        runs = [self.load(path) for path in self.runs]
+        visited = self.load(self.visited_path)  # Maps the runs of the previous layers only
+        start = end = self.visited_runs[-1][1]
+        with open(layer_path, "wb") as layer_file, open(self.visited_path, "ab") as visited_file:
+            for chunk in merge_unique(runs, self.read_chunk):
+                chunk = self.drop_visited(visited, chunk)
+                chunk.tofile(layer_file)
+                chunk.tofile(visited_file)
+                end += len(chunk)
+                if self.test_goals(chunk):
+                    break
+        self.visited_runs.append((start, end))
+        del runs, visited  # Release the memory maps before deleting the files
+        for path in self.runs:
+            os.remove(path)
+        self.runs = []
+
+        self.depth += 1
+        self.layer = None  # Release the memory map of the consumed layer before deleting its file
+        if self.layer_path is not None:
+            os.remove(self.layer_path)
+        self.layer_path = layer_path
+        self.open_layer(self.load(layer_path))
+
+    def drop_visited(self, visited, chunk):
+        """Return the records of the sorted `chunk` that are in none of the sorted visited runs."""
+        new = np.ones(len(chunk), dtype=bool)
+        for start, end in self.visited_runs:
+            run = visited[start:end]
+            positions = np.searchsorted(run, chunk)
+            found = positions < len(run)
+            found[found] = run[positions[found]] == chunk[found]
+            new &= ~found
+        return chunk[new]
+
+    def test_goals(self, records):
+        """Goal-test the states of `records` together; report the first goal and return True if there is one."""
+        if not len(records):
+            return False
+        decode = self.problem.decode
+        encodings = records.view(self.encoding_dtype).reshape(len(records), self.encoding_length)
+        states = [decode(encoding) for encoding in encodings]
+        for state, is_goal in zip(states, self.are_goals(states)):
+            if is_goal:
+                return self.report_goal(state)
+        return False
+
+    def load(self, path):
+        """Memory-map a segment file (empty files cannot be mapped)."""
+        if os.path.getsize(path) == 0:
+            return np.empty(0, dtype=self.record_dtype)
+        return np.memmap(path, dtype=self.record_dtype, mode="r")
+
+    def frontier_size(self):
+        return len(self.layer) - self.layer_position
+
+    def visited_size(self):
+        return self.visited_runs[-1][1]
+
+    def finish(self):
+        """Remove the runs left by a search stopped mid-layer, and all segment files if the
+        working directory was created by the search."""
+        self.layer = np.empty(0, dtype=self.record_dtype)  # Release the memory map before deleting
+        for path in self.runs:
+            os.remove(path)
+        self.runs = []
+        if self.owns_workdir:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def retrieve_result(self):
+        """Return the final state or result based on the search completion."""
+        return self.result
+
+    def retrieve_path(self, state=None):
+        raise NotImplementedError("ExternalBreadthFirstSearch does not keep parent links.")
+
+
+def merge_unique(runs, chunk_size):
+    """Merge sorted record arrays (e.g. memory maps) into sorted chunks without duplicates.
+
+    Each step reads the next `chunk_size` records of every run and emits, with one `np.unique`,
+    all those up to the smallest last record read: every record up to that bound has then
+    been read from every run, so chunks never overlap. At least one run block is consumed per step.
+    """
+    positions = [0] * len(runs)
+    while True:
+        active = [i for i, run in enumerate(runs) if positions[i] < len(run)]
+        if not active:
+            return
+        blocks = {i: runs[i][positions[i]:positions[i] + chunk_size] for i in active}
+        bound = np.sort(np.concatenate([block[-1:] for block in blocks.values()]))[:1]
+        parts = []
+        for i, block in blocks.items():
+            count = int(np.searchsorted(block, bound, side="right")[0])
+            parts.append(block[:count])
+            positions[i] += count
+        yield np.unique(np.concatenate(parts))
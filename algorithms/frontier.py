@@ -0,0 +1,75 @@
+import numpy as np
+
+
+class EncodedQueue:
+    """Double-ended queue that stores states as their `encode` rows in a growable NumPy ring buffer.
+
+    It offers the `deque` methods used by the searches (`append`, `extend`, `pop`, `popleft`,
+    `len`, iteration), so it can replace the frontier `deque` of a problem implementing
+    `encode` / `decode`. States are encoded on insertion and only rebuilt with `decode` when
+    they leave the queue (or are iterated over), so a queued state costs its encoding width
+    instead of a Python object. The buffer doubles when full.
+    """
+
+    def __init__(self, encode, decode, initial_capacity=1024):
+        self.encode = encode
+        self.decode = decode
+        self.initial_capacity = max(1, initial_capacity)
+        self.buffer = None  # Allocated on the first append, once the encoding width and dtype are known
+        self.head = 0
+        self.size = 0
+
+    def append(self, state):
+        encoding = self.encode(state)
+        if self.buffer is None:
+            self.buffer = np.empty((self.initial_capacity, len(encoding)), dtype=encoding.dtype)
+        elif self.size == len(self.buffer):
+            self._grow()
+        self.buffer[(self.head + self.size) % len(self.buffer)] = encoding
+        self.size += 1
+
+    def extend(self, states):
+        for state in states:
+            self.append(state)
+
+    def popleft(self):
+        if not self.size:
+            raise IndexError("pop from an empty queue")
+        row = self.buffer[self.head].copy()  # Copied so the decoded state never aliases the buffer
+        self.head = (self.head + 1) % len(self.buffer)
+        self.size -= 1
+        return self.decode(row)
+
+    def pop(self):
+        if not self.size:
+            raise IndexError("pop from an empty queue")
+        self.size -= 1
+        return self.decode(self.buffer[(self.head + self.size) % len(self.buffer)].copy())
+
+    def clear(self):
+        self.head = 0
+        self.size = 0
+
+    def _grow(self):
+        buffer = np.empty((2 * len(self.buffer), self.buffer.shape[1]), dtype=self.buffer.dtype)
+        tail = len(self.buffer) - self.head
+        buffer[:tail] = self.buffer[self.head:]
+        buffer[tail:self.size] = self.buffer[:self.head]
+        self.buffer = buffer
+        self.head = 0
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        """Decode the queued states from first to last."""
+        for i in range(self.size):
+            yield self.decode(self.buffer[(self.head + i) % len(self.buffer)].copy())
+
+    def __reversed__(self):
+        for i in reversed(range(self.size)):
+            yield self.decode(self.buffer[(self.head + i) % len(self.buffer)].copy())
+
+    def memory_usage(self):
+        """Bytes used by the ring buffer."""
+        return 0 if self.buffer is None else self.buffer.nbytes
@@ -0,0 +1,11 @@
+from .best_first_search import BestFirstSearch
+
+class GreedyBestFirstSearch(BestFirstSearch):
+    """Greedy Best-First Search, expanding the state that `heuristic` estimates closest to a goal.
+    Fast when the heuristic is informative, but the returned goal is not guaranteed to be the cheapest."""
+
+    def __init__(self, heuristic):
+        super().__init__(heuristic)
+
+    def priority(self, state, path_cost):
+        return self.heuristic(state)
@@ -0,0 +1,146 @@
+import time
+
+PHASES = ("retrieve", "evaluate", "expand")  # Phases of the `SearchAlgorithm.search` loop
+PROBLEM_PHASES = ("get_actions", "get_result", "iter_successors", "is_goal", "is_goal_batch", "expand_batch",
+                  "get_predecessors")
+
+
+class SearchObserver:
+    """Base class for hooks attached to a search algorithm with `SearchAlgorithm.add_observer`.
+
+    Every callback is a no-op; subclasses override the ones they need. `on_phase` receives
+    the duration of each loop phase (`PHASES`) and of each call to the problem
+    (`PROBLEM_PHASES`; a lazy `iter_successors` is timed per step), which are nested inside the
+    loop phases.
+    """
+
+    def on_search_start(self, algorithm):
+        """Called before the algorithm is initialized for a new search."""
+        pass
+
+    def on_phase(self, algorithm, phase, seconds):
+        """Called after each timed phase or problem call."""
+        pass
+
+    def on_node(self, algorithm):
+        """Called after each retrieve/evaluate/expand iteration."""
+        pass
+
+    def on_search_end(self, algorithm):
+        """Called after the search finished."""
+        pass
+
+
+class TimedProblem:
+    """Proxy that reports the duration of the problem's successor and goal calls to observers.
+
+    Every other attribute, including the optional hooks, is delegated to the wrapped problem.
+    Calls made in other processes (e.g. `ParallelBreadthFirstSearch` workers) are not observed.
+    """
+
+    def __init__(self, problem, algorithm, observers):
+        self._problem = problem
+        self._algorithm = algorithm
+        self._observers = observers
+        for phase in PROBLEM_PHASES:
+            if phase != "iter_successors" and hasattr(problem, phase):  # Timed per step by `iter_successors`
+                setattr(self, phase, self._timed(phase, getattr(problem, phase)))
+
+    def _timed(self, phase, method):
+        algorithm, observers = self._algorithm, self._observers
+        clock = time.perf_counter
+
+        def timed(*args):
+            start = clock()
+            value = method(*args)
+            elapsed = clock() - start
+            for observer in observers:
+                observer.on_phase(algorithm, phase, elapsed)
+            return value
+        return timed
+
+    def iter_successors(self, state):
+        """Time a lazy `iter_successors` one child at a time (as phase "iter_successors");
+        without one, generate the children through the timed `get_actions` / `get_result`."""
+        if not self._problem.implements("iter_successors"):
+            for action in self.get_actions(state):
+                new_state, cost = self.get_result(state, action)
+                yield action, new_state, cost
+            return
+        successors = self._problem.iter_successors(state)
+        clock = time.perf_counter
+        while True:
+            start = clock()
+            successor = next(successors, None)
+            elapsed = clock() - start
+            for observer in self._observers:
+                observer.on_phase(self._algorithm, "iter_successors", elapsed)
+            if successor is None:
+                return
+            yield successor
+
+    def __getattr__(self, name):
+        if name.startswith("__") or name == "_problem":
+            raise AttributeError(name)
+        return getattr(self._problem, name)
+
+
+class PhaseProfiler(SearchObserver):
+    """Observer that accumulates the time spent per phase and samples the search over time.
+
+    Every `sample_every` nodes it records `(elapsed seconds, nodes retrieved, frontier size,
+    visited size, nodes per second since the previous sample)` in `samples`.
+    """
+
+    def __init__(self, sample_every=1000):
+        self.sample_every = sample_every
+        self.phase_seconds = {}
+        self.phase_calls = {}
+        self.samples = []
+
+    def on_search_start(self, algorithm):
+        self.phase_seconds = {}
+        self.phase_calls = {}
+        self.samples = []
+        self.nodes = 0
+        self.start = self.last_time = time.perf_counter()
+        self.last_nodes = 0
+
+    def on_phase(self, algorithm, phase, seconds):
+        self.phase_seconds[phase] = self.phase_seconds.get(phase, 0.0) + seconds
+        self.phase_calls[phase] = self.phase_calls.get(phase, 0) + 1
+
+    def on_node(self, algorithm):
+        self.nodes += 1
+        if self.nodes % self.sample_every == 0:
+            self.sample(algorithm)
+
+    def on_search_end(self, algorithm):
+        self.end = time.perf_counter()
+        self.sample(algorithm)
+
+    def sample(self, algorithm):
+        """Record one sample of the search progress."""
+        now = time.perf_counter()
+        rate = (self.nodes - self.last_nodes) / (now - self.last_time) if now > self.last_time else 0.0
+        self.samples.append((now - self.start, algorithm.get_nodes_retrieved(), algorithm.frontier_size(),
+                             algorithm.visited_size(), rate))
+        self.last_time, self.last_nodes = now, self.nodes
+
+    def problem_seconds(self):
+        """Total time spent inside the problem's methods."""
+        return sum(self.phase_seconds.get(phase, 0.0) for phase in PROBLEM_PHASES)
+
+    def report(self):
+        """Return a table of the time spent per phase, splitting problem calls from the algorithm's own work."""
+        loop_seconds = sum(self.phase_seconds.get(phase, 0.0) for phase in PHASES)
+        lines = [f"{'phase':<18} {'calls':>10} {'seconds':>10} {'share':>7}"]
+        for phase in PHASES + PROBLEM_PHASES:
+            if phase in self.phase_calls:
+                seconds = self.phase_seconds[phase]
+                share = seconds / loop_seconds if loop_seconds else 0.0
+                lines.append(f"{phase:<18} {self.phase_calls[phase]:>10} {seconds:>10.4f} {share:>7.1%}")
+        bookkeeping = loop_seconds - self.problem_seconds()
+        share = bookkeeping / loop_seconds if loop_seconds else 0.0
+        lines.append(f"{'algorithm (self)':<18} {'':>10} {bookkeeping:>10.4f} {share:>7.1%}")
+        return "\n".join(lines)
@@ -0,0 +1,33 @@
+from .depth_limited_search import DepthLimitedSearch
+
+class IterativeDeepeningSearch(DepthLimitedSearch):
+    """Iterative Deepening Search, repeating `DepthLimitedSearch` with depth limits 0, 1, 2, ...
+
+    A new pass starts whenever the previous one exhausts its frontier without a goal after
+    cutting off at least one state, so the search stops on finite spaces. `max_depth` caps the
+    largest limit tried. Node counters accumulate over all passes. While streaming, each pass
+    only reports the goals at its own depth limit, as shallower ones were reported before.
+    """
+
+    def __init__(self, max_depth=None):
+        super().__init__(depth_limit=0)
+        self.max_depth = max_depth
+
+    def initialize(self, problem):
+        """Set up search structures, starting from a depth limit of 0."""
+        self.depth_limit = 0
+        super().initialize(problem)
+
+    def report_goal(self, state, path=None):
+        """Skip goals shallower than the current limit while streaming, they were already reported."""
+        if self.streaming and path is not None and len(path[0]) < self.depth_limit:
+            return False
+        return super().report_goal(state, path)
+
+    def expand_node(self):
+        """Expand the current state, and start a deeper pass once the current one is exhausted."""
+        super().expand_node()
+        if not self.frontier and self.result is None and self.cutoff_occurred:
+            if self.max_depth is None or self.depth_limit < self.max_depth:
+                self.depth_limit += 1
+                self.start_iteration()
@@ -0,0 +1,286 @@
+from .search_algorithm import SearchAlgorithm
+from concurrent.futures import ProcessPoolExecutor
+import math
+import random
+import time
+import numpy as np
+
+
+def goal_reward(state, path_cost, is_goal):
+    """Default rollout reward: 1 for reaching a goal, 0 otherwise."""
+    return float(is_goal)
+
+
+def _run_root(algorithm, problem, seed):
+    """Worker entry point for root parallelization: run one independent tree and return its root statistics."""
+    algorithm.seed = seed
+    algorithm.root_workers = 1
+    algorithm.search(problem)
+    lo, hi = algorithm.child_range(0)
+    return {
+        "visits": algorithm.visits[lo:hi].copy(),
+        "value_sum": algorithm.value_sum[lo:hi].copy(),
+        "result": algorithm.result,
+        "result_path": algorithm.result_path,
+        "counters": (algorithm.nodes_retrieved, algorithm.nodes_evaluated, algorithm.nodes_expanded,
+                     algorithm.goal_tests),
+    }
+
+
+class MonteCarloTreeSearch(SearchAlgorithm):
+    """Monte Carlo Tree Search with UCT selection, for spaces too large to search exhaustively.
+
+    Each iteration of the template loop is one MCTS iteration:
+    - `next_node` (selection): descend from the root by UCT, `mean value + exploration *
+      sqrt(ln N(parent) / N(child))`, trying untried children first, down to a state not yet
+      expanded; an untried child is generated (`get_result`) only when it is first selected.
+    - `evaluate_node`: goal test of the selected state.
+    - `expand_node` (expansion, rollout, backpropagation): reserve child slots for its actions,
+      play random actions from it for up to `rollout_depth` steps, and add the rollout
+      `reward(state, path_cost, is_goal)` (by default 1 for a goal, else 0) to every node on
+      the selected path.
+
+    Node statistics live in a NumPy node pool indexed by node id (visit counts, value sums,
+    parent, first child, number of children, path cost, dead flag); the children of a node
+    occupy consecutive ids. Only the states and incoming actions are kept in Python lists.
+    Subtrees that are exhausted without a goal are marked dead and no longer selected.
+
+    The search stops after `iterations` iterations, after `time_limit` seconds, once the tree
+    is exhausted, or, with `stop_on_goal`, at the first goal; otherwise the cheapest goal found
+    is kept. `best_action` recommends the most visited root action. With `root_workers > 1`,
+    that many independent trees, seeded from the search's own random generator, are grown in
+    worker processes and their root statistics are summed; the workers run without observers
+    or `search` budgets, so those are rejected (use `iterations` and `time_limit` instead).
+    """
+
+    supports_streaming = False
+    record_paths = False  # Paths are read from the node pool
+    goal_test = "retrieval"  # The selected state is tested in `evaluate_node`
+    goal_test_policies = ("retrieval",)
+
+    def __init__(self, iterations=1000, time_limit=None, exploration=math.sqrt(2), rollout_depth=50,
+                 reward=None, stop_on_goal=True, seed=None, root_workers=1, capacity=1024):
+        super().__init__()
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.rollout_depth = rollout_depth
+        self.reward = reward if reward is not None else goal_reward
+        self.stop_on_goal = stop_on_goal
+        self.seed = seed
+        self.root_workers = root_workers
+        self.capacity = capacity
+
+    def search(self, problem, max_nodes=None, max_seconds=None, max_memory=None):
+        """Grow the tree on `problem`; with `root_workers > 1`, grow independent trees in parallel and merge their roots."""
+        if self.root_workers <= 1:
+            return super().search(problem, max_nodes, max_seconds, max_memory)
+        if self.observers or max_nodes is not None or max_seconds is not None or max_memory is not None:
+            raise ValueError("Root-parallel search does not support observers or search budgets; "
+                             "bound it with iterations and time_limit.")
+        self.initialize(problem)
+        self.allocate_children(0)
+        seeds = self.worker_seeds()
+        with ProcessPoolExecutor(self.root_workers) as executor:
+            roots = list(executor.map(_run_root, [self] * self.root_workers, [problem] * self.root_workers, seeds))
+        lo, hi = self.child_range(0)
+        for root in roots:
+            self.visits[lo:hi] += root["visits"]
+            self.value_sum[lo:hi] += root["value_sum"]
+            self.nodes_retrieved += root["counters"][0]
+            self.nodes_evaluated += root["counters"][1]
+            self.nodes_expanded += root["counters"][2]
+            self.goal_tests += root["counters"][3]
+            if root["result"] is not None:
+                self.found_goal(root["result"], *root["result_path"])
+        self.visits[0] = self.visits[lo:hi].sum()
+        self.value_sum[0] = self.value_sum[lo:hi].sum()
+        return self.retrieve_result() is not None
+
+    def initialize(self, problem):
+        """Set up the node pool with the initial state as root."""
+        self.problem = problem
+        self.initial_state = self.problem.get_initial_state()
+        self.random = random.Random(self.seed)
+        self.deadline = None if self.time_limit is None else time.perf_counter() + self.time_limit
+        self.start_iterations = self.nodes_retrieved
+        self.result = None
+        self.result_path = None
+        self.visits = np.zeros(self.capacity)
+        self.value_sum = np.zeros(self.capacity)
+        self.parent = np.full(self.capacity, -1, dtype=np.int64)
+        self.first_child = np.full(self.capacity, -1, dtype=np.int64)  # -1 until the node is expanded
+        self.num_children = np.zeros(self.capacity, dtype=np.int64)
+        self.path_cost = np.zeros(self.capacity)
+        self.dead = np.zeros(self.capacity, dtype=bool)  # Exhausted without a goal
+        self.states = [self.initial_state]  # None for children not generated yet
+        self.actions = [None]  # Action leading to each node
+        self.size = 1
+        if self.is_goal(self.initial_state):
+            self.found_goal(self.initial_state, [], 0.0)
+
+    def worker_seeds(self):
+        """Draw one seed per root worker from `random`, so they are reproducible with `seed` and
+        differ between searches without it."""
+        return [self.random.getrandbits(64) for _ in range(self.root_workers)]
+
+    def child_range(self, node):
+        """Return the `(first, end)` ids of the children of `node`."""
+        first = int(self.first_child[node])
+        return first, first + int(self.num_children[node])
+
+    def allocate_children(self, node):
+        """Reserve consecutive ids for the children of `node`, one per action, without generating them."""
+        actions = list(self.problem.get_actions(self.states[node]))
+        needed = self.size + len(actions)
+        if needed > len(self.visits):
+            self.grow(needed)
+        first = self.size
+        self.first_child[node] = first
+        self.num_children[node] = len(actions)
+        self.parent[first:needed] = node
+        self.states.extend([None] * len(actions))
+        self.actions.extend(actions)
+        self.size = needed
+        return len(actions)
+
+    def grow(self, needed):
+        capacity = max(needed, 2 * len(self.visits))
+        for name, fill in (("visits", 0), ("value_sum", 0), ("parent", -1), ("first_child", -1),
+                           ("num_children", 0), ("path_cost", 0), ("dead", False)):
+            array = getattr(self, name)
+            grown = np.full(capacity, fill, dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
+
+    def is_search_complete(self):
+        """Stop when the budget is spent, the tree is exhausted, or (with `stop_on_goal`) a goal was found."""
+        return ((self.stop_on_goal and self.result is not None)
+                or self.dead[0]
+                or (self.iterations is not None and self.nodes_retrieved - self.start_iterations >= self.iterations)
+                or (self.deadline is not None and time.perf_counter() >= self.deadline))
+
+    def next_node(self):
+        """Selection: descend by UCT to a state that is not expanded yet, generating it if it is new."""
+        super().next_node()
+        node = 0
+        selected = [0]
+        while self.first_child[node] >= 0 and self.num_children[node] > 0:
+            node = self.select_child(node)
+            selected.append(node)
+            if self.states[node] is None:
+                parent = int(self.parent[node])
+                self.states[node], cost = self.problem.get_result(self.states[parent], self.actions[node])
+                self.path_cost[node] = self.path_cost[parent] + cost
+                break
+        self.current_node = node
+        self.current_state = self.states[node]
+        self.selected = selected
+
+    def select_child(self, node):
+        """Return the child of `node` with the highest UCT score, or its first untried child."""
+        lo, hi = self.child_range(node)
+        visits = self.visits[lo:hi]
+        untried = np.flatnonzero((visits == 0) & ~self.dead[lo:hi])
+        if len(untried):
+            return lo + int(untried[0])
+        scores = (self.value_sum[lo:hi] / visits
+                  + self.exploration * np.sqrt(math.log(self.visits[node]) / visits))
+        scores[self.dead[lo:hi]] = -np.inf
+        return lo + int(np.argmax(scores))
+
+    def evaluate_node(self):
+        """Goal test of the selected state."""
+        super().evaluate_node()
+        self.current_is_goal = self.is_goal(self.current_state)
+        if self.current_is_goal:
+            self.found_goal(self.current_state, *self.tree_path(self.current_node))
+
+    def expand_node(self):
+        """Expansion, rollout from the selected state, and backpropagation of the reward."""
+        super().expand_node()
+        node = self.current_node
+        if self.current_is_goal:
+            reward = self.reward(self.current_state, float(self.path_cost[node]), True)
+        else:
+            if self.first_child[node] < 0 and self.allocate_children(node) == 0:
+                self.mark_dead(node)
+            reward = self.rollout(node)
+        self.visits[self.selected] += 1
+        self.value_sum[self.selected] += reward
+
+    def rollout(self, node):
+        """Play random actions from `node` and return the reward of the state reached."""
+        state, path_cost = self.current_state, float(self.path_cost[node])
+        actions = []
+        is_goal = False
+        for _ in range(self.rollout_depth):
+            choices = self.problem.get_actions(state)
+            if not choices:
+                break
+            action = self.random.choice(list(choices))
+            state, cost = self.problem.get_result(state, action)
+            path_cost += cost
+            actions.append(action)
+            if self.is_goal(state):
+                is_goal = True
+                tree_actions, _ = self.tree_path(node)
+                self.found_goal(state, tree_actions + actions, path_cost)
+                break
+        return self.reward(state, path_cost, is_goal)
+
+    def mark_dead(self, node):
+        """Mark `node` dead, then every ancestor whose children are now all dead."""
+        self.dead[node] = True
+        node = int(self.parent[node])
+        while node >= 0:
+            lo, hi = self.child_range(node)
+            if not self.dead[lo:hi].all():
+                break
+            self.dead[node] = True
+            node = int(self.parent[node])
+
+    def tree_path(self, node):
+        """Return `(actions, path_cost)` from the root to `node`."""
+        path_cost = float(self.path_cost[node])
+        actions = []
+        while node > 0:
+            actions.append(self.actions[node])
+            node = int(self.parent[node])
+        actions.reverse()
+        return actions, path_cost
+
+    def found_goal(self, state, actions, path_cost):
+        """Keep the goal if it is the first one or cheaper than the current result."""
+        if self.result is None or path_cost < self.result_path[1]:
+            self.result = state
+            self.result_path = (actions, path_cost)
+
+    def best_action(self):
+        """Return the most visited root action, or None before the root is expanded."""
+        statistics = self.root_statistics()
+        if not statistics:
+            return None
+        return max(statistics, key=lambda entry: entry[1])[0]
+
+    def root_statistics(self):
+        """Return `(action, visits, mean value)` for every root action."""
+        if self.first_child[0] < 0:
+            return []
+        lo, hi = self.child_range(0)
+        return [(self.actions[child], int(self.visits[child]),
+                 float(self.value_sum[child] / self.visits[child]) if self.visits[child] else 0.0)
+                for child in range(lo, hi)]
+
+    def visited_size(self):
+        return self.size
+
+    def retrieve_path(self, state=None):
+        """Return `(actions, path_cost)` of the result (the only goal whose path is kept), or None."""
+        if state is not None and state != self.result:
+            return None
+        return self.result_path
+
+    def retrieve_result(self):
+        """Return the goal found (the cheapest one without `stop_on_goal`), or None."""
+        return self.result
@@ -0,0 +1,102 @@
+from .breadth_first_search import BreadthFirstSearch
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+_worker_problem = None  # Problem instance of the current search, set once per worker process
+
+
+def _init_worker(problem):
+    global _worker_problem
+    _worker_problem = problem
+
+
+def _expand_chunk(states, stop_at_goal):
+    """Worker entry point: expand a chunk of states with the worker's copy of the problem."""
+    return expand_states(_worker_problem, states, stop_at_goal)
+
+
+def expand_states(problem, states, stop_at_goal=True):
+    """Return, for each state, its `(action, child, cost, is_goal)` tuples in `get_actions` order.
+
+    With `stop_at_goal`, children of a state stop at its first goal child, as the serial
+    search stops there too.
+    """
+    expanded = []
+    for state in states:
+        children = []
+        for action in problem.get_actions(state):
+            child, cost = problem.get_result(state, action)
+            is_goal = problem.is_goal(child)
+            children.append((action, child, cost, is_goal))
+            if is_goal and stop_at_goal:
+                break
+        expanded.append(children)
+    return expanded
+
+
+class ParallelBreadthFirstSearch(BreadthFirstSearch):
+    """Layer-synchronous Breadth-First Search that expands each frontier layer across a process pool.
+
+    Every iteration takes the whole frontier layer, splits it into chunks expanded by worker
+    processes, and merges the children back in layer order, deduplicating against `visited`.
+    The merge replays the serial `BreadthFirstSearch` order exactly, so the result and the
+    node counters match the serial search.
+
+    Workers operate on pickled copies of the problem, so side effects of `get_result` (e.g.
+    `MockProblem.discovered_transitions`) are not visible in the calling process. Layers
+    smaller than `min_parallel_layer` are expanded in-process to avoid the IPC overhead.
+    Each iteration handles a whole layer, so a `max_nodes` budget counts layers.
+    """
+
+    goal_test_policies = ("generation",)  # Workers goal-test children as they generate them
+    transient_attributes = {**BreadthFirstSearch.transient_attributes, "executor": lambda: None}
+
+    def __init__(self, max_workers=None, chunk_size=64, min_parallel_layer=256, visited=None):
+        super().__init__(visited)
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.min_parallel_layer = min_parallel_layer
+        self.executor = None
+
+    def next_node(self):
+        """Take the whole current frontier layer for expansion.
+        Node counters are updated per state while merging, as the serial search would."""
+        self.layer = list(self.queue)
+        self.queue.clear()
+
+    def evaluate_node(self):
+        """Goal-checking occurs in `expand_node`, as in the serial search."""
+        pass
+
+    def expand_node(self):
+        """Expand the layer (in parallel when it is large enough) and merge children in serial BFS order."""
+        if len(self.layer) < self.min_parallel_layer:
+            expanded = expand_states(self.problem, self.layer, not self.streaming)
+        else:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(self.max_workers, initializer=_init_worker,
+                                                    initargs=(self.problem,))
+            chunks = [self.layer[i:i + self.chunk_size] for i in range(0, len(self.layer), self.chunk_size)]
+            chunk_results = self.executor.map(_expand_chunk, chunks, repeat(not self.streaming))
+            expanded = [children for chunk in chunk_results for children in chunk]
+        for state, children in zip(self.layer, expanded):
+            self.nodes_retrieved += 1
+            self.nodes_evaluated += 1
+            self.nodes_expanded += 1
+            if self.add_children(state, self.unvisited(children), self.visited, self.queue.append):
+                return  # Stop merging, exactly where the serial search stops
+
+    def unvisited(self, children):
+        """Iterate over the worker-tested `children` not in `visited` when the merge reaches them,
+        counting their goal tests: the serial search skips visited children before testing them,
+        so the tests the workers ran on the others are not counted."""
+        for child in children:
+            if child[1] not in self.visited:
+                self.goal_tests += 1
+                yield child
+
+    def finish(self):
+        """Shut down the worker pool."""
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
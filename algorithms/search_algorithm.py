@@ -1,23 +1,369 @@
 from abc import ABC, abstractmethod
+from .instrumentation import TimedProblem
+from collections import deque
+from itertools import islice
+import numpy as np
+import os
+import pickle
+import sys
+import time
+
+
+def memory_usage():
+    """Return the resident set size of this process in bytes.
+    Falls back to the peak resident size where /proc is not available."""
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+# When searches goal-test states (see `SearchBookkeeping.goal_test`)
+GOAL_TEST_POLICIES = ("generation", "retrieval", "batch")
+
+# Methods of the search loop that a fused loop inlines
+TEMPLATE_STEPS = ("is_search_complete", "next_node", "evaluate_node", "expand_node", "report_goal", "successors",
+                  "tested_successors", "goal_tested", "is_goal", "add_children", "record_parent")
+
+
+class SearchBookkeeping:
+    """Counters, parent links, goal tests and frontier updates shared by `SearchAlgorithm` and
+    `AsyncSearchAlgorithm`, so that the synchronous and asynchronous versions of a search test
+    and record states in exactly the same way.
+
+    Subclasses set `problem` (through `start_search`) and implement `report_goal` and
+    `retrieve_result`.
+    """
+
+    # Whether parent links are recorded for `retrieve_path`; they hold a reference to every
+    # reached state, so memory-lean searches (e.g. with a compact visited store) turn them off
+    record_paths = True
+    # When searches built on `tested_successors` goal-test states: each new child as it is
+    # generated ("generation"), each state when it is taken from the frontier ("retrieval",
+    # which may expand more states but never tests one twice), or the new children of each
+    # expansion together, in one `is_goal_batch` call if the problem implements it ("batch")
+    goal_test = "generation"
+    # The `goal_test` policies the search honours; searches that always test states at one
+    # point of their loop narrow it to that policy
+    goal_test_policies = GOAL_TEST_POLICIES
 
-class SearchAlgorithm(ABC):
-    """Abstract base class for search algorithms with generalized success evaluation."""
-    
     def __init__(self):
         self.nodes_retrieved = 0
         self.nodes_expanded = 0
         self.nodes_evaluated = 0
+        self.goal_tests = 0
+
+    def check_goal_test(self):
+        """Raise ValueError unless `goal_test` is one of the `goal_test_policies` of this search."""
+        if self.goal_test not in self.goal_test_policies:
+            raise ValueError(f"{type(self).__name__} does not support the goal test policy {self.goal_test!r}, "
+                             f"expected one of {self.goal_test_policies}.")
+
+    def start_search(self, problem):
+        """Reset the problem, initial state, result and parent links."""
+        self.problem = problem
+        self.initial_state = self.problem.get_initial_state()
+        self.result = None
+        self.reset_parents(self.initial_state)
+
+    def test_initial_state(self):
+        """Report the initial state if it is a goal, unless states are tested on retrieval."""
+        if self.goal_test != "retrieval" and self.is_goal(self.initial_state):
+            self.report_goal(self.initial_state)
+
+    def test_current_state(self):
+        """Report the current state if it is a goal and states are tested on retrieval."""
+        if self.goal_test == "retrieval" and self.is_goal(self.current_state):
+            self.report_goal(self.current_state)
+
+    def goal_tested(self, children, visited):
+        """Iterate over `(action, child, cost, is_goal)` for the `(action, child, cost)` triples of
+        `children` whose child is not in `visited`, goal-tested according to `goal_test`.
+
+        Visited children are skipped before any goal test. With "retrieval" `is_goal` is always
+        False, as the search tests states when it retrieves them instead. With "batch" all
+        children are generated first and tested with a single `are_goals` call, so the caller
+        must still check `visited` for duplicates among them.
+        """
+        if self.goal_test == "generation":
+            return ((action, child, cost, self.is_goal(child)) for action, child, cost in children
+                    if child not in visited)
+        if self.goal_test == "retrieval":
+            return ((action, child, cost, False) for action, child, cost in children if child not in visited)
+        new = [(action, child, cost) for action, child, cost in children if child not in visited]
+        flags = self.are_goals([child for _, child, _ in new])
+        return [(action, child, cost, is_goal) for (action, child, cost), is_goal in zip(new, flags)]
+
+    def add_children(self, parent, tested, visited, append):
+        """Add the goal-tested children of `parent` (see `goal_tested`) to `visited`, record their
+        parent links and pass them to `append`, in order. Return True if a goal stopped the search."""
+        for action, new_state, cost, is_goal in tested:
+            if is_goal:  # Check if the child is the goal
+                if new_state in visited:
+                    continue  # Already reported while streaming, as a duplicate within a batch
+                self.record_parent(new_state, parent, action, cost)
+                if self.report_goal(new_state):
+                    return True  # Stop expanding further if goal is found
+            if new_state not in visited:
+                visited.add(new_state)
+                self.record_parent(new_state, parent, action, cost)
+                append(new_state)
+        return False
+
+    def is_goal(self, state):
+        """Goal-test `state` with the problem, counting the test."""
+        self.goal_tests += 1
+        return self.problem.is_goal(state)
+
+    def are_goals(self, states):
+        """Goal-test `states` at once, with the problem's `is_goal_batch` when it implements it."""
+        self.goal_tests += len(states)
+        if not states:
+            return []
+        if self.problem.implements("is_goal_batch"):
+            return [bool(flag) for flag in self.problem.is_goal_batch(states)]
+        return [self.problem.is_goal(state) for state in states]
+
+    def reset_parents(self, initial_state):
+        """Start a new parent table rooted at `initial_state`."""
+        self.parents = {initial_state: (None, None, 0.0)}  # state -> (parent, action, path cost)
+
+    def record_parent(self, state, parent, action, cost):
+        """Record that `state` was first reached from `parent` through `action` with step `cost`."""
+        if self.record_paths and state not in self.parents:
+            self.parents[state] = (parent, action, self.parents[parent][2] + cost)
+
+    def retrieve_path(self, state=None):
+        """Return `(actions, path_cost)` leading from the initial state to `state` (by default the
+        result), or None if there is no such state."""
+        state = self.retrieve_result() if state is None else state
+        if state is None or state not in self.parents:
+            return None
+        path_cost = self.parents[state][2]
+        actions = []
+        parent, action, _ = self.parents[state]
+        while parent is not None:
+            actions.append(action)
+            parent, action, _ = self.parents[parent]
+        actions.reverse()
+        return actions, path_cost
+
+    def get_nodes_retrieved(self):
+        return self.nodes_retrieved
+
+    def get_nodes_expanded(self):
+        return self.nodes_expanded
     
-    def search(self, problem):
-        """Template method for general search, handling both goal-based and reward-based searches."""
-        self.initialize(problem)  # Reset any search-specific state
-        while not self.is_search_complete():
-            self.next_node()  # Sets self.current_node
-            self.evaluate_node()  # Each subclass updates state or tracks the result as needed
-            self.expand_node()
+    def get_nodes_evaluated(self):
+        return self.nodes_evaluated
+
+    def get_goal_tests(self):
+        """Number of `is_goal` tests run by the search (a batch of k states counts k)."""
+        return self.goal_tests
+
+
+class SearchAlgorithm(SearchBookkeeping, ABC):
+    """Abstract base class for search algorithms with generalized success evaluation."""
+
+    # Number of queued states expanded together when the problem implements `expand_batch`: the
+    # state to expand and the ones not expanded yet among the next `batch_lookahead - 1` queued
+    batch_lookahead = 256
+    # Number of nodes between two memory measurements when a memory budget is set
+    memory_check_interval = 1000
+    # Attributes left out of checkpoints, with factories for their value after loading
+    transient_attributes = {"observers": list, "batch_cache": dict}
+    # Whether `search_iter` can keep searching after a goal
+    supports_streaming = True
+    # Whether `run` may use the algorithm's `fused_loop` instead of the template loop
+    use_fused_loop = True
+    
+    def __init__(self):
+        super().__init__()
+        self.observers = []
+        self.suspended = False
+        self.streaming = False
+    
+    def search(self, problem, max_nodes=None, max_seconds=None, max_memory=None):
+        """Template method for general search, handling both goal-based and reward-based searches.
+
+        The optional budgets bound this call to `max_nodes` retrieved nodes, `max_seconds` of
+        wall-clock time and `max_memory` bytes of process memory. When one runs out, the search
+        is suspended with its frontier intact: it returns False, `suspended` is set, and
+        `resume` continues it.
+        """
+        self.check_goal_test()
+        problem.reset()
+        for observer in self.observers:
+            observer.on_search_start(self)
+        # With observers, problem calls are timed through a `TimedProblem` proxy
+        self.initialize(TimedProblem(problem, self, self.observers) if self.observers else problem)
+        return self.run(max_nodes, max_seconds, max_memory)
+
+    def resume(self, max_nodes=None, max_seconds=None, max_memory=None):
+        """Continue a suspended search from where it stopped, with new budgets."""
+        if not self.suspended:
+            raise RuntimeError("There is no suspended search to resume.")
+        return self.run(max_nodes, max_seconds, max_memory)
+
+    def run(self, max_nodes=None, max_seconds=None, max_memory=None):
+        """Run the search loop until the search completes or a budget runs out."""
+        self.suspended = False
+        if self.observers or max_nodes is not None or max_seconds is not None or max_memory is not None:
+            self.managed_loop(max_nodes, max_seconds, max_memory)
+            if self.suspended:
+                return False
+        elif not (self.use_fused_loop and self.fused_loop()):
+            while not self.is_search_complete():
+                self.next_node()  # Sets self.current_node
+                self.evaluate_node()  # Each subclass updates state or tracks the result as needed
+                self.expand_node()
         self.finish()  # Final cleanup or logging after the search completes
+        for observer in self.observers:
+            observer.on_search_end(self)
         return self.retrieve_result() is not None
 
+    def managed_loop(self, max_nodes, max_seconds, max_memory):
+        """Search loop that checks the budgets before every node and reports the duration of
+        every phase to the observers."""
+        observers = self.observers
+        clock = time.perf_counter
+        deadline = None if max_seconds is None else clock() + max_seconds
+        nodes = 0
+        while not self.is_search_complete():
+            if ((max_nodes is not None and nodes >= max_nodes)
+                    or (deadline is not None and clock() >= deadline)
+                    or (max_memory is not None and nodes % self.memory_check_interval == 0
+                        and memory_usage() >= max_memory)):
+                self.suspended = True
+                return
+            nodes += 1
+            if not observers:
+                self.next_node()
+                self.evaluate_node()
+                self.expand_node()
+                continue
+            start = clock()
+            self.next_node()
+            retrieved = clock()
+            self.evaluate_node()
+            evaluated = clock()
+            self.expand_node()
+            expanded = clock()
+            for observer in observers:
+                observer.on_phase(self, "retrieve", retrieved - start)
+                observer.on_phase(self, "evaluate", evaluated - retrieved)
+                observer.on_phase(self, "expand", expanded - evaluated)
+                observer.on_node(self)
+
+    def fused_loop(self):
+        """Optionally run the whole search in one method, with the template steps inlined.
+
+        Algorithms override this with a loop that gives the same result, parent links and
+        counters as the `next_node` / `evaluate_node` / `expand_node` loop, without three method
+        calls per node. It is only used by `run` without observers or budgets, and should
+        return False, running nothing, when a subclass customizes the template steps.
+        """
+        return False
+
+    def overrides_template(self, base):
+        """Check if the type of this algorithm overrides a template step defined in `base`."""
+        cls = type(self)
+        return any(getattr(cls, name) is not getattr(base, name) for name in TEMPLATE_STEPS)
+
+    def search_iter(self, problem, limit=None, with_path=False):
+        """Generator version of `search` that yields every goal as soon as it is found.
+
+        Yields goal states, or `(goal, (actions, path_cost))` pairs with `with_path=True`, in
+        the order the algorithm finds them. Goals are not terminal: the search continues
+        through them, and each goal is reported once per visit (once overall for searches
+        with a visited set). The search only advances while the consumer asks for more
+        goals; reaching `limit` goals or closing the generator cancels it. Besides the
+        algorithm's own structures, only the goals found by the latest expansion are held.
+        """
+        if not self.supports_streaming:
+            raise NotImplementedError(f"{type(self).__name__} does not support streaming search.")
+        self.check_goal_test()
+        self.streaming = True
+        self.stream_paths = with_path
+        self.found_goals = deque()
+        yielded = 0
+        try:
+            problem.reset()
+            self.initialize(problem)
+            while True:
+                while self.found_goals:
+                    if limit is not None and yielded >= limit:
+                        return
+                    yield self.found_goals.popleft()
+                    yielded += 1
+                if (limit is not None and yielded >= limit) or self.is_search_complete():
+                    return
+                self.next_node()
+                self.evaluate_node()
+                self.expand_node()
+        finally:
+            self.streaming = False
+            self.finish()
+
+    def report_goal(self, state, path=None):
+        """Handle a goal found by the search and return True if the search should stop.
+
+        Normally the goal becomes the result and the search stops. While streaming with
+        `search_iter`, the goal (with `path`, by default `retrieve_path(state)`) is queued for
+        the consumer and the search goes on.
+        """
+        if not self.streaming:
+            self.result = state
+            return True
+        if self.stream_paths:
+            self.found_goals.append((state, path if path is not None else self.retrieve_path(state)))
+        else:
+            self.found_goals.append(state)
+        return False
+
+    def save_checkpoint(self, path):
+        """Write the algorithm, with its problem, frontier, visited states and counters, to `path`.
+
+        The problem and states must be picklable. The file is replaced atomically, so an
+        interrupted save keeps the previous checkpoint.
+        """
+        temporary_path = f"{path}.tmp"
+        try:
+            with open(temporary_path, "wb") as file:
+                pickle.dump(self, file, protocol=pickle.HIGHEST_PROTOCOL)
+        except BaseException:
+            os.remove(temporary_path)  # E.g. an unpicklable visited store
+            raise
+        os.replace(temporary_path, path)
+
+    @staticmethod
+    def load_checkpoint(path):
+        """Load an algorithm saved with `save_checkpoint`; call `resume` to continue a suspended search."""
+        with open(path, "rb") as file:
+            return pickle.load(file)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in self.transient_attributes:
+            state.pop(name, None)
+        if isinstance(state.get("problem"), TimedProblem):
+            state["problem"] = state["problem"]._problem
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        for name, factory in self.transient_attributes.items():
+            setattr(self, name, factory())
+
+    def add_observer(self, observer):
+        """Attach a `SearchObserver`; searches without observers run the bare loop."""
+        self.observers.append(observer)
+
+    def remove_observer(self, observer):
+        self.observers.remove(observer)
+
     @abstractmethod
     def retrieve_result(self):
         """Retrieve the final result node or state based on algorithm-specific criteria."""
@@ -49,18 +395,74 @@ class SearchAlgorithm(ABC):
         """Expand the current node by adding its neighbors."""
         self.nodes_expanded += 1
 
+    def prepare_successors(self, problem):
+        """Reset the successor generation used by `successors` for a new search on `problem`."""
+        self.use_batch = problem.implements("expand_batch")
+        self.batch_cache = {}  # id(state) -> (state, actions, child encodings, costs)
+
+    def successors(self, state, upcoming=()):
+        """Iterate over `(action, child, cost)` for `state` in `get_actions` order.
+
+        When the problem implements `expand_batch`, `state` is expanded together with the
+        states in `upcoming` (the next ones the algorithm will expand), and their children
+        are cached as encodings until each of them is expanded. Children are decoded lazily,
+        so stopping early (e.g. on a goal) skips the remaining ones. Otherwise they come from
+        the problem's `iter_successors`, which is lazy as well.
+        """
+        if not self.use_batch:
+            return self.problem.iter_successors(state)
+        entry = self.batch_cache.pop(id(state), None)
+        if entry is None or entry[0] is not state:
+            entry = self._expand_batch(state, upcoming)
+        _, actions, children, costs = entry
+        return self._iter_decoded(actions, children, costs)
+
+    def tested_successors(self, state, upcoming, visited):
+        """Iterate over `(action, child, cost, is_goal)` for the children of `state` that are not
+        in `visited`, goal-tested according to `goal_test` (see `goal_tested`)."""
+        return self.goal_tested(self.successors(state, upcoming), visited)
+
+    def _iter_decoded(self, actions, children, costs):
+        decode = self.problem.decode
+        # One `tolist` per parent is much cheaper than a NumPy scalar conversion per child
+        for action, child, cost in zip(actions.tolist(), children, costs.tolist()):
+            yield action, decode(child), cost
+
+    def _expand_batch(self, state, upcoming):
+        # Only a bounded window is scanned, so a frontier full of already cached states (as in
+        # depth-first order, below the newest children) is not walked on every cache miss
+        batch = [state]
+        for other in islice(upcoming, self.batch_lookahead - 1):
+            if id(other) not in self.batch_cache:
+                batch.append(other)
+        parents, actions, children, costs = self.problem.expand_batch(batch)
+        bounds = np.searchsorted(parents, np.arange(len(batch) + 1))
+        for i in range(1, len(batch)):
+            start, end = bounds[i], bounds[i + 1]
+            self.batch_cache[id(batch[i])] = (batch[i], actions[start:end], children[start:end], costs[start:end])
+        return state, actions[:bounds[1]], children[:bounds[1]], costs[:bounds[1]]
+
     def finish(self):
         """Optional cleanup after search completes. Subclasses can override if needed."""
         pass
     
-    def get_nodes_retrieved(self):
-        return self.nodes_retrieved
+    def get_visited_memory(self):
+        """Bytes used by the visited store, or None if the algorithm has none.
+        For a plain set only the container is counted, not the states it references."""
+        visited = getattr(self, "visited", None)
+        if visited is None:
+            return None
+        if hasattr(visited, "memory_usage"):
+            return visited.memory_usage()
+        return sys.getsizeof(visited)
 
-    def get_nodes_expanded(self):
-        return self.nodes_expanded
-    
-    def get_nodes_evaluated(self):
-        return self.nodes_evaluated
+    def frontier_size(self):
+        """Number of states waiting to be retrieved, or None if the algorithm does not track it."""
+        return None
+
+    def visited_size(self):
+        """Number of states remembered for duplicate detection, or None if the algorithm does not track it."""
+        return None
 
     
     
@@ -0,0 +1,10 @@
+from .best_first_search import BestFirstSearch
+
+class UniformCostSearch(BestFirstSearch):
+    """Uniform-Cost Search, expanding states in order of path cost and returning a cheapest goal."""
+
+    def __init__(self):
+        super().__init__()
+
+    def priority(self, state, path_cost):
+        return path_cost
@@ -0,0 +1,214 @@
+from abc import ABC, abstractmethod
+import hashlib
+import math
+import sys
+import numpy as np
+
+_MASK64 = (1 << 64) - 1
+
+
+def mix64(value):
+    """Scramble a Python hash into a well-distributed 64-bit integer (splitmix64 finalizer).
+    Needed because e.g. `hash(n) == n` for small integers."""
+    value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & _MASK64
+    value = (value ^ (value >> 27)) * 0x94D049BB133111EB & _MASK64
+    return value ^ (value >> 31)
+
+
+class VisitedStore(ABC):
+    """Interface of the set of states a search has already seen.
+
+    Search algorithms only use `in` and `add`, so any backend can replace the default `set`
+    through the algorithm's `visited` factory argument. Parent links also reference every
+    reached state, so set `record_paths = False` on the algorithm to get the memory savings
+    of the compact backends.
+    """
+
+    @abstractmethod
+    def add(self, state):
+        """Remember `state`."""
+        pass
+
+    @abstractmethod
+    def __contains__(self, state):
+        pass
+
+    @abstractmethod
+    def __len__(self):
+        """Number of states added (an estimate for approximate backends)."""
+        pass
+
+    @abstractmethod
+    def memory_usage(self):
+        """Bytes used by the store."""
+        pass
+
+
+class ExactVisitedSet(VisitedStore):
+    """Exact store backed by a Python set of the state objects; reports its memory use."""
+
+    def __init__(self):
+        self.states = set()
+
+    def add(self, state):
+        self.states.add(state)
+
+    def __contains__(self, state):
+        return state in self.states
+
+    def __len__(self):
+        return len(self.states)
+
+    def memory_usage(self):
+        """Size of the set plus the shallow size of every stored state (computed on demand)."""
+        return sys.getsizeof(self.states) + sum(sys.getsizeof(state) for state in self.states)
+
+
+class HashedVisitedSet(VisitedStore):
+    """Compact store keeping only a 64-bit hash per state in a NumPy open-addressing table.
+
+    Uses linear probing and doubles the table above `max_load`. It costs 8 / max_load bytes
+    per state regardless of the state size, and is exact up to 64-bit hash collisions
+    (about n^2 / 2^65 expected false duplicates for n states).
+
+    Keys come from the builtin `hash`, which Python salts per process for strings, bytes and
+    the states built from them, so the store does not survive a process restart and refuses
+    to be pickled (e.g. into a checkpoint); `EncodedVisitedSet` does.
+    """
+
+    def __init__(self, initial_capacity=1024, max_load=0.5):
+        self.max_load = max_load
+        self.table = np.zeros(1 << max(3, (initial_capacity - 1).bit_length()), dtype=np.uint64)
+        self.count = 0
+
+    @staticmethod
+    def key(state):
+        return mix64(hash(state) & _MASK64) or 1  # 0 marks an empty slot
+
+    def _slot(self, table, key):
+        """Return the index of `key` in `table`, or of the empty slot where it belongs."""
+        mask = len(table) - 1
+        index = key & mask
+        while True:
+            stored = int(table[index])
+            if stored == key or stored == 0:
+                return index
+            index = (index + 1) & mask
+
+    def add(self, state):
+        key = self.key(state)
+        index = self._slot(self.table, key)
+        if self.table[index] == 0:
+            self.table[index] = key
+            self.count += 1
+            if self.count > self.max_load * len(self.table):
+                self._grow()
+
+    def _grow(self):
+        table = np.zeros(2 * len(self.table), dtype=np.uint64)
+        for key in self.table[self.table != 0].tolist():
+            table[self._slot(table, key)] = key
+        self.table = table
+
+    def __contains__(self, state):
+        key = self.key(state)
+        return int(self.table[self._slot(self.table, key)]) == key
+
+    def __len__(self):
+        return self.count
+
+    def memory_usage(self):
+        return self.table.nbytes
+
+    def __reduce__(self):
+        raise TypeError(f"{type(self).__name__} keys on the per-process builtin hash and cannot be pickled.")
+
+
+class BloomVisitedFilter(VisitedStore):
+    """Approximate store backed by a Bloom filter sized for `capacity` states at `error_rate`.
+
+    A state never added is reported as visited with probability about `error_rate` (while no
+    more than `capacity` states were added), so the search may skip a few states; added states
+    are always found. Uses -capacity * ln(error_rate) / ln(2)^2 bits and never grows.
+
+    Like `HashedVisitedSet`, it hashes states with the salted builtin `hash`, so it cannot be pickled.
+    """
+
+    def __init__(self, capacity=1_000_000, error_rate=0.01):
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = np.zeros((self.num_bits + 7) // 8, dtype=np.uint8)
+        self.count = 0
+
+    def _positions(self, state):
+        key = mix64(hash(state) & _MASK64)
+        first, step = key & 0xFFFFFFFF, (key >> 32) | 1  # Double hashing
+        return [(first + i * step) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, state):
+        new = False
+        for position in self._positions(state):
+            byte, bit = position >> 3, 1 << (position & 7)
+            if not self.bits[byte] & bit:
+                self.bits[byte] |= bit
+                new = True
+        self.count += new
+
+    def __contains__(self, state):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(state))
+
+    def __len__(self):
+        return self.count
+
+    def memory_usage(self):
+        return self.bits.nbytes
+
+    def __reduce__(self):
+        raise TypeError(f"{type(self).__name__} keys on the per-process builtin hash and cannot be pickled.")
+
+
+class BitmapVisitedSet(VisitedStore):
+    """Exact store for states that are non-negative integer ids (e.g. `GraphProblem` states),
+    using one bit per id. The bitmap grows (doubling) to fit the largest id added."""
+
+    def __init__(self, capacity=1024):
+        self.bits = bytearray((capacity + 7) // 8)
+        self.count = 0
+
+    def add(self, state):
+        byte, bit = state >> 3, 1 << (state & 7)
+        if byte >= len(self.bits):
+            self.bits.extend(bytes(max(byte + 1, 2 * len(self.bits)) - len(self.bits)))
+        if not self.bits[byte] & bit:
+            self.bits[byte] |= bit
+            self.count += 1
+
+    def __contains__(self, state):
+        byte = state >> 3
+        return byte < len(self.bits) and bool(self.bits[byte] & (1 << (state & 7)))
+
+    def __len__(self):
+        return self.count
+
+    def memory_usage(self):
+        return len(self.bits)
+
+
+class EncodedVisitedSet(HashedVisitedSet):
+    """`HashedVisitedSet` keyed by the problem's `encode` array instead of the state's `__hash__`.
+
+    Only the 64-bit hash of each encoding is stored, so states never need to be hashable
+    Python objects, and equal encodings are the same state whatever object they come from.
+    The hash is a BLAKE2b digest of the encoding rather than the builtin `hash` of its bytes,
+    which Python salts per process, so the keys stay valid in checkpoints loaded elsewhere.
+    """
+
+    def __init__(self, encode, initial_capacity=1024, max_load=0.5):
+        super().__init__(initial_capacity, max_load)
+        self.encode = encode
+
+    __reduce__ = object.__reduce__  # Deterministic keys, so pickling is safe again
+
+    def key(self, state):
+        digest = hashlib.blake2b(self.encode(state).tobytes(), digest_size=8).digest()
+        return int.from_bytes(digest, "little") or 1  # 0 marks an empty slot
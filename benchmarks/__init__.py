@@ -0,0 +1,5 @@
+"""Runnable benchmarks for the search algorithms and problems.
+
+`python -m benchmarks` runs the regression suite (see `benchmarks.suite`); the other modules
+are focused benchmarks run with `python -m benchmarks.<module>`.
+"""
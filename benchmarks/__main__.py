@@ -0,0 +1,73 @@
+"""Run the search benchmark suite and compare it against a stored baseline.
+
+Usage:
+    python -m benchmarks [--algorithms bfs dfs ...] [--queens 6 7 8] [--graphs 3x6 5x4]
+                         [--output results.json] [--baseline baseline.json] [--tolerance 0.2]
+
+Exits with status 1 when a case regresses against the baseline.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+
+from .suite import ALGORITHMS, compare, make_cases, run_suite
+
+
+def parse_shape(text):
+    branching, depth = text.lower().split("x")
+    return int(branching), int(depth)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--algorithms", nargs="+", choices=sorted(ALGORITHMS), default=["bfs", "dfs"])
+    parser.add_argument("--queens", type=int, nargs="*", default=[6, 7, 8, 9], help="N-queens board sizes")
+    parser.add_argument("--graphs", type=parse_shape, nargs="*", default=[(3, 7), (6, 5)],
+                        help="synthetic graphs as BRANCHINGxDEPTH")
+    parser.add_argument("--cross-edges", type=float, default=0.1,
+                        help="probability of an extra random transition per graph state")
+    parser.add_argument("--numpy-states", action="store_true", help="use numpy-backed N-queens states")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, the fastest one is kept")
+    parser.add_argument("--no-isolate", action="store_true", help="run all cases in this process")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against the results in this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative slowdown")
+    args = parser.parse_args(argv)
+
+    cases = make_cases(args.algorithms, args.queens, args.graphs, compact=not args.numpy_states,
+                       cross_edges=args.cross_edges)
+    results = run_suite(cases, repeat=args.repeat, isolate=not args.no_isolate)
+
+    print(f"{'case':<28} {'expanded':>10} {'seconds':>9} {'nodes/s':>10} {'traced MiB':>10} {'RSS MiB':>8}")
+    for result in results:
+        print(f"{result['case']:<28} {result['nodes_expanded']:>10} {result['seconds']:>9.4f} "
+              f"{result['nodes_per_second']:>10.0f} {result['tracemalloc_peak_bytes'] / 2 ** 20:>10.2f} "
+              f"{result['peak_rss_bytes'] / 2 ** 20:>8.1f}")
+
+    if args.output:
+        report = {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results,
+        }
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print(f"No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""Compare the fused search loop of BFS/DFS with the template-method loop on `MockProblem` graphs.
+
+Usage:
+    python -m benchmarks.fused_loop [--shapes 4x8 10x5 ...] [--cross-edges 0.1] [--repeat 3]
+
+Each search explores the whole graph (the goal is unreachable) once with
+`use_fused_loop = False` and once with the default fused loop, and reports nodes per second
+for both and the speedup. The counters of both runs are checked to be identical.
+"""
+import argparse
+import time
+
+from algorithms import BreadthFirstSearch, DepthFirstSearch
+from .graphs import make_graph_problem
+
+ALGORITHMS = {"bfs": BreadthFirstSearch, "dfs": DepthFirstSearch}
+
+
+def run_case(algorithm_class, problem, fused, repeat=3):
+    """Return the best wall time over `repeat` searches and the nodes expanded."""
+    best = float("inf")
+    for _ in range(repeat):
+        algorithm = algorithm_class()
+        algorithm.use_fused_loop = fused
+        start = time.perf_counter()
+        algorithm.search(problem)
+        best = min(best, time.perf_counter() - start)
+    return best, algorithm.get_nodes_expanded()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--shapes", nargs="+", default=["4x8", "10x5", "2x16"],
+                        help="graphs as BRANCHINGxDEPTH")
+    parser.add_argument("--cross-edges", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(f"{'algorithm':>9} {'graph':>6} {'nodes':>9} {'template n/s':>13} {'fused n/s':>11} {'speedup':>8}")
+    for shape in args.shapes:
+        branching, depth = (int(part) for part in shape.split("x"))
+        problem = make_graph_problem(branching, depth, cross_edges=args.cross_edges, reachable_goal=False)
+        for name, algorithm_class in ALGORITHMS.items():
+            template_seconds, template_nodes = run_case(algorithm_class, problem, False, args.repeat)
+            fused_seconds, fused_nodes = run_case(algorithm_class, problem, True, args.repeat)
+            assert fused_nodes == template_nodes, "The fused loop must expand the same nodes"
+            print(f"{name:>9} {shape:>6} {fused_nodes:>9} {template_nodes / template_seconds:>13.0f} "
+                  f"{fused_nodes / fused_seconds:>11.0f} {template_seconds / fused_seconds:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""Synthetic `MockProblem` graphs for benchmarking."""
+import random
+
+from problems.mock_problem import MockProblem
+
+
+def make_graph_problem(branching, depth, cross_edges=0.0, seed=0, reachable_goal=True):
+    """Build a `MockProblem` over a complete `branching`-ary tree of the given `depth`.
+
+    States are numbered breadth-first from 1. Every state gets, with probability `cross_edges`,
+    one extra transition to a random state, turning the tree into a graph with duplicates
+    and cycles. Transition costs are random integers in [1, 10]. The goal is the last state
+    of the deepest layer, so blind searches explore almost the whole graph; with
+    `reachable_goal=False` the goal id does not exist and the whole graph is explored.
+    """
+    rng = random.Random(seed)
+    num_states = sum(branching ** level for level in range(depth + 1))
+    num_inner = num_states - branching ** depth
+    transitions = {}
+    for state in range(1, num_inner + 1):
+        first_child = (state - 1) * branching + 2
+        transitions[state] = [(child, rng.randint(1, 10)) for child in range(first_child, first_child + branching)]
+    for state in range(1, num_states + 1):
+        if rng.random() < cross_edges:
+            transitions.setdefault(state, []).append((rng.randint(1, num_states), rng.randint(1, 10)))
+    goal = num_states if reachable_goal else num_states + 1
+    return MockProblem(transitions, initial_state_id=1, goal_state_id=goal)
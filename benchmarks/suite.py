@@ -0,0 +1,118 @@
+"""Benchmark cases, measurement and baseline comparison for the search algorithms."""
+import resource
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+from algorithms import (BreadthFirstSearch, DepthFirstSearch, IterativeDeepeningSearch, UniformCostSearch,
+                        BidirectionalSearch, ParallelBreadthFirstSearch)
+from problems.eight_queens_problem import EightQueensProblem
+from .graphs import make_graph_problem
+
+ALGORITHMS = {
+    "bfs": BreadthFirstSearch,
+    "dfs": DepthFirstSearch,
+    "ids": IterativeDeepeningSearch,
+    "ucs": UniformCostSearch,
+    "bidirectional": BidirectionalSearch,
+    "parallel-bfs": ParallelBreadthFirstSearch,
+}
+
+
+def make_cases(algorithms, queens_sizes, graph_shapes, compact=True, cross_edges=0.1):
+    """Return the case specs for every algorithm over every problem.
+
+    A case spec is a plain dict, so it can be sent to an isolated worker process.
+    `graph_shapes` holds `(branching, depth)` pairs for `make_graph_problem`.
+    """
+    problems = [{"kind": "queens", "n": n, "compact": compact} for n in queens_sizes]
+    problems += [{"kind": "graph", "branching": b, "depth": d, "cross_edges": cross_edges} for b, d in graph_shapes]
+    return [dict(problem, algorithm=name) for name in algorithms for problem in problems]
+
+
+def case_name(case):
+    if case["kind"] == "queens":
+        return f"{case['algorithm']}/queens-{case['n']}"
+    return f"{case['algorithm']}/graph-{case['branching']}x{case['depth']}"
+
+
+def build_problem(case):
+    if case["kind"] == "queens":
+        return EightQueensProblem(case["n"], compact=case["compact"])
+    return make_graph_problem(case["branching"], case["depth"], cross_edges=case["cross_edges"])
+
+
+def run_case(case, repeat=1):
+    """Run one case `repeat` times and return its counters and best wall time, plus the peak
+    traced allocation of one extra traced run and the process peak RSS."""
+    algorithm_class = ALGORITHMS[case["algorithm"]]
+    problem = build_problem(case)
+    if algorithm_class is BidirectionalSearch and not problem.implements("get_predecessors"):
+        return None  # Not applicable to this problem
+
+    best = float("inf")
+    for _ in range(repeat):
+        problem = build_problem(case)
+        algorithm = algorithm_class()
+        start = time.perf_counter()
+        success = algorithm.search(problem)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    algorithm_class().search(build_problem(case))
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "case": case_name(case),
+        "success": success,
+        "nodes_retrieved": algorithm.get_nodes_retrieved(),
+        "nodes_expanded": algorithm.get_nodes_expanded(),
+        "nodes_evaluated": algorithm.get_nodes_evaluated(),
+        "seconds": best,
+        "nodes_per_second": algorithm.get_nodes_expanded() / best if best > 0 else 0.0,
+        "tracemalloc_peak_bytes": traced_peak,
+        "peak_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,  # Linux reports KiB
+    }
+
+
+def run_suite(cases, repeat=1, isolate=True):
+    """Run all cases, each in a fresh process when `isolate` is set so peak RSS is per case."""
+    results = []
+    for case in cases:
+        if isolate:
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+                result = executor.submit(run_case, case, repeat).result()
+        else:
+            result = run_case(case, repeat)
+        if result is not None:
+            results.append(result)
+    return results
+
+
+def compare(results, baseline, tolerance=0.2, min_seconds=0.005):
+    """Return a description of every regression of `results` against `baseline` results.
+
+    A case regresses when its wall time or traced peak grows by more than `tolerance`
+    (a fraction), or when its node counters change, which means the search itself changed.
+    Wall times below `min_seconds` in both runs are too noisy to compare and are ignored.
+    Baseline cases missing from `results` (renamed, crashed or skipped) are regressions too.
+    """
+    previous = {result["case"]: result for result in baseline}
+    current = {result["case"] for result in results}
+    regressions = [f"{case}: missing from the results" for case in previous if case not in current]
+    for result in results:
+        old = previous.get(result["case"])
+        if old is None:
+            continue
+        for key in ("seconds", "tracemalloc_peak_bytes"):
+            if key == "seconds" and max(old[key], result[key]) < min_seconds:
+                continue
+            if old[key] > 0 and result[key] > old[key] * (1 + tolerance):
+                regressions.append(f"{result['case']}: {key} {old[key]:.4g} -> {result[key]:.4g} "
+                                   f"(+{result[key] / old[key] - 1:.0%})")
+        for key in ("nodes_retrieved", "nodes_expanded"):
+            if result[key] != old[key]:
+                regressions.append(f"{result['case']}: {key} changed {old[key]} -> {result[key]}")
+    return regressions
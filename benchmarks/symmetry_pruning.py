@@ -0,0 +1,65 @@
+"""Measure how value-based and symmetry-reduced state keys prune the N-queens search.
+
+Usage:
+    python -m benchmarks.symmetry_pruning [--algorithm bfs|dfs] [--sizes 8 9 ...] [--numpy-states]
+
+For every board size the search runs twice, once with plain queen-position keys and once
+with `symmetry_reduced=True`, and reports nodes expanded, visited-set size, wall time and
+the tracemalloc peak. Breadth-first search on n >= 13 takes minutes and several GB.
+"""
+import argparse
+import time
+import tracemalloc
+
+from algorithms import BreadthFirstSearch, DepthFirstSearch
+from problems.eight_queens_problem import EightQueensProblem
+
+ALGORITHMS = {"bfs": BreadthFirstSearch, "dfs": DepthFirstSearch}
+
+
+def run_case(algorithm_class, board_dimension, symmetry_reduced, compact=True):
+    """Run one search and return its counters, wall time and peak traced memory."""
+    problem = EightQueensProblem(board_dimension, compact=compact, symmetry_reduced=symmetry_reduced)
+    algorithm = algorithm_class()
+    tracemalloc.start()
+    start = time.perf_counter()
+    success = algorithm.search(problem)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "n": board_dimension,
+        "symmetry_reduced": symmetry_reduced,
+        "success": success,
+        "nodes_expanded": algorithm.get_nodes_expanded(),
+        "visited": len(algorithm.visited),
+        "seconds": elapsed,
+        "peak_bytes": peak,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--algorithm", choices=sorted(ALGORITHMS), default="bfs")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(range(8, 15)))
+    parser.add_argument("--numpy-states", action="store_true",
+                        help="use the numpy-backed State instead of CompactState")
+    args = parser.parse_args(argv)
+
+    print(f"{'n':>3} {'key':>9} {'expanded':>10} {'visited':>10} {'seconds':>9} {'peak MiB':>9}")
+    for board_dimension in args.sizes:
+        rows = [run_case(ALGORITHMS[args.algorithm], board_dimension, symmetry_reduced,
+                         compact=not args.numpy_states)
+                for symmetry_reduced in (False, True)]
+        for row in rows:
+            key = "symmetry" if row["symmetry_reduced"] else "value"
+            print(f"{row['n']:>3} {key:>9} {row['nodes_expanded']:>10} {row['visited']:>10} "
+                  f"{row['seconds']:>9.2f} {row['peak_bytes'] / 2 ** 20:>9.1f}")
+        plain, reduced = rows
+        print(f"{'':>3} {'saving':>9} {1 - reduced['nodes_expanded'] / max(plain['nodes_expanded'], 1):>10.0%} "
+              f"{1 - reduced['visited'] / max(plain['visited'], 1):>10.0%} {'':>9} "
+              f"{1 - reduced['peak_bytes'] / max(plain['peak_bytes'], 1):>9.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from typing import Any, List, Sequence, Tuple
+
+
+class AsyncProblem(ABC):
+    """Defines a search problem whose successor function is a coroutine, for problems where
+    generating successors waits on I/O (e.g. a request to a model server).
+
+    It mirrors `Problem`, except that `get_actions` and `get_result` are `async`, so the
+    asynchronous searches in `algorithms.async_search` can overlap the calls of several
+    states. `is_goal`, the optional `is_goal_batch` and `get_initial_state` stay synchronous.
+    """
+
+    class State:
+        """Represents a state within the problem. This is a placeholder for problem-specific state implementations."""
+        pass
+
+    @abstractmethod
+    def is_goal(self, state: State) -> bool:
+        """Check if a given state meets the goal criteria."""
+        pass
+
+    @abstractmethod
+    async def get_actions(self, state: State) -> List[Any]:
+        """Return possible actions from a given state."""
+        pass
+
+    @abstractmethod
+    async def get_result(self, state: State, action: Any) -> Tuple[State, float]:
+        """Return the resulting state and cost from taking an action at the given state."""
+        pass
+
+    @abstractmethod
+    def get_initial_state(self) -> State:
+        """Return the initial state of the problem instance."""
+        pass
+
+    def implements(self, method_name: str) -> bool:
+        """Check if this problem overrides the optional hook `method_name`."""
+        return getattr(type(self), method_name) is not getattr(AsyncProblem, method_name)
+
+    def is_goal_batch(self, states: List[State]) -> Sequence[bool]:
+        """Optional hook: return `is_goal(state)` for each of `states`, as `Problem.is_goal_batch`."""
+        raise NotImplementedError
@@ -0,0 +1,141 @@
+import sys
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+from .problem import Problem
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "currsize", "maxsize", "nbytes", "max_bytes"])
+
+
+class CachedProblem(Problem):
+    """Wraps a problem and memoizes its `get_actions` and `get_result` calls per state.
+
+    Each cached state keeps its action list and the `(child, cost)` of every action applied to
+    it, so reaching the state again (through another path, another iterative-deepening pass or
+    another search) costs a dictionary lookup instead of a call into the wrapped problem.
+
+    States are looked up by `key(state)` (the state itself by default, so states must be
+    hashable). Entries are evicted least recently used first once there are more than `maxsize`
+    of them, or once their estimated size exceeds `max_bytes`; `None` disables either limit.
+    The size of an entry is `sizeof` applied to the state and to each cached child.
+
+    With `persist=True` the cache survives across searches on this instance. With
+    `persist=False` it is cleared by `reset`, which searches call once before they start.
+
+    The optional hooks are delegated to the wrapped problem, except `expand_batch` and
+    `iter_successors`: successors are served from the cache, so they are not advertised by
+    `implements`.
+    """
+
+    def __init__(self, problem: Problem, maxsize: Optional[int] = 100_000, max_bytes: Optional[int] = None,
+                 persist: bool = True, key: Optional[Callable[[Any], Any]] = None,
+                 sizeof: Callable[[Any], int] = sys.getsizeof):
+        self.problem = problem
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.persist = persist
+        self.key = key
+        self.sizeof = sizeof
+        self.cache_clear()
+
+    def cache_info(self) -> CacheInfo:
+        """Return hit/miss/eviction counts and the current size of the cache."""
+        return CacheInfo(self.hits, self.misses, self.evictions, len(self.entries), self.maxsize,
+                         self.nbytes, self.max_bytes)
+
+    def cache_clear(self):
+        """Drop every cached entry and reset the statistics."""
+        self.entries = OrderedDict()  # key -> [actions or None, {action: (child, cost)}, nbytes]
+        self.nbytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def reset(self):
+        """Clear the cache unless it persists across searches, and reset the wrapped problem."""
+        if not self.persist:
+            self.cache_clear()
+        self.problem.reset()
+
+    def get_initial_state(self) -> Problem.State:
+        return self.problem.get_initial_state()
+
+    def is_goal(self, state: Problem.State) -> bool:
+        return self.problem.is_goal(state)
+
+    def get_actions(self, state: Problem.State) -> List[Any]:
+        """Return the wrapped problem's actions for `state`, computing them once per cached state."""
+        entry = self._entry(state)
+        if entry[0] is not None:
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        entry[0] = self.problem.get_actions(state)
+        return entry[0]
+
+    def get_result(self, state: Problem.State, action: Any) -> Tuple[Problem.State, float]:
+        """Return the wrapped problem's `(child, cost)`, computing it once per cached state and action."""
+        entry = self._entry(state)
+        result = entry[1].get(action)
+        if result is not None:
+            self.hits += 1
+            return result
+        self.misses += 1
+        result = self.problem.get_result(state, action)
+        entry[1][action] = result
+        if self.max_bytes is not None:
+            size = self.sizeof(result[0])
+            entry[2] += size
+            self.nbytes += size
+            self._evict()
+        return result
+
+    def _entry(self, state):
+        key = state if self.key is None else self.key(state)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            return entry
+        entry = [None, {}, 0]
+        if self.max_bytes is not None:
+            entry[2] = self.sizeof(state)
+            self.nbytes += entry[2]
+        self.entries[key] = entry
+        self._evict()
+        return entry
+
+    def _evict(self):
+        # The most recent entry is never evicted, so the caller can keep filling it
+        while len(self.entries) > 1 and (
+                (self.maxsize is not None and len(self.entries) > self.maxsize)
+                or (self.max_bytes is not None and self.nbytes > self.max_bytes)):
+            _, entry = self.entries.popitem(last=False)
+            self.nbytes -= entry[2]
+            self.evictions += 1
+
+    def implements(self, method_name: str) -> bool:
+        """Delegate the optional hooks to the wrapped problem, except `expand_batch` and
+        `iter_successors`, which would bypass the cache."""
+        if method_name in ("expand_batch", "iter_successors"):
+            return False
+        return self.problem.implements(method_name)
+
+    def encode(self, state: Problem.State) -> Any:
+        return self.problem.encode(state)
+
+    def decode(self, encoding: Any) -> Problem.State:
+        return self.problem.decode(encoding)
+
+    def get_goal_state(self) -> Problem.State:
+        return self.problem.get_goal_state()
+
+    def get_predecessors(self, state: Problem.State) -> List[Tuple[Problem.State, Any, float]]:
+        return self.problem.get_predecessors(state)
+
+    def is_goal_batch(self, states: List[Problem.State]) -> Sequence[bool]:
+        return self.problem.is_goal_batch(states)
+
+    def __getstate__(self):
+        """Pickle without the cached entries, e.g. when the problem is sent to worker processes."""
+        state = self.__dict__.copy()
+        state["entries"] = OrderedDict()
+        state["nbytes"] = 0
+        return state
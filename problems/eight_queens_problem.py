@@ -1,6 +1,37 @@
 import numpy as np
 from .problem import Problem
-from typing import Any, List, Tuple
+from typing import Any, Iterator, List, Sequence, Tuple
+
+
+def symmetric_placements(queens_positions: Sequence[int], board_dimension: int) -> List[Tuple[int, ...]]:
+    """Return the images of a complete row-by-row queen placement under the 8 rotations and
+    reflections of the square (with repeats for symmetric placements)."""
+    positions = tuple(queens_positions)
+    last = board_dimension - 1
+    inverse = [0] * board_dimension  # Transposed board: column -> row
+    for row, col in enumerate(positions):
+        inverse[col] = row
+    inverse = tuple(inverse)
+    images = []
+    for perm in (positions, inverse):
+        images.append(perm)
+        images.append(tuple(last - col for col in perm))  # Left-right mirror
+        images.append(perm[::-1])  # Top-bottom mirror
+        images.append(tuple(last - col for col in reversed(perm)))  # Half turn
+    return images
+
+
+def canonical_positions(queens_positions: Sequence[int], board_dimension: int) -> Tuple[int, ...]:
+    """Return the lexicographically smallest equivalent of a row-by-row queen placement.
+
+    A complete board is reduced over all 8 rotations and reflections of the square. A partial
+    board (queens in the first k rows only) is reduced over the left-right mirror, the only
+    symmetry that maps a filled row prefix onto another filled row prefix.
+    """
+    positions = tuple(queens_positions)
+    if len(positions) < board_dimension:
+        return min(positions, tuple(board_dimension - 1 - col for col in positions))
+    return min(symmetric_placements(positions, board_dimension))
 
 
 class EightQueensProblem(Problem):
@@ -22,13 +53,18 @@ class EightQueensProblem(Problem):
         
         - Queens must be placed in consecutive rows without any skipped rows.
         - No two queens can be in the same row, column, or diagonal.
+
+        States hash and compare by their queen positions. With `symmetry_reduced=True` they
+        compare by `canonical_positions` instead, so symmetric placements count as duplicates.
         """
 
-        def __init__(self, board_dimension: int = 8, queens_positions: List[int] = None, strict=True):
+        def __init__(self, board_dimension: int = 8, queens_positions: List[int] = None, strict=True,
+                     symmetry_reduced=False):
             """Initialize the board as a numpy array with given queen positions marked by 1s,
             ensuring that all placements are valid and conflict-free.
             """
             self.board_dimension = board_dimension
+            self.symmetry_reduced = symmetry_reduced
             self.board = np.zeros((board_dimension, board_dimension), dtype=int)  # 0s represent empty squares
             self.queens_positions = queens_positions if queens_positions is not None else []
 
@@ -70,14 +106,182 @@ class EightQueensProblem(Problem):
                     return True
             return False
         
+        def key(self) -> Tuple[int, ...]:
+            """Return the value used for hashing and equality."""
+            if self.symmetry_reduced:
+                return canonical_positions(self.queens_positions, self.board_dimension)
+            return tuple(self.queens_positions)
+
+        def __hash__(self):
+            return hash((self.board_dimension, self.key()))
+
+        def __eq__(self, other):
+            return (isinstance(other, EightQueensProblem.State)
+                    and self.board_dimension == other.board_dimension
+                    and self.key() == other.key())
+
         def __repr__(self):
             return f"State(board=\n{self.board})"
 
+    class CompactState:
+        """Immutable bitboard form of `State`, storing only occupancy bitmasks and queen columns.
+
+        Column, main-diagonal and anti-diagonal occupancy are kept as integer bitmasks, so a
+        queen can be validated and placed in O(1) bit operations instead of re-scanning an
+        n x n board. The numpy board is only built (once) when `board` or `__repr__` is used.
+
+        Bit layout for a queen at (row, col) on an n x n board:
+        - `columns`: bit `col`
+        - `main_diagonals`: bit `col - row + n - 1`
+        - `anti_diagonals`: bit `row + col`
+
+        Hashing and equality follow `State`; the key is computed once and cached.
+        """
+
+        BULK_THRESHOLD = 64  # Placements longer than this are validated with numpy
+
+        __slots__ = ("board_dimension", "queens_positions", "columns",
+                     "main_diagonals", "anti_diagonals", "symmetry_reduced", "_key", "_board")
+
+        def __init__(self, board_dimension: int = 8, queens_positions: Tuple[int, ...] = None, strict=True,
+                     symmetry_reduced=False):
+            """Build the occupancy masks from the given queen positions, validating them when strict."""
+            positions = tuple(queens_positions) if queens_positions is not None else ()
+            if strict and len(positions) > board_dimension:
+                raise ValueError("Invalid state: More queens placed than the board dimension allows.")
+
+            if len(positions) > self.BULK_THRESHOLD:
+                masks = self._bulk_masks(board_dimension, positions, strict)
+                self._set(board_dimension, positions, *masks, symmetry_reduced)
+                return
+
+            columns = main_diagonals = anti_diagonals = 0
+            for row, col in enumerate(positions):
+                if strict and not 0 <= col < board_dimension:
+                    raise ValueError("Invalid state: Queen placed outside the board.")
+                column_bit = 1 << col
+                main_bit = 1 << (col - row + board_dimension - 1)
+                anti_bit = 1 << (row + col)
+                if strict:
+                    if columns & column_bit:
+                        raise ValueError("Invalid state: Conflict detected in a column configuration.")
+                    if main_diagonals & main_bit:
+                        raise ValueError("Invalid state: Conflict detected in a main diagonal.")
+                    if anti_diagonals & anti_bit:
+                        raise ValueError("Invalid state: Conflict detected in an anti-diagonal.")
+                columns |= column_bit
+                main_diagonals |= main_bit
+                anti_diagonals |= anti_bit
+
+            self._set(board_dimension, positions, columns, main_diagonals, anti_diagonals, symmetry_reduced)
+
+        @staticmethod
+        def _bulk_masks(board_dimension, positions, strict):
+            """Validate and build the three masks with numpy in O(n), instead of shifting ever
+            larger integers once per queen, which is quadratic for very large boards."""
+            cols = np.asarray(positions, dtype=np.int64)
+            rows = np.arange(len(cols), dtype=np.int64)
+            if strict and ((cols < 0) | (cols >= board_dimension)).any():
+                raise ValueError("Invalid state: Queen placed outside the board.")
+            width = 2 * board_dimension - 1
+            checks = ((cols, board_dimension, "Invalid state: Conflict detected in a column configuration."),
+                      (cols - rows + board_dimension - 1, width, "Invalid state: Conflict detected in a main diagonal."),
+                      (rows + cols, width, "Invalid state: Conflict detected in an anti-diagonal."))
+            masks = []
+            for bits, size, message in checks:
+                if strict and np.bincount(bits, minlength=size).max() > 1:
+                    raise ValueError(message)
+                occupied = np.zeros(size, dtype=bool)
+                occupied[bits] = True
+                masks.append(int.from_bytes(np.packbits(occupied, bitorder="little").tobytes(), "little"))
+            return masks
+
+        def _set(self, board_dimension, positions, columns, main_diagonals, anti_diagonals, symmetry_reduced):
+            object.__setattr__(self, "board_dimension", board_dimension)
+            object.__setattr__(self, "queens_positions", positions)
+            object.__setattr__(self, "columns", columns)
+            object.__setattr__(self, "main_diagonals", main_diagonals)
+            object.__setattr__(self, "anti_diagonals", anti_diagonals)
+            object.__setattr__(self, "symmetry_reduced", symmetry_reduced)
+            object.__setattr__(self, "_key", None)
+            object.__setattr__(self, "_board", None)
+
+        def __setattr__(self, name, value):
+            raise AttributeError("CompactState is immutable")
+
+        def __delattr__(self, name):
+            raise AttributeError("CompactState is immutable")
+
+        def __reduce__(self):
+            return (self.__class__, (self.board_dimension, self.queens_positions, False, self.symmetry_reduced))
+
+        def key(self) -> Tuple[int, ...]:
+            """Return the value used for hashing and equality."""
+            if self._key is None:
+                key = self.queens_positions
+                if self.symmetry_reduced:
+                    key = canonical_positions(key, self.board_dimension)
+                object.__setattr__(self, "_key", key)
+            return self._key
+
+        def __hash__(self):
+            return hash((self.board_dimension, self.key()))
+
+        def __eq__(self, other):
+            return (isinstance(other, EightQueensProblem.CompactState)
+                    and self.board_dimension == other.board_dimension
+                    and self.key() == other.key())
+
+        def free_columns(self) -> int:
+            """Return a bitmask of the columns where a queen can be placed in the next row."""
+            row = len(self.queens_positions)
+            n = self.board_dimension
+            if row >= n:
+                return 0
+            blocked = self.columns | (self.main_diagonals >> (n - 1 - row)) | (self.anti_diagonals >> row)
+            return ~blocked & ((1 << n) - 1)
+
+        def extend(self, col: int) -> "EightQueensProblem.CompactState":
+            """Return a new state with a queen added in the next row at `col`, validated in O(1)."""
+            row = len(self.queens_positions)
+            n = self.board_dimension
+            if not 0 <= col < n or not (self.free_columns() >> col) & 1:
+                raise ValueError(f"Invalid action: column {col} is not safe in row {row}.")
+            child = object.__new__(self.__class__)
+            child._set(n, self.queens_positions + (col,),
+                       self.columns | (1 << col),
+                       self.main_diagonals | (1 << (col - row + n - 1)),
+                       self.anti_diagonals | (1 << (row + col)),
+                       self.symmetry_reduced)
+            return child
+
+        @property
+        def board(self) -> np.ndarray:
+            """Read-only numpy board with queens marked by 1s, built on first access."""
+            if self._board is None:
+                board = np.zeros((self.board_dimension, self.board_dimension), dtype=int)
+                if self.queens_positions:
+                    board[np.arange(len(self.queens_positions)), list(self.queens_positions)] = 1
+                board.flags.writeable = False
+                object.__setattr__(self, "_board", board)
+            return self._board
+
+        def __repr__(self):
+            return f"CompactState(board=\n{self.board})"
+
     
-    def __init__(self, board_dimension: int = 8):
-        """Initialize the 8-queens problem with a specified board dimension and an empty initial state."""
+    def __init__(self, board_dimension: int = 8, compact: bool = False, symmetry_reduced: bool = False):
+        """Initialize the 8-queens problem with a specified board dimension and an empty initial state.
+
+        With `compact=True` states are `CompactState` bitboards instead of numpy-backed `State`s.
+        With `symmetry_reduced=True` states compare equal to their symmetric counterparts, so a
+        visited set prunes mirrored placements as duplicates.
+        """
         self.board_dimension = board_dimension
-        self.initial_state = self.State(board_dimension=board_dimension)
+        self.compact = compact
+        self.symmetry_reduced = symmetry_reduced
+        state_class = self.CompactState if compact else self.State
+        self.initial_state = state_class(board_dimension=board_dimension, symmetry_reduced=symmetry_reduced)
 
 
     def is_goal(self, state: State) -> bool:
@@ -92,6 +296,15 @@ class EightQueensProblem(Problem):
         Assumes that queens are placed row by row. The next queen will be placed in 
         the row equal to the number of queens currently on the board.
         """
+        if isinstance(state, self.CompactState):
+            free = state.free_columns()
+            valid_columns = []
+            while free:
+                lowest = free & -free  # Isolate the lowest free column
+                valid_columns.append(lowest.bit_length() - 1)
+                free ^= lowest
+            return valid_columns
+
         next_row = len(state.queens_positions)  # Row to place the next queen
         valid_columns = [
             col for col in range(self.board_dimension) 
@@ -99,6 +312,24 @@ class EightQueensProblem(Problem):
         ]
         return valid_columns
     
+    def iter_successors(self, state: State) -> Iterator[Tuple[int, State, float]]:
+        """Yield `(column, child, 1.0)` for the next row, testing each column only when the
+        previous child has been consumed."""
+        if isinstance(state, self.CompactState):
+            free = state.free_columns()
+            while free:
+                lowest = free & -free
+                free ^= lowest
+                col = lowest.bit_length() - 1
+                yield col, state.extend(col), 1.0
+            return
+
+        next_row = len(state.queens_positions)
+        for col in range(self.board_dimension):
+            if self._is_safe(state, next_row, col):
+                child, cost = self.get_result(state, col)
+                yield col, child, cost
+
     def _is_safe(self, state: State, row: int, col: int) -> bool:
             """Check if placing a queen at (row, col) does not threaten existing queens."""
             for r, c in enumerate(state.queens_positions):
@@ -110,15 +341,81 @@ class EightQueensProblem(Problem):
     def get_result(self, state: State, action: int) -> Tuple[State, float]:
         """Return a new state with a queen added in the next row and specified column, with a cost of 1."""
                      
+        if isinstance(state, self.CompactState):
+            return state.extend(action), 1.0
+
         # Create a new state with the updated queen positions
         new_positions = state.queens_positions + [action]
-        next_state = self.State(self.board_dimension, new_positions)
+        next_state = self.State(self.board_dimension, new_positions, symmetry_reduced=self.symmetry_reduced)
         return next_state, 1.0  # Return the new state and a cost of 1
 
 
     def get_initial_state(self) -> State:
         """Return the initial state, which is an empty board for the 8-queens problem."""
         return self.initial_state
+
+    def implements(self, method_name: str) -> bool:
+        """Compact bitboards already expand in O(1) per child, cheaper than a batch round trip,
+        so `expand_batch` is only advertised for numpy-backed states."""
+        if method_name == "expand_batch" and self.compact:
+            return False
+        return super().implements(method_name)
+
+    def encode(self, state: State) -> np.ndarray:
+        """Return the queen columns as an array of length `board_dimension`, padded with
+        `board_dimension` (an impossible column) for the rows that are still empty."""
+        n = self.board_dimension
+        encoding = np.full(n, n, dtype=np.min_scalar_type(n))
+        encoding[:len(state.queens_positions)] = state.queens_positions
+        return encoding
+
+    def decode(self, encoding: np.ndarray) -> State:
+        """Rebuild the state described by an `encode` array."""
+        n = self.board_dimension
+        return self.make_state([int(col) for col in encoding if col != n], strict=False)
+
+    def make_state(self, queens_positions: Sequence[int], strict: bool = True) -> State:
+        """Build a state of the configured kind (`State` or `CompactState`) from queen columns."""
+        if self.compact:
+            return self.CompactState(self.board_dimension, tuple(queens_positions), strict=strict,
+                                     symmetry_reduced=self.symmetry_reduced)
+        return self.State(self.board_dimension, list(queens_positions), strict=strict,
+                          symmetry_reduced=self.symmetry_reduced)
+
+    def expand_batch(self, states: List[State]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Generate the children of all `states` with array operations, grouped by board depth.
+
+        For the boards with k queens, every (board, column) pair is tested against the k placed
+        queens at once, so a whole frontier layer costs a few broadcasts instead of one
+        `_is_safe` loop per column.
+        """
+        n = self.board_dimension
+        encodings = np.stack([self.encode(state) for state in states]) if states else np.empty((0, n), dtype=np.min_scalar_type(n))
+        depths = (encodings != n).sum(axis=1)
+        columns = np.arange(n)
+
+        parents, actions, children = [], [], []
+        for depth in np.unique(depths):
+            if depth >= n:
+                continue  # Complete boards have no children
+            group = np.flatnonzero(depths == depth)
+            placed = encodings[group, :depth].astype(np.int64)[:, :, None]  # (boards, depth, 1)
+            row_distance = (depth - np.arange(depth))[None, :, None]
+            conflicts = (placed == columns) | (np.abs(placed - columns) == row_distance)
+            board_index, column = np.nonzero(~conflicts.any(axis=1))
+            child_encodings = encodings[group[board_index]]
+            child_encodings[:, depth] = column
+            parents.append(group[board_index])
+            actions.append(column)
+            children.append(child_encodings)
+
+        if not parents:
+            return (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64),
+                    np.empty((0, n), dtype=encodings.dtype), np.empty(0))
+        parents = np.concatenate(parents)
+        actions = np.concatenate(actions)
+        order = np.lexsort((actions, parents))  # Group by parent, columns ascending
+        return parents[order], actions[order], np.concatenate(children)[order], np.ones(len(order))
     
 
 
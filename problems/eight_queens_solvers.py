@@ -0,0 +1,419 @@
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
+from .eight_queens_problem import EightQueensProblem, symmetric_placements
+
+
+class BacktrackingQueensSolver:
+    """Dedicated N-queens solver for an `EightQueensProblem`, bypassing generic tree search.
+
+    Each row keeps a bitmask of the columns still open to it. Placing a queen prunes the
+    domains of every unassigned row (forward checking) and the next row to fill is the one
+    with the fewest open columns (MRV), so dead ends are detected as soon as any row runs out
+    of columns. The search uses an explicit stack, so large boards do not hit the recursion limit.
+    """
+
+    def __init__(self, problem: EightQueensProblem):
+        self.problem = problem
+        self.board_dimension = problem.board_dimension
+
+    def solve(self) -> Optional[EightQueensProblem.State]:
+        """Return the first solution found as a state of the problem's kind, or None if there is none."""
+        for positions in self._assignments():
+            return self.problem.make_state(positions)
+        return None
+
+    def solutions(self) -> Iterator[EightQueensProblem.State]:
+        """Yield every solution, one state at a time."""
+        for positions in self._assignments():
+            yield self.problem.make_state(positions)
+
+    def count_solutions(self) -> int:
+        """Count all solutions with the classic row-by-row bitmask enumeration.
+
+        No states are built: each row is a single integer operation on the column and
+        diagonal masks, which is far cheaper than MRV bookkeeping when every branch is visited.
+        """
+        return sum(1 for _ in _complete_placements(self.board_dimension))
+
+    def _assignments(self) -> Iterator[List[int]]:
+        """Yield complete assignments (queen column per row) found by MRV + forward checking."""
+        n = self.board_dimension
+        if n == 0:
+            yield []
+            return
+        full = (1 << n) - 1
+        # Each frame: (domains of unassigned rows, assignment so far, row being filled, columns left to try)
+        domains = {row: full for row in range(n)}
+        row = self._select_row(domains)
+        stack = [(domains, {}, row, self._column_order(domains[row]))]
+        while stack:
+            domains, assignment, row, untried = stack[-1]
+            if not untried:
+                stack.pop()
+                continue
+            col = untried.pop()
+
+            pruned = self._forward_check(domains, row, col)
+            if pruned is None:
+                continue
+            placed = dict(assignment)
+            placed[row] = col
+            if not pruned:
+                yield [placed[r] for r in range(n)]
+                continue
+            next_row = self._select_row(pruned)
+            stack.append((pruned, placed, next_row, self._column_order(pruned[next_row])))
+
+    def _column_order(self, mask: int) -> List[int]:
+        """Open columns of a domain, centre-most last so that `pop()` tries them first.
+
+        Central queens cover more diagonals of the rows still left, which keeps the search
+        almost backtrack-free on large boards.
+        """
+        centre = self.board_dimension - 1
+        columns = []
+        while mask:
+            bit = mask & -mask
+            columns.append(bit.bit_length() - 1)
+            mask ^= bit
+        columns.sort(key=lambda col: -abs(2 * col - centre))
+        return columns
+
+    @staticmethod
+    def _forward_check(domains, row, col):
+        """Return the domains left after placing (row, col), or None if some row has no column left."""
+        pruned = {}
+        for other, mask in domains.items():
+            if other == row:
+                continue
+            distance = other - row
+            mask &= ~(1 << col)
+            if col + distance >= 0:
+                mask &= ~(1 << (col + distance))
+            if col - distance >= 0:
+                mask &= ~(1 << (col - distance))
+            if not mask:
+                return None
+            pruned[other] = mask
+        return pruned
+
+    def _select_row(self, domains):
+        """Minimum remaining values: the unassigned row with the fewest open columns,
+        ties going to the row closest to the centre of the board."""
+        centre = self.board_dimension - 1
+        return min(domains, key=lambda row: (bin(domains[row]).count("1"), abs(2 * row - centre)))
+
+
+class MinConflictsQueensSolver:
+    """Min-conflicts local search for very large N-queens boards (10^4 to 10^6 queens).
+
+    Queens are kept as a permutation, so rows and columns never conflict and only diagonals
+    need repairing. Following the QS4 scheme, all but the last few rows are placed greedily on
+    conflict-free diagonals, then queens under attack are swapped with random partners whenever
+    the swap lowers the number of attacking pairs. Diagonal occupancy is tracked in count arrays,
+    so each swap is evaluated in O(1).
+
+    This only finds solutions; use `BacktrackingQueensSolver.count_solutions` to count them.
+    For boards beyond a few thousand queens build the problem with `compact=True`, since a
+    numpy-backed `State` stores the full n x n board.
+    """
+
+    RANDOM_TAIL = 50  # Rows left to random placement at the end of the greedy initialization
+    SWAP_TRIES = 2000  # Random partners tried per attacked queen and pass before moving on
+
+    def __init__(self, problem: EightQueensProblem, seed: Optional[int] = None, max_steps: Optional[int] = None):
+        self.problem = problem
+        self.board_dimension = problem.board_dimension
+        self.random = random.Random(seed)
+        self.max_steps = max_steps if max_steps is not None else 100 * max(self.board_dimension, 10)
+        self.steps = 0
+
+    def solve(self) -> Optional[EightQueensProblem.State]:
+        """Return a solution as a state of the problem's kind, or None if none exists or `max_steps`
+        swap attempts were not enough."""
+        positions = self.solve_positions()
+        if positions is None:
+            return None
+        return self.problem.make_state(positions)
+
+    def solve_positions(self) -> Optional[List[int]]:
+        """Return the queen column for each row, without building a state."""
+        n = self.board_dimension
+        if n in (2, 3):
+            return None
+        self.steps = 0
+        while self.steps < self.max_steps:
+            queens, anti, main = self._initialize()
+            if self._repair(queens, anti, main):
+                return queens
+        return None
+
+    def _initialize(self):
+        """Greedy QS4 start: place rows on free diagonals by swapping in random later columns."""
+        n = self.board_dimension
+        offset = n - 1
+        queens = list(range(n))
+        self.random.shuffle(queens)
+        anti = [0] * (2 * n - 1)  # Queens per row + col diagonal
+        main = [0] * (2 * n - 1)  # Queens per row - col + n - 1 diagonal
+        randrange = self.random.randrange
+        greedy_rows = max(0, n - self.RANDOM_TAIL)
+
+        for row in range(greedy_rows):
+            for _ in range(n - row):
+                other = randrange(row, n)
+                col = queens[other]
+                if not anti[row + col] and not main[row - col + offset]:
+                    queens[row], queens[other] = col, queens[row]
+                    break
+            col = queens[row]
+            anti[row + col] += 1
+            main[row - col + offset] += 1
+        for row in range(greedy_rows, n):
+            col = queens[row]
+            anti[row + col] += 1
+            main[row - col + offset] += 1
+        return queens, anti, main
+
+    def _repair(self, queens, anti, main) -> bool:
+        """Swap attacked queens with random partners until no pair attacks; False on a stall or budget."""
+        n = self.board_dimension
+        offset = n - 1
+        randrange = self.random.randrange
+        while True:
+            attacked = [row for row in range(n)
+                        if anti[row + queens[row]] > 1 or main[row - queens[row] + offset] > 1]
+            if not attacked:
+                return True
+            improved = False
+            for row in attacked:
+                for _ in range(min(n, self.SWAP_TRIES)):
+                    if self.steps >= self.max_steps:
+                        return False
+                    self.steps += 1
+                    other = randrange(n)
+                    if other != row and self._try_swap(queens, anti, main, row, other):
+                        improved = True
+                        break
+            if not improved:
+                return False  # Local minimum: restart from a fresh initialization
+
+    def _try_swap(self, queens, anti, main, i, j) -> bool:
+        """Swap the columns of rows i and j if that reduces the number of attacking pairs."""
+        offset = self.board_dimension - 1
+        qi, qj = queens[i], queens[j]
+        old_cells = (i + qi, i - qi + offset, j + qj, j - qj + offset)
+        new_cells = (i + qj, i - qj + offset, j + qi, j - qi + offset)
+        anti[old_cells[0]] -= 1
+        main[old_cells[1]] -= 1
+        anti[old_cells[2]] -= 1
+        main[old_cells[3]] -= 1
+        # Pairs each queen forms with the others, plus the pair between the two if they share a diagonal
+        old = (anti[old_cells[0]] + main[old_cells[1]] + anti[old_cells[2]] + main[old_cells[3]]
+               + (old_cells[0] == old_cells[2]) + (old_cells[1] == old_cells[3]))
+        new = (anti[new_cells[0]] + main[new_cells[1]] + anti[new_cells[2]] + main[new_cells[3]]
+               + (new_cells[0] == new_cells[2]) + (new_cells[1] == new_cells[3]))
+        cells = new_cells if new < old else old_cells
+        anti[cells[0]] += 1
+        main[cells[1]] += 1
+        anti[cells[2]] += 1
+        main[cells[3]] += 1
+        if new < old:
+            queens[i], queens[j] = qj, qi
+            return True
+        return False
+
+
+def _prefix_masks(prefix, n):
+    """Return the (columns, main diagonals, anti diagonals) masks seen from the row after `prefix`,
+    or None if two queens of `prefix` attack each other."""
+    full = (1 << n) - 1
+    columns = main = anti = 0
+    for col in prefix:
+        bit = 1 << col
+        if bit & (columns | main | anti):
+            return None
+        columns, main, anti = columns | bit, (main | bit) >> 1, ((anti | bit) << 1) & full
+    return columns, main, anti
+
+
+def _complete_placements(n, columns=0, main=0, anti=0, positions=None):
+    """Yield every completion of a partial placement, given by its (columns, main diagonals,
+    anti diagonals) masks seen from the next row to fill (see `_prefix_masks`), in a fixed order.
+
+    Each completion is yielded as `positions` extended with the queen column of every further
+    row, or as None when `positions` is None, which skips building tuples when only counting.
+    Each row is a single integer operation on the masks, and the explicit stack keeps large
+    boards clear of the recursion limit.
+    """
+    full = (1 << n) - 1
+    stack = [(columns, main, anti, positions)]
+    while stack:
+        columns, main, anti, positions = stack.pop()
+        if columns == full:
+            yield positions
+            continue
+        free = full & ~(columns | main | anti)
+        while free:
+            bit = free & -free
+            free ^= bit
+            stack.append((columns | bit, (main | bit) >> 1, ((anti | bit) << 1) & full,
+                          None if positions is None else positions + (bit.bit_length() - 1,)))
+
+
+def _subtree_solutions(n, prefix):
+    """Yield every solution extending the row prefix `prefix`, in a fixed order."""
+    return _complete_placements(n, *_prefix_masks(prefix, n), tuple(prefix))
+
+
+def _count_subtree(n, prefix, unique):
+    """Worker entry point: return `(prefix, solutions, eighths)` for the solutions extending `prefix`.
+
+    `eighths` sums 8 / (orbit size) over those solutions, so that summing it over all
+    solutions gives 8 times the number of solutions distinct up to symmetry. It is only
+    computed with `unique`, since that requires building every solution.
+    """
+    if unique:
+        count = eighths = 0
+        for positions in _subtree_solutions(n, prefix):
+            count += 1
+            eighths += 8 // len(set(symmetric_placements(positions, n)))
+        return prefix, count, eighths
+    count = sum(1 for _ in _complete_placements(n, *_prefix_masks(prefix, n)))
+    return prefix, count, None
+
+
+class QueensSolutionCounter:
+    """Counts and samples all N-queens solutions using the board symmetry, several cores and a disk cache.
+
+    The left-right mirror maps solutions with the first queen in column c onto those with it in
+    column n - 1 - c, so only the left half of the first row is searched and those counts are
+    doubled (the middle column of an odd board is counted once). The remaining search is split
+    into independent subproblems, one per valid placement of the first `split_rows` rows, which
+    run on `max_workers` processes.
+
+    With `cache_dir`, subproblem counts are written to `queens_<n>_split<split_rows>.json` (the
+    subproblems depend on `split_rows`) at most every `save_interval` seconds while counting and
+    once at the end, so later counts, samples and interrupted runs for the same n reuse them.
+    `count(n, unique=True)` counts solutions distinct up to rotations and reflections.
+    """
+
+    save_interval = 1.0  # Minimum seconds between two cache writes while subproblems complete
+
+    def __init__(self, cache_dir: Optional[str] = None, max_workers: int = 1, split_rows: int = 2):
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers
+        self.split_rows = max(1, split_rows)
+
+    def count(self, n: int, unique: bool = False) -> int:
+        """Return the number of solutions of the n-queens problem (up to symmetry with `unique`)."""
+        if n == 0:
+            return 1
+        entries = self.subproblem_counts(n, unique)
+        if unique:
+            return sum(self._weight(n, prefix) * entries[prefix][1] for prefix in entries) // 8
+        return sum(self._weight(n, prefix) * entries[prefix][0] for prefix in entries)
+
+    def subproblem_counts(self, n: int, unique: bool = False) -> Dict[Tuple[int, ...], list]:
+        """Return `{prefix: [solutions, eighths]}` for every subproblem of the left half of the
+        first row, counting (and caching) only those not cached yet. `eighths` is None unless
+        it was computed with `unique`."""
+        cache = self._load(n)
+        prefixes = self._prefixes(n)
+        entries = {prefix: cache.get(",".join(map(str, prefix))) for prefix in prefixes}
+        missing = [prefix for prefix, entry in entries.items()
+                   if entry is None or (unique and entry[1] is None)]
+        if not missing:
+            return entries
+        saved = time.monotonic()
+        try:
+            for prefix, count, eighths in self._run(n, missing, unique):
+                entries[prefix] = cache[",".join(map(str, prefix))] = [count, eighths]
+                if time.monotonic() - saved >= self.save_interval:
+                    self._save(n, cache)
+                    saved = time.monotonic()
+        finally:
+            self._save(n, cache)  # Also keeps the subproblems finished before an interruption
+        return entries
+
+    def sample(self, n: int, k: int = 1, seed: Optional[int] = None) -> List[List[int]]:
+        """Return `k` distinct solutions (queen column per row) drawn uniformly at random.
+
+        The subproblem counts locate each drawn solution, so only the subtrees holding one are
+        enumerated. Raises ValueError if there are fewer than `k` solutions. As in `count`, the
+        empty board has one solution, the empty placement.
+        """
+        if n == 0:
+            if k > 1:
+                raise ValueError("The 0-queens problem has only 1 solutions.")
+            return [[] for _ in range(k)]
+        entries = self.subproblem_counts(n)
+        # Every subproblem stands for its own solutions, then for their mirror images if it has a mirror
+        blocks = []
+        for prefix in sorted(entries):
+            blocks.extend((prefix, mirrored) for mirrored in range(self._weight(n, prefix)))
+        total = sum(entries[prefix][0] for prefix, _ in blocks)
+        if k > total:
+            raise ValueError(f"The {n}-queens problem has only {total} solutions.")
+        wanted = {}  # (prefix, mirrored) -> {offset within the subproblem: position in the sample}
+        for position, index in enumerate(random.Random(seed).sample(range(total), k)):
+            for prefix, mirrored in blocks:
+                if index < entries[prefix][0]:
+                    wanted.setdefault((prefix, mirrored), {})[index] = position
+                    break
+                index -= entries[prefix][0]
+        samples = [None] * k
+        for (prefix, mirrored), offsets in wanted.items():
+            last = max(offsets)
+            for offset, positions in enumerate(_subtree_solutions(n, prefix)):
+                if offset in offsets:
+                    samples[offsets[offset]] = [n - 1 - col for col in positions] if mirrored else list(positions)
+                if offset == last:
+                    break
+        return samples
+
+    def _prefixes(self, n):
+        """Valid placements of the first `split_rows` rows with the first queen in the left half."""
+        prefixes = [(col,) for col in range((n + 1) // 2)]
+        for _ in range(min(self.split_rows, n) - 1):
+            prefixes = [prefix + (col,) for prefix in prefixes for col in range(n)
+                        if _prefix_masks(prefix + (col,), n) is not None]
+        return prefixes
+
+    @staticmethod
+    def _weight(n, prefix):
+        """2 for a first queen with a distinct mirror column, 1 for the middle column of an odd board."""
+        return 1 if 2 * prefix[0] == n - 1 else 2
+
+    def _run(self, n, prefixes, unique):
+        if self.max_workers <= 1 or len(prefixes) <= 1:
+            for prefix in prefixes:
+                yield _count_subtree(n, prefix, unique)
+            return
+        with ProcessPoolExecutor(self.max_workers) as executor:
+            futures = [executor.submit(_count_subtree, n, prefix, unique) for prefix in prefixes]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def _path(self, n):
+        return os.path.join(self.cache_dir, f"queens_{n}_split{self.split_rows}.json")
+
+    def _load(self, n):
+        """Return the cached `{prefix key: [solutions, eighths]}` for n, empty without a cache."""
+        if self.cache_dir is None or not os.path.exists(self._path(n)):
+            return {}
+        with open(self._path(n)) as file:
+            return json.load(file)["subproblems"]
+
+    def _save(self, n, cache):
+        if self.cache_dir is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temporary = self._path(n) + ".tmp"
+        with open(temporary, "w") as file:
+            json.dump({"board_dimension": n, "split_rows": self.split_rows, "subproblems": cache}, file)
+        os.replace(temporary, self._path(n))  # Never leaves a half-written cache behind
@@ -0,0 +1,157 @@
+from .problem import Problem
+from typing import Any, Dict, Iterable, List, Tuple
+import json
+import os
+import numpy as np
+
+
+class GraphProblem(Problem):
+    """An explicit graph stored in CSR (compressed sparse row) arrays, with integer state ids.
+
+    The edges leaving state `s` are the ids `offsets[s]` to `offsets[s + 1] - 1`; edge `e`
+    leads to `targets[e]` with cost `costs[e]`. States are plain `int`s from 0 to
+    `num_states - 1` and actions are edge ids, so `get_actions` is a `range`, `get_result` two
+    array lookups, and no per-state object is built. Unit costs are assumed when `costs` is None.
+
+    The arrays can be memory-mapped `.npy` files (see `save` / `load`), so graphs with tens of
+    millions of edges are searched without loading them into Python objects. Integer ids also
+    let searches use `algorithms.visited.BitmapVisitedSet` as their visited store.
+    """
+
+    State = int
+
+    ARRAYS = ("offsets", "targets", "costs")
+
+    def __init__(self, offsets, targets, costs=None, initial_state: int = 0, goal_states: Iterable[int] = ()):
+        self.offsets = np.asanyarray(offsets)  # Keeps memory maps as they are
+        self.targets = np.asanyarray(targets)
+        self.costs = np.asanyarray(costs) if costs is not None else np.ones(len(self.targets))
+        if self.offsets.ndim != 1 or len(self.offsets) == 0 or self.offsets[-1] != len(self.targets):
+            raise ValueError("offsets must have num_states + 1 entries, ending with the number of edges.")
+        if len(self.costs) != len(self.targets):
+            raise ValueError("targets and costs must have one entry per edge.")
+        self.num_states = len(self.offsets) - 1
+        self.initial_state = int(initial_state)
+        self.goal_states = frozenset(int(goal) for goal in goal_states)
+        self.path = None  # Directory the arrays are memory-mapped from, if any
+        self.reverse = None  # (offsets, sources, edge ids) of the reverse graph, built on the first get_predecessors call
+
+    @classmethod
+    def from_edges(cls, num_states, sources, targets, costs=None, initial_state=0, goal_states=()):
+        """Build the CSR arrays from parallel edge lists; edges keep their relative order per source."""
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        if len(sources) != len(targets):
+            raise ValueError("sources and targets must have one entry per edge.")
+        for name, ids in (("sources", sources), ("targets", targets)):
+            if len(ids) and (ids.min() < 0 or ids.max() >= num_states):
+                raise ValueError(f"{name} must be state ids from 0 to num_states - 1 ({num_states - 1}).")
+        order = np.argsort(sources, kind="stable")
+        offsets = np.zeros(num_states + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=num_states), out=offsets[1:])
+        return cls(offsets, targets[order],
+                   None if costs is None else np.asarray(costs, dtype=np.float64)[order],
+                   initial_state, goal_states)
+
+    @classmethod
+    def from_transitions(cls, transitions: Dict[int, List[Tuple[int, float]]], initial_state=0, goal_states=()):
+        """Build from a `MockProblem`-style `{state: [(neighbor, cost), ...]}` dictionary."""
+        ids = [state for state in transitions] + [neighbor for edges in transitions.values() for neighbor, _ in edges]
+        num_states = max([initial_state, *goal_states, *ids]) + 1
+        sources, targets, costs = [], [], []
+        for state, edges in transitions.items():
+            for neighbor, cost in edges:
+                sources.append(state)
+                targets.append(neighbor)
+                costs.append(cost)
+        return cls.from_edges(num_states, sources, targets, costs, initial_state, goal_states)
+
+    def save(self, path):
+        """Write the arrays as `.npy` files, plus the initial and goal states, into the directory `path`."""
+        os.makedirs(path, exist_ok=True)
+        for name in self.ARRAYS:
+            np.save(os.path.join(path, f"{name}.npy"), getattr(self, name))
+        with open(os.path.join(path, "problem.json"), "w") as file:
+            json.dump({"initial_state": self.initial_state, "goal_states": sorted(self.goal_states)}, file)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """Load a graph written by `save`; with `mmap=True` the arrays stay on disk and are paged in on use."""
+        with open(os.path.join(path, "problem.json")) as file:
+            meta = json.load(file)
+        arrays = [np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r" if mmap else None) for name in cls.ARRAYS]
+        problem = cls(*arrays, meta["initial_state"], meta["goal_states"])
+        if mmap:
+            problem.path = path
+        return problem
+
+    def __getstate__(self):
+        """Memory-mapped graphs pickle as their directory (e.g. for worker processes) instead of their edges."""
+        state = self.__dict__.copy()
+        if self.path is not None:
+            for name in self.ARRAYS:
+                del state[name]
+            state["reverse"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.path is not None:
+            for name in self.ARRAYS:
+                setattr(self, name, np.load(os.path.join(self.path, f"{name}.npy"), mmap_mode="r"))
+
+    def get_initial_state(self) -> int:
+        return self.initial_state
+
+    def get_goal_state(self) -> int:
+        """Return the goal state; only defined when there is exactly one."""
+        if len(self.goal_states) != 1:
+            raise ValueError("The graph does not have a single goal state.")
+        return next(iter(self.goal_states))
+
+    def is_goal(self, state: int) -> bool:
+        return state in self.goal_states
+
+    def is_goal_batch(self, states: List[int]) -> np.ndarray:
+        """Goal-test all `states` in one vectorized membership test."""
+        return np.isin(np.asarray(states, dtype=np.int64), np.fromiter(self.goal_states, dtype=np.int64))
+
+    def get_actions(self, state: int) -> range:
+        """Return the ids of the edges leaving `state`."""
+        return range(int(self.offsets[state]), int(self.offsets[state + 1]))
+
+    def get_result(self, state: int, action: int) -> Tuple[int, float]:
+        """Follow edge `action` in O(1)."""
+        if not self.offsets[state] <= action < self.offsets[state + 1]:
+            raise ValueError("Invalid action for the given state")
+        return int(self.targets[action]), float(self.costs[action])
+
+    def get_predecessors(self, state: int) -> List[Tuple[int, Any, float]]:
+        """Return `(source, edge id, cost)` for every edge into `state`, from a reverse CSR index."""
+        if self.reverse is None:
+            order = np.argsort(self.targets, kind="stable")
+            offsets = np.zeros(self.num_states + 1, dtype=np.int64)
+            np.cumsum(np.bincount(self.targets, minlength=self.num_states), out=offsets[1:])
+            sources = np.repeat(np.arange(self.num_states), np.diff(self.offsets))[order]
+            self.reverse = (offsets, sources, order)
+        offsets, sources, edges = self.reverse
+        start, end = offsets[state], offsets[state + 1]
+        return [(source, edge, float(self.costs[edge]))
+                for source, edge in zip(sources[start:end].tolist(), edges[start:end].tolist())]
+
+    def expand_batch(self, states: List[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return the edges leaving all `states` at once, without a Python loop over the edges."""
+        states = np.asarray(states, dtype=np.int64)
+        starts = self.offsets[states].astype(np.int64)
+        counts = self.offsets[states + 1] - starts
+        parents = np.repeat(np.arange(len(states)), counts)
+        # Edge ids: each parent's start plus the position of the edge within its own run
+        first = np.cumsum(counts) - counts
+        edges = np.arange(len(parents)) - np.repeat(first - starts, counts)
+        return parents, edges, self.targets[edges].astype(np.int64)[:, None], self.costs[edges]
+
+    def encode(self, state: int) -> np.ndarray:
+        return np.array([state], dtype=np.int64)
+
+    def decode(self, encoding: np.ndarray) -> int:
+        return int(encoding[0])
@@ -1,5 +1,6 @@
 from .problem import Problem
 from typing import Any, List, Tuple
+import numpy as np
 
 class MockProblem(Problem):
     """A mock problem to simulate states and actions for BFS testing."""
@@ -24,13 +25,33 @@ class MockProblem(Problem):
         self.initial_state = self.State(initial_state_id)
         self.goal_state = self.State(goal_state_id)
         self.discovered_transitions = []
+        self.reverse_transitions = None  # Built on the first get_predecessors call
 
     def get_initial_state(self) -> State:
         return self.initial_state
 
+    def get_goal_state(self) -> State:
+        return self.goal_state
+
     def is_goal(self, state: State) -> bool:
         return state == self.goal_state
 
+    def encode(self, state: State) -> np.ndarray:
+        """Return the state's integer id as a one-element int64 array."""
+        return np.array([state.id], dtype=np.int64)
+
+    def decode(self, encoding: np.ndarray) -> State:
+        return self.State(int(encoding[0]))
+
+    def get_predecessors(self, state: State) -> List[Tuple[State, Any, float]]:
+        """Return the states with a transition into `state`, the action (`state.id`) and its cost."""
+        if self.reverse_transitions is None:
+            self.reverse_transitions = {}
+            for source, neighbors in self.transitions.items():
+                for neighbor, cost in neighbors:
+                    self.reverse_transitions.setdefault(neighbor, []).append((source, cost))
+        return [(self.State(source), state.id, cost) for source, cost in self.reverse_transitions.get(state.id, [])]
+
     def get_actions(self, state: State) -> List[int]:
         """Return a list of neighbor state IDs."""
         return [neighbor for neighbor, _ in self.transitions.get(state.id, [])]
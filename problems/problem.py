@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, List, Tuple
+from typing import Any, Iterator, List, Sequence, Tuple
 
 
 class Problem(ABC):
@@ -22,6 +22,18 @@ class Problem(ABC):
     - `get_cost`: An optional method to calculate the cost of transitioning between states 
                   via a specified action, if not directly handled in `get_result`.
     - `get_initial_state`: A method to retrieve the initial state of the problem instance.
+    - `reset`: Called by `SearchAlgorithm.search` before each search starts; a no-op unless the
+               problem keeps per-search state.
+
+    Problems may also implement optional hooks that search algorithms use when available
+    (see `implements`):
+    - `expand_batch`: Generates the children of many states at once as NumPy arrays.
+    - `encode` / `decode`: Convert a state to and from a fixed-width NumPy encoding.
+    - `get_goal_state` / `get_predecessors`: Expose a single goal state and invert transitions,
+      for searches that also work backwards from the goal.
+    - `iter_successors`: Generates actions and children on demand, so a search that stops
+      early (on a goal or a cutoff) never computes the remaining ones.
+    - `is_goal_batch`: Goal-tests many states in one (e.g. vectorized) call.
 
     The `State` inner class serves as a placeholder for defining the structure of 
     individual states. Subclasses should define this based on the specific 
@@ -51,3 +63,52 @@ class Problem(ABC):
     def get_initial_state(self) -> State:
         """Return the initial state of the problem instance."""
         pass
+
+    def reset(self):
+        """Prepare the problem for a new search. Problems holding per-search state clear it here."""
+        pass
+
+    def implements(self, method_name: str) -> bool:
+        """Check if this problem overrides the optional hook `method_name`."""
+        return getattr(type(self), method_name) is not getattr(Problem, method_name)
+
+    def iter_successors(self, state: State) -> Iterator[Tuple[Any, State, float]]:
+        """Optional hook: yield `(action, child, cost)` for `state` in `get_actions` order.
+
+        The default applies `get_result` one action at a time. Problems override it when they can
+        also find the actions themselves lazily, instead of listing them all in `get_actions`.
+        """
+        for action in self.get_actions(state):
+            child, cost = self.get_result(state, action)
+            yield action, child, cost
+
+    def is_goal_batch(self, states: List[State]) -> Sequence[bool]:
+        """Optional hook: return `is_goal(state)` for each of `states`, e.g. as a NumPy bool array."""
+        raise NotImplementedError
+
+    def expand_batch(self, states: List[State]) -> Tuple[Any, Any, Any, Any]:
+        """Optional hook: return all children of `states` as NumPy arrays `(parents, actions, children, costs)`.
+
+        Row i describes one child: `parents[i]` is the index of its parent in `states`, `actions[i]`
+        the action applied, `children[i]` the child's encoding (see `decode`) and `costs[i]` the
+        transition cost. Rows are grouped by parent in the order of `states`, and the children of
+        each parent follow `get_actions` order.
+        """
+        raise NotImplementedError
+
+    def encode(self, state: State) -> Any:
+        """Optional hook: return a fixed-width 1-D NumPy array that identifies `state`."""
+        raise NotImplementedError
+
+    def decode(self, encoding: Any) -> State:
+        """Optional hook: rebuild the state described by `encoding` (the inverse of `encode`)."""
+        raise NotImplementedError
+
+    def get_goal_state(self) -> State:
+        """Optional hook: return the single goal state of a point-to-point problem."""
+        raise NotImplementedError
+
+    def get_predecessors(self, state: State) -> List[Tuple[State, Any, float]]:
+        """Optional hook: return `(predecessor, action, cost)` for every transition into `state`,
+        where applying `action` to `predecessor` yields `state` with the given `cost`."""
+        raise NotImplementedError
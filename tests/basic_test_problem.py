@@ -1,6 +1,10 @@
+import random
 import unittest
 from algorithms.breadth_first_search import BreadthFirstSearch
+from problems.eight_queens_problem import EightQueensProblem
+from problems.graph_problem import GraphProblem
 from problems.mock_problem import MockProblem
+from problems.problem import Problem
 
 class BasicTestProblem(unittest.TestCase):
     
@@ -60,4 +64,52 @@ class BasicTestProblem(unittest.TestCase):
             },
             initial_state_id=1,
             goal_state_id=1
-        )
\ No newline at end of file
+        )
+
+
+class PerActionQueensProblem(EightQueensProblem):
+    """`EightQueensProblem` without `expand_batch`, so searches apply `get_result` one action at a time."""
+
+    expand_batch = Problem.expand_batch
+
+
+class TracedGraphProblem(GraphProblem):
+    """`GraphProblem` that records its transitions and goal tests, and is expanded one action at
+    a time (without `expand_batch`), so searches run their per-action and fused loops on it."""
+
+    expand_batch = Problem.expand_batch
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.discovered_transitions = []
+        self.goal_test_calls = []
+
+    def get_result(self, state, action):
+        self.discovered_transitions.append((state, action))
+        return super().get_result(state, action)
+
+    def is_goal(self, state):
+        self.goal_test_calls.append(state)
+        return super().is_goal(state)
+
+    def is_goal_batch(self, states):
+        self.goal_test_calls.extend(states)
+        return super().is_goal_batch(states)
+
+
+def make_test_graph(cross_edges, seed, reachable_goal=True, branching=3, depth=5):
+    """Build a `TracedGraphProblem` over a complete `branching`-ary tree of the given `depth`, where
+    state `s` has children `s * branching + 1` to `s * branching + branching`. Every state gets,
+    with probability `cross_edges`, one extra edge to a random state, adding duplicates and cycles.
+    The goal is the last state, or there is none with `reachable_goal=False`."""
+    rng = random.Random(seed)
+    num_states = sum(branching ** level for level in range(depth + 1))
+    sources = [(child - 1) // branching for child in range(1, num_states)]
+    targets = list(range(1, num_states))
+    for state in range(num_states):
+        if rng.random() < cross_edges:
+            sources.append(state)
+            targets.append(rng.randrange(num_states))
+    costs = [rng.randint(1, 10) for _ in targets]
+    goal_states = [num_states - 1] if reachable_goal else []
+    return TracedGraphProblem.from_edges(num_states, sources, targets, costs, goal_states=goal_states)
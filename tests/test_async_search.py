@@ -0,0 +1,116 @@
+import asyncio
+import unittest
+from algorithms.async_search import AsyncBreadthFirstSearch, AsyncDepthFirstSearch, AsyncBestFirstSearch
+from algorithms.breadth_first_search import BreadthFirstSearch
+from algorithms.depth_first_search import DepthFirstSearch
+from algorithms.uniform_cost_search import UniformCostSearch
+from problems.async_problem import AsyncProblem
+from problems.mock_problem import MockProblem
+
+
+class AsyncMockProblem(AsyncProblem):
+    """Serves a `MockProblem` through coroutines that sleep, tracking how many calls overlap."""
+
+    def __init__(self, problem, delay=0.001):
+        self.problem = problem
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def is_goal(self, state):
+        return self.problem.is_goal(state)
+
+    def get_initial_state(self):
+        return self.problem.get_initial_state()
+
+    async def _call(self, method, *args):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return method(*args)
+
+    async def get_actions(self, state):
+        return await self._call(self.problem.get_actions, state)
+
+    async def get_result(self, state, action):
+        return await self._call(self.problem.get_result, state, action)
+
+
+def make_problem():
+    transitions = {i: [(2 * i, 1 + i % 3), (2 * i + 1, 1 + (i + 1) % 3)] for i in range(1, 64)}
+    transitions[5].append((40, 1))
+    return MockProblem(transitions, initial_state_id=1, goal_state_id=41)
+
+
+class TestAsyncSearch(unittest.TestCase):
+
+    def assert_matches(self, async_algorithm, sync_algorithm):
+        found = asyncio.run(async_algorithm.search(AsyncMockProblem(make_problem())))
+        self.assertEqual(found, sync_algorithm.search(make_problem()))
+        self.assertEqual(async_algorithm.retrieve_result(), sync_algorithm.retrieve_result())
+        self.assertEqual(async_algorithm.retrieve_path(), sync_algorithm.retrieve_path())
+        self.assertEqual(async_algorithm.nodes_expanded, sync_algorithm.nodes_expanded)
+        self.assertEqual(async_algorithm.nodes_retrieved, sync_algorithm.nodes_retrieved)
+        self.assertEqual(async_algorithm.goal_tests, sync_algorithm.goal_tests)
+
+    def test_breadth_first_matches_sync(self):
+        """Test the async BFS finds the same goal, path and counters as BreadthFirstSearch."""
+        self.assert_matches(AsyncBreadthFirstSearch(max_concurrency=4), BreadthFirstSearch())
+
+    def test_depth_first_matches_sync(self):
+        """Test the async DFS expands states in the same order as DepthFirstSearch."""
+        self.assert_matches(AsyncDepthFirstSearch(max_concurrency=4), DepthFirstSearch())
+
+    def test_best_first_matches_sync(self):
+        """Test the async best-first search with the default priority matches UniformCostSearch."""
+        algorithm = AsyncBestFirstSearch(max_concurrency=4)
+        self.assert_matches(algorithm, UniformCostSearch())
+        self.assertEqual(algorithm.result_cost, algorithm.retrieve_path()[1])
+
+    def test_goal_test_policies_match_sync(self):
+        """Test the async BFS and DFS honor `goal_test` and count the same goal tests as the sync ones."""
+        for policy in ("retrieval", "batch"):
+            for async_class, sync_class in ((AsyncBreadthFirstSearch, BreadthFirstSearch),
+                                            (AsyncDepthFirstSearch, DepthFirstSearch)):
+                with self.subTest(policy=policy, algorithm=sync_class.__name__):
+                    async_algorithm, sync_algorithm = async_class(max_concurrency=4), sync_class()
+                    async_algorithm.goal_test = sync_algorithm.goal_test = policy
+                    self.assert_matches(async_algorithm, sync_algorithm)
+
+    def test_best_first_skips_stale_prefetch(self):
+        """Test the async best-first search only prefetches the states of entries that are not stale."""
+        test = self
+
+        class CheckedSearch(AsyncBestFirstSearch):
+            async def successors(self, state, upcoming=()):
+                upcoming = list(upcoming)
+                for other in upcoming:
+                    test.assertTrue(any(entry[3] is other and entry[2] == self.best_cost[other]
+                                        for entry in self.frontier))
+                return await super().successors(state, upcoming)
+
+        transitions = {1: [(2, 5), (3, 1)], 3: [(4, 1)], 4: [(2, 1)], 2: [(5, 10)], 5: [(6, 1)]}
+        problem = MockProblem(transitions, initial_state_id=1, goal_state_id=6)
+        algorithm = CheckedSearch(max_concurrency=4)
+        self.assertTrue(asyncio.run(algorithm.search(AsyncMockProblem(problem))))
+        self.assertEqual(algorithm.retrieve_path(), ([3, 4, 2, 5, 6], 14))
+
+    def test_concurrency_limit(self):
+        """Test problem calls overlap, but never beyond max_concurrency."""
+        for limit in (1, 3):
+            problem = AsyncMockProblem(make_problem())
+            asyncio.run(AsyncBreadthFirstSearch(max_concurrency=limit).search(problem))
+            self.assertEqual(problem.max_in_flight, limit)
+
+    def test_unreachable_goal(self):
+        """Test the search returns False once the space is exhausted, leaving no pending expansion."""
+        problem = MockProblem({1: [(2, 1)], 2: [(3, 1)]}, initial_state_id=1, goal_state_id=9)
+        algorithm = AsyncDepthFirstSearch()
+        self.assertFalse(asyncio.run(algorithm.search(AsyncMockProblem(problem))))
+        self.assertIsNone(algorithm.retrieve_path())
+        self.assertEqual(algorithm.pending, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+from functools import partial
+import numpy as np
+from algorithms.batch_solver import BatchSolver, shared_array
+from algorithms.breadth_first_search import BreadthFirstSearch
+from algorithms.depth_limited_search import DepthLimitedSearch
+from problems.eight_queens_problem import EightQueensProblem
+from problems.mock_problem import MockProblem
+from problems.problem import Problem
+
+
+class SharedGraphProblem(Problem):
+    """Graph over integer states whose adjacency (CSR `offsets`/`targets`) lives in shared arrays."""
+
+    def __init__(self, initial_state, goal_state):
+        self.initial_state = initial_state
+        self.goal_state = goal_state
+
+    def get_initial_state(self):
+        return self.initial_state
+
+    def is_goal(self, state):
+        return state == self.goal_state
+
+    def get_actions(self, state):
+        offsets = shared_array("offsets")
+        return shared_array("targets")[offsets[state]:offsets[state + 1]].tolist()
+
+    def get_result(self, state, action):
+        return action, 1.0
+
+
+class FailingProblem(MockProblem):
+
+    def get_actions(self, state):
+        raise RuntimeError("simulator crashed")
+
+
+def failing_algorithm():
+    raise ValueError("bad configuration")
+
+
+def make_chain(length, goal):
+    return MockProblem({i: [(i + 1, 1)] for i in range(length)}, initial_state_id=0, goal_state_id=goal)
+
+
+class TestBatchSolver(unittest.TestCase):
+
+    def test_results_match_serial_search(self):
+        """Test every job reports the result, path and counters of a serial search."""
+        problems = [make_chain(10, goal) for goal in (3, 7, 20, 1)]
+        results = BatchSolver(BreadthFirstSearch, max_workers=2).solve_all(problems)
+        self.assertEqual([result.index for result in results], [0, 1, 2, 3])
+        for problem, result in zip(problems, results):
+            search = BreadthFirstSearch()
+            self.assertEqual(result.found, search.search(problem))
+            self.assertEqual(result.result, search.retrieve_result())
+            self.assertEqual(result.path, search.retrieve_path())
+            self.assertEqual(result.nodes_expanded, search.nodes_expanded)
+            self.assertIsNone(result.error)
+            self.assertGreaterEqual(result.seconds, 0.0)
+
+    def test_streams_every_job(self):
+        """Test unordered streaming yields each job exactly once, for more jobs than queued slots."""
+        problems = (EightQueensProblem(board_dimension=n, compact=True) for n in range(1, 13))
+        solver = BatchSolver(partial(DepthLimitedSearch, depth_limit=20), max_workers=2, prefetch=1)
+        results = list(solver.solve(problems))
+        self.assertEqual(sorted(result.index for result in results), list(range(12)))
+        found = {result.index + 1 for result in results if result.found}
+        self.assertEqual(found, {1} | set(range(4, 13)))
+
+    def test_shared_arrays(self):
+        """Test problems read the shared adjacency arrays, in worker processes and in-process."""
+        # 0 -> 1, 2; 1 -> 3; 2 -> 3, 4; 4 -> 5
+        shared = {"offsets": np.array([0, 2, 3, 5, 5, 6, 6]), "targets": np.array([1, 2, 3, 3, 4, 5])}
+        problems = [SharedGraphProblem(0, goal) for goal in (3, 5, 6)]
+        for max_workers in (2, 0):
+            results = BatchSolver(BreadthFirstSearch, max_workers=max_workers, shared=shared).solve_all(problems)
+            self.assertEqual([result.path for result in results], [([1, 3], 2.0), ([2, 4, 5], 3.0), None])
+        with self.assertRaises(KeyError):
+            shared_array("offsets")  # Released once the batch is over
+
+    def test_budgets_and_errors(self):
+        """Test per-job budgets suspend long jobs, and a failing job does not stop the batch."""
+        problems = [make_chain(100, 90), FailingProblem({}, 0, 1), make_chain(100, 2)]
+        results = BatchSolver(BreadthFirstSearch, max_workers=0, max_nodes=10).solve_all(problems)
+        self.assertTrue(results[0].suspended)
+        self.assertFalse(results[0].found)
+        self.assertEqual(results[1].error, "RuntimeError: simulator crashed")
+        self.assertTrue(results[2].found)
+
+    def test_failing_factory(self):
+        """Test an algorithm factory that raises is reported as the error of each job, in workers and in-process."""
+        for max_workers in (2, 0):
+            results = BatchSolver(failing_algorithm, max_workers=max_workers).solve_all([make_chain(5, 3)] * 2)
+            self.assertEqual([result.error for result in results], ["ValueError: bad configuration"] * 2)
+            self.assertEqual([(result.found, result.nodes_retrieved) for result in results], [(False, 0)] * 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
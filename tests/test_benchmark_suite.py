@@ -0,0 +1,47 @@
+import unittest
+from benchmarks.suite import compare
+
+
+def make_result(case="bfs/queens-8", seconds=1.0, peak=1000, retrieved=100, expanded=90):
+    return {"case": case, "seconds": seconds, "tracemalloc_peak_bytes": peak,
+            "nodes_retrieved": retrieved, "nodes_expanded": expanded}
+
+
+class TestCompare(unittest.TestCase):
+
+    def test_relative_tolerance(self):
+        """Test wall time and traced peak only regress when they grow by more than the tolerance."""
+        baseline = [make_result()]
+        self.assertEqual(compare([make_result(seconds=1.15, peak=1150)], baseline, tolerance=0.2), [])
+        self.assertEqual(compare([make_result(seconds=0.5, peak=10)], baseline, tolerance=0.2), [])
+        regressions = compare([make_result(seconds=1.3, peak=1500)], baseline, tolerance=0.2)
+        self.assertEqual(len(regressions), 2)
+        self.assertIn("bfs/queens-8: seconds 1 -> 1.3 (+30%)", regressions)
+        self.assertIn("bfs/queens-8: tracemalloc_peak_bytes 1000 -> 1500 (+50%)", regressions)
+        self.assertEqual(len(compare([make_result(seconds=1.15)], baseline, tolerance=0.1)), 1)
+
+    def test_min_seconds_noise_floor(self):
+        """Test wall times below `min_seconds` in both runs are ignored, but not once one run exceeds it."""
+        baseline = [make_result(seconds=0.001)]
+        self.assertEqual(compare([make_result(seconds=0.004)], baseline, min_seconds=0.005), [])
+        self.assertEqual(len(compare([make_result(seconds=0.006)], baseline, min_seconds=0.005)), 1)
+        self.assertEqual(len(compare([make_result(seconds=0.004)], baseline, min_seconds=0.001)), 1)
+
+    def test_counter_changes(self):
+        """Test any change of the node counters is reported, and cases new since the baseline are skipped."""
+        baseline = [make_result()]
+        self.assertEqual(compare([make_result(retrieved=99, expanded=91)], baseline),
+                         ["bfs/queens-8: nodes_retrieved changed 100 -> 99",
+                          "bfs/queens-8: nodes_expanded changed 90 -> 91"])
+        self.assertEqual(compare([make_result(), make_result(case="dfs/queens-8", retrieved=1)], baseline), [])
+
+    def test_missing_cases(self):
+        """Test baseline cases absent from the new results are reported, so a crashing case fails the gate."""
+        baseline = [make_result(), make_result(case="dfs/queens-8")]
+        self.assertEqual(compare([make_result()], baseline), ["dfs/queens-8: missing from the results"])
+        self.assertEqual(compare([], baseline), ["bfs/queens-8: missing from the results",
+                                                 "dfs/queens-8: missing from the results"])
+
+
+if __name__ == '__main__':
+    unittest.main()
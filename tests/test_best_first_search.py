@@ -0,0 +1,107 @@
+import unittest
+from algorithms import UniformCostSearch, GreedyBestFirstSearch, AStarSearch
+from problems.mock_problem import MockProblem
+from basic_test_problem import BasicTestProblem
+
+class BestFirstTestProblem(BasicTestProblem):
+
+    def setUp(self):
+        super().setUp()
+        # Weighted graph where the fewest-edges path (1-3-6) is not the cheapest (1-2-4-5-6)
+        self.weighted_problem = MockProblem(
+            transitions={
+                1: [(3, 5), (2, 1)],
+                2: [(4, 1), (3, 3)],
+                3: [(6, 5)],
+                4: [(5, 1)],
+                5: [(6, 1)]
+            },
+            initial_state_id=1,
+            goal_state_id=6
+        )
+        # Admissible estimate of the remaining cost to state 6
+        self.distances = {1: 4, 2: 3, 3: 5, 4: 2, 5: 1, 6: 0}
+        self.heuristic = lambda state: self.distances[state.id]
+
+
+class TestUniformCostSearch(BestFirstTestProblem):
+
+    def test_cheapest_path(self):
+        """Test UCS returns the goal through the cheapest path rather than the one with fewest edges."""
+        search = UniformCostSearch()
+        self.assertTrue(search.search(self.weighted_problem))
+        self.assertTrue(self.weighted_problem.is_goal(search.retrieve_result()))
+        self.assertEqual(search.result_cost, 4)
+
+    def test_stale_entries_are_skipped(self):
+        """Test a state pushed twice (cost 5, then 1 + 3) is only retrieved once."""
+        search = UniformCostSearch()
+        search.search(self.weighted_problem)
+        self.assertEqual(search.get_nodes_retrieved(), 6)
+        self.assertEqual(search.best_cost[MockProblem.State(3)], 4)
+
+    def test_no_path_to_goal(self):
+        """Test UCS exhausts the graph when there is no path to the goal."""
+        search = UniformCostSearch()
+        self.assertFalse(search.search(self.unreachable_goal_problem))
+        self.assertIsNone(search.retrieve_result())
+        self.assertEqual(search.get_nodes_retrieved(), 14)
+
+    def test_initial_state_is_goal(self):
+        """Test UCS when the initial state is the goal."""
+        search = UniformCostSearch()
+        self.assertTrue(search.search(self.initial_is_goal_problem))
+        self.assertEqual(search.retrieve_result(), self.initial_is_goal_problem.get_initial_state())
+        self.assertEqual(search.result_cost, 0.0)
+        self.assertEqual(search.get_nodes_expanded(), 0)
+
+    def test_retrieve_path(self):
+        """Test the parent links follow the cheapest path."""
+        search = UniformCostSearch()
+        search.search(self.weighted_problem)
+        self.assertEqual(search.retrieve_path(), ([2, 4, 5, 6], 4))
+        self.assertEqual(search.retrieve_path(MockProblem.State(3)), ([2, 3], 4))
+
+    def test_goal_test_policy(self):
+        """Test states are tested on retrieval, and other goal test policies are rejected rather than ignored."""
+        search = UniformCostSearch()
+        self.assertEqual(search.goal_test, "retrieval")
+        search.goal_test = "generation"
+        self.assertRaises(ValueError, search.search, self.weighted_problem)
+        self.assertRaises(ValueError, next, search.search_iter(self.weighted_problem))
+
+    def test_search_iter_cheapest_path(self):
+        """Test streaming UCS reports a goal once, through its cheapest path."""
+        problem = MockProblem(
+            transitions={1: [(2, 5), (3, 1)], 3: [(4, 1)], 4: [(2, 1)]},
+            initial_state_id=1,
+            goal_state_id=2
+        )
+        search = UniformCostSearch()
+        self.assertEqual(list(search.search_iter(problem, with_path=True)),
+                         [(MockProblem.State(2), ([3, 4, 2], 3))])
+
+
+class TestGreedyBestFirstSearch(BestFirstTestProblem):
+
+    def test_follows_heuristic(self):
+        """Test greedy search dives along the lowest estimates and may miss the cheapest path."""
+        search = GreedyBestFirstSearch(self.heuristic)
+        self.assertTrue(search.search(self.weighted_problem))
+        self.assertEqual(search.result_cost, 4)
+        self.assertEqual(search.get_nodes_retrieved(), 5)  # 1, 2, 4, 5, 6
+
+
+class TestAStarSearch(BestFirstTestProblem):
+
+    def test_cheapest_path(self):
+        """Test A* returns the cheapest goal while retrieving no more states than UCS."""
+        search = AStarSearch(self.heuristic)
+        self.assertTrue(search.search(self.weighted_problem))
+        self.assertEqual(search.result_cost, 4)
+        ucs = UniformCostSearch()
+        ucs.search(self.weighted_problem)
+        self.assertLessEqual(search.get_nodes_retrieved(), ucs.get_nodes_retrieved())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+from algorithms import BidirectionalSearch
+from problems.mock_problem import MockProblem
+from problems.eight_queens_problem import EightQueensProblem
+from basic_test_problem import BasicTestProblem
+
+class TestBidirectionalSearch(BasicTestProblem):
+
+    def setUp(self):
+        super().setUp()
+        self.search = BidirectionalSearch()
+
+    def test_single_path_to_goal(self):
+        """Test the frontiers meet after one expansion on each side."""
+        success = self.search.search(self.simple_problem)
+        self.assertTrue(success)
+        self.assertTrue(self.simple_problem.is_goal(self.search.retrieve_result()))
+        self.assertEqual(self.search.get_nodes_retrieved(), 2)
+        self.assertEqual(self.search.get_nodes_expanded(), 2)
+        self.assertEqual(self.search.meeting_state, MockProblem.State(3))
+        self.assertEqual(self.search.retrieve_path(), ([3, 8], 2))
+
+    def test_no_path_to_goal(self):
+        """Test the search stops once the goal side runs out of predecessors."""
+        success = self.search.search(self.unreachable_goal_problem)
+        self.assertFalse(success)
+        self.assertIsNone(self.search.retrieve_result())
+        self.assertIsNone(self.search.retrieve_path())
+        self.assertEqual(self.search.get_nodes_retrieved(), 2)
+
+    def test_long_path(self):
+        """Test a chain is explored from both ends and joined into a single path."""
+        problem = MockProblem(
+            transitions={i: [(i + 1, i)] for i in range(1, 8)},
+            initial_state_id=1,
+            goal_state_id=8
+        )
+        self.assertTrue(self.search.search(problem))
+        self.assertEqual(self.search.retrieve_path(), ([2, 3, 4, 5, 6, 7, 8], sum(range(1, 8))))
+        self.assertEqual(self.search.get_nodes_retrieved(), 7)  # 1, 8, 2, 7, 3, 6, 4
+
+    def test_initial_state_is_goal(self):
+        """Test the search when the initial state is the goal."""
+        success = self.search.search(self.initial_is_goal_problem)
+        self.assertTrue(success)
+        self.assertEqual(self.search.get_nodes_retrieved(), 0)
+        self.assertEqual(self.search.retrieve_path(), ([], 0.0))
+
+    def test_requires_predecessors(self):
+        """Test problems without the backward hooks are rejected."""
+        with self.assertRaises(ValueError):
+            self.search.search(EightQueensProblem(4))
+
+if __name__ == "__main__":
+    unittest.main()
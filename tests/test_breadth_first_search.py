@@ -1,7 +1,8 @@
 import unittest
 from algorithms import BreadthFirstSearch
 from problems.mock_problem import MockProblem
-from basic_test_problem import BasicTestProblem
+from problems.eight_queens_problem import EightQueensProblem
+from basic_test_problem import BasicTestProblem, PerActionQueensProblem, make_test_graph
 
 class TestBreadthFirstSearch(BasicTestProblem):
     
@@ -52,5 +53,125 @@ class TestBreadthFirstSearch(BasicTestProblem):
         self.assertEqual(bfs.get_nodes_retrieved(), 0)
         self.assertEqual(self.initial_is_goal_problem.discovered_transitions,[])
 
+    def test_batch_expansion_matches_per_action_path(self):
+        """Test the expand_batch path finds the same goal with the same counters as get_result."""
+        batched_problem = EightQueensProblem(6)
+        plain_problem = PerActionQueensProblem(6)
+        batched, plain = BreadthFirstSearch(), BreadthFirstSearch()
+        self.assertTrue(batched.search(batched_problem))
+        self.assertTrue(plain.search(plain_problem))
+        self.assertTrue(batched.use_batch)
+        self.assertEqual(batched.retrieve_result(), plain.retrieve_result())
+        self.assertEqual(batched.get_nodes_retrieved(), plain.get_nodes_retrieved())
+        self.assertEqual(batched.get_nodes_expanded(), plain.get_nodes_expanded())
+        self.assertFalse(plain.use_batch)
+
+    def test_retrieve_path(self):
+        """Test BFS records the actions and cumulative cost leading to the goal."""
+        bfs = BreadthFirstSearch()
+        bfs.search(self.simple_problem)
+        self.assertEqual(bfs.retrieve_path(), ([3, 8], 2))
+        bfs.search(self.initial_is_goal_problem)
+        self.assertEqual(bfs.retrieve_path(), ([], 0.0))
+        bfs.search(self.unreachable_goal_problem)
+        self.assertIsNone(bfs.retrieve_path())
+
+    def test_search_iter_yields_all_goals(self):
+        """Test streaming BFS yields every N-queens solution once, lazily and with paths."""
+        bfs = BreadthFirstSearch()
+        solutions = list(bfs.search_iter(EightQueensProblem(8, compact=True)))
+        self.assertEqual(len(solutions), 92)
+        self.assertEqual(len(set(solutions)), 92)
+        self.assertFalse(bfs.streaming)
+
+        bfs = BreadthFirstSearch()
+        stream = bfs.search_iter(self.multi_path_problem, with_path=True)
+        goal, path = next(stream)
+        self.assertEqual(path, ([3, 8], 2))
+        self.assertEqual(bfs.get_nodes_retrieved(), 3)  # Nothing was searched past the first goal
+        self.assertEqual(list(stream), [])  # State 8 is reached again from 4 but reported once
+
+    def test_search_iter_limit(self):
+        """Test streaming BFS stops after `limit` goals."""
+        bfs = BreadthFirstSearch()
+        solutions = list(bfs.search_iter(EightQueensProblem(6, compact=True), limit=2))
+        self.assertEqual(len(solutions), 2)
+        self.assertIsNone(bfs.retrieve_result())
+
+    def test_fused_loop_matches_template(self):
+        """Test the fused loop finds the same goal and path, with the same counters and problem calls."""
+        for reachable_goal in (True, False):
+            searches, problems = [], []
+            for fused in (True, False):
+                problem = make_test_graph(0.2, seed=1, reachable_goal=reachable_goal)
+                search = BreadthFirstSearch()
+                search.use_fused_loop = fused
+                self.assertEqual(search.search(problem), reachable_goal)
+                searches.append(search)
+                problems.append(problem)
+            fused, template = searches
+            self.assertEqual(fused.retrieve_path(), template.retrieve_path())
+            self.assertEqual(fused.parents, template.parents)
+            self.assertEqual((fused.get_nodes_retrieved(), fused.get_nodes_evaluated(), fused.get_nodes_expanded()),
+                             (template.get_nodes_retrieved(), template.get_nodes_evaluated(), template.get_nodes_expanded()))
+            self.assertEqual(problems[0].discovered_transitions, problems[1].discovered_transitions)
+
+    def test_goal_test_policies(self):
+        """Test every goal test policy finds the same goal and the counter matches the tests run."""
+        paths = {}
+        for policy in ("generation", "retrieval", "batch"):
+            problem = make_test_graph(0.3, seed=2)
+            calls = problem.goal_test_calls
+            search = BreadthFirstSearch()
+            search.goal_test = policy
+            self.assertTrue(search.search(problem))
+            paths[policy] = search.retrieve_path()
+            self.assertEqual(search.get_goal_tests(), len(calls))
+            self.assertEqual(len(calls), len(set(calls)), "A state was goal-tested twice")
+            if policy == "retrieval":
+                self.assertEqual(search.get_goal_tests(), search.get_nodes_retrieved())
+            else:
+                # Children already visited are skipped before their goal test
+                self.assertLess(search.get_goal_tests(), len(problem.discovered_transitions) + 1)
+        self.assertEqual(paths["retrieval"], paths["generation"])
+        self.assertEqual(paths["batch"], paths["generation"])
+
+        search = BreadthFirstSearch()
+        search.goal_test = "retrieval"
+        self.assertTrue(search.search(self.initial_is_goal_problem))
+        self.assertEqual((search.get_nodes_retrieved(), search.get_nodes_expanded()), (1, 0))
+        search.goal_test = "late"
+        self.assertRaises(ValueError, search.search, self.simple_problem)
+
+    def test_fused_loop_falls_back(self):
+        """Test subclasses that customize a template step, and searches with budgets, use the template loop."""
+        class CountingSearch(BreadthFirstSearch):
+            def evaluate_node(self):
+                super().evaluate_node()
+                self.evaluated.append(self.current_state)
+
+        search = CountingSearch()
+        search.evaluated = []
+        self.assertFalse(search.fused_loop())
+        search.search(self.simple_problem)
+        self.assertEqual(len(search.evaluated), search.get_nodes_evaluated())
+
+        class ParentLoggingSearch(BreadthFirstSearch):
+            def record_parent(self, state, parent, action, cost):
+                super().record_parent(state, parent, action, cost)
+                self.recorded.append(state)
+
+        search = ParentLoggingSearch()
+        search.recorded = []
+        self.assertFalse(search.fused_loop())
+        self.assertTrue(search.search(self.simple_problem))
+        self.assertTrue(search.recorded)
+        self.assertEqual(set(search.recorded), set(search.parents) - {search.initial_state})
+
+        budgeted = BreadthFirstSearch()
+        budgeted.fused_loop = lambda: self.fail("Budgets must use the managed loop")
+        self.assertTrue(budgeted.search(self.simple_problem, max_nodes=100))
+
+
 if __name__ == "__main__":
     unittest.main()
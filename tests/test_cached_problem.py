@@ -0,0 +1,104 @@
+import pickle
+import unittest
+from algorithms.breadth_first_search import BreadthFirstSearch
+from algorithms.iterative_deepening_search import IterativeDeepeningSearch
+from problems.cached_problem import CachedProblem
+from problems.eight_queens_problem import EightQueensProblem
+from problems.mock_problem import MockProblem
+
+
+def make_problem():
+    return MockProblem(
+        transitions={1: [(2, 1), (3, 1)], 2: [(4, 1)], 3: [(4, 1), (5, 1)], 4: [(6, 1)], 5: [(6, 1)]},
+        initial_state_id=1,
+        goal_state_id=6,
+    )
+
+
+class TestCachedProblem(unittest.TestCase):
+
+    def test_repeated_searches_hit_the_cache(self):
+        """Test a second search reuses every successor computed by the first one."""
+        inner = make_problem()
+        problem = CachedProblem(inner)
+        first = BreadthFirstSearch().search(problem)
+        calls = len(inner.discovered_transitions)
+        second = BreadthFirstSearch().search(problem)
+        self.assertEqual(first, second)
+        self.assertEqual(len(inner.discovered_transitions), calls, "Second search should not call get_result")
+        info = problem.cache_info()
+        self.assertGreater(info.hits, 0)
+        self.assertEqual(info.misses, calls + info.currsize)  # One get_actions miss per cached state
+
+    def test_iterative_deepening_reuses_passes(self):
+        """Test iterative deepening only computes each transition once across its passes."""
+        inner = make_problem()
+        problem = CachedProblem(inner)
+        IterativeDeepeningSearch().search(problem)
+        transitions = inner.discovered_transitions
+        self.assertEqual(len(transitions), len(set(transitions)))
+
+    def test_no_persist_clears_between_searches(self):
+        """Test persist=False starts each search with an empty cache."""
+        inner = make_problem()
+        problem = CachedProblem(inner, persist=False)
+        BreadthFirstSearch().search(problem)
+        calls = len(inner.discovered_transitions)
+        BreadthFirstSearch().search(problem)
+        self.assertEqual(len(inner.discovered_transitions), 2 * calls)
+
+    def test_reset_clears_without_persist(self):
+        """Test only `reset` clears a non-persistent cache, and never a persistent one."""
+        for persist in (False, True):
+            problem = CachedProblem(make_problem(), persist=persist)
+            problem.get_actions(problem.get_initial_state())
+            problem.get_initial_state()
+            self.assertEqual(problem.cache_info().currsize, 1)
+            problem.reset()
+            self.assertEqual(problem.cache_info().currsize, 0 if not persist else 1)
+
+    def test_lru_eviction(self):
+        """Test maxsize evicts the least recently used state first."""
+        inner = make_problem()
+        problem = CachedProblem(inner, maxsize=2)
+        states = [MockProblem.State(i) for i in (1, 2, 3)]
+        problem.get_actions(states[0])
+        problem.get_actions(states[1])
+        problem.get_actions(states[0])  # State 2 is now the least recently used
+        problem.get_actions(states[2])
+        self.assertEqual(list(problem.entries), [states[0], states[2]])
+        self.assertEqual(problem.cache_info().evictions, 1)
+
+    def test_memory_eviction(self):
+        """Test max_bytes bounds the estimated size of the cached entries."""
+        problem = CachedProblem(make_problem(), maxsize=None, max_bytes=3, sizeof=lambda state: 1)
+        BreadthFirstSearch().search(problem)
+        info = problem.cache_info()
+        self.assertLessEqual(info.nbytes, 3)
+        self.assertGreater(info.evictions, 0)
+
+    def test_hooks_are_delegated(self):
+        """Test optional hooks are delegated, except expand_batch which would bypass the cache."""
+        problem = CachedProblem(EightQueensProblem(board_dimension=4))
+        self.assertTrue(problem.implements("encode"))
+        self.assertFalse(problem.implements("expand_batch"))
+        self.assertFalse(problem.implements("iter_successors"))
+        self.assertFalse(problem.implements("get_goal_state"))
+        state = problem.get_result(problem.get_initial_state(), 1)[0]
+        self.assertEqual(problem.decode(problem.encode(state)), state)
+
+        mock = CachedProblem(make_problem())
+        self.assertTrue(mock.implements("get_predecessors"))
+        self.assertEqual(mock.get_goal_state(), MockProblem.State(6))
+
+    def test_pickle_drops_entries(self):
+        """Test pickling (e.g. for worker processes) leaves the cache behind."""
+        problem = CachedProblem(make_problem())
+        BreadthFirstSearch().search(problem)
+        copy = pickle.loads(pickle.dumps(problem))
+        self.assertEqual(copy.cache_info().currsize, 0)
+        self.assertGreater(problem.cache_info().currsize, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,8 @@
 import unittest
-from algorithms import DepthFirstSearch
+from algorithms import DepthFirstSearch, SearchObserver
 from problems.mock_problem import MockProblem
-from basic_test_problem import BasicTestProblem
+from problems.eight_queens_problem import EightQueensProblem
+from basic_test_problem import BasicTestProblem, PerActionQueensProblem, make_test_graph
     
 class TestDepthFirstSearch(BasicTestProblem):
     
@@ -52,5 +53,104 @@ class TestDepthFirstSearch(BasicTestProblem):
         self.assertEqual(self.search.get_nodes_retrieved(), 0)
         self.assertEqual(self.initial_is_goal_problem.discovered_transitions,[])
 
+    def test_batch_expansion_matches_per_action_path(self):
+        """Test the expand_batch path finds the same goal with the same counters as get_result."""
+        batched_problem = EightQueensProblem(6)
+        plain_problem = PerActionQueensProblem(6)
+        batched, plain = DepthFirstSearch(), DepthFirstSearch()
+        self.assertTrue(batched.search(batched_problem))
+        self.assertTrue(plain.search(plain_problem))
+        self.assertTrue(batched.use_batch)
+        self.assertEqual(batched.retrieve_result(), plain.retrieve_result())
+        self.assertEqual(batched.get_nodes_retrieved(), plain.get_nodes_retrieved())
+        self.assertEqual(batched.get_nodes_expanded(), plain.get_nodes_expanded())
+        self.assertFalse(plain.use_batch)
+
+    def test_batch_lookahead_window(self):
+        """Test a cache miss scans at most `batch_lookahead - 1` queued states, skipping cached ones."""
+        search = DepthFirstSearch()
+        search.batch_lookahead = 4
+        search.initialize(EightQueensProblem(6))
+        queued = [search.problem.get_result(search.initial_state, action)[0] for action in range(6)]
+        search.batch_cache = {id(state): (state,) for state in queued[1:3]}
+        scanned = []
+        upcoming = (scanned.append(state) or state for state in queued)
+        list(search.successors(search.initial_state, upcoming))
+        self.assertEqual(scanned, queued[:3])
+        self.assertIn(id(queued[0]), search.batch_cache)
+        self.assertNotIn(id(queued[3]), search.batch_cache)
+
+    def test_retrieve_path(self):
+        """Test DFS records the actions and cumulative cost leading to the goal."""
+        self.search.search(self.simple_problem)
+        self.assertEqual(self.search.retrieve_path(), ([3, 8], 2))
+        self.assertEqual(self.search.retrieve_path(MockProblem.State(12)), ([2, 5, 12], 3))
+
+    def test_search_iter_yields_all_goals(self):
+        """Test streaming DFS yields every N-queens solution, in depth-first order."""
+        solutions = [state.queens_positions for state in self.search.search_iter(EightQueensProblem(6, compact=True))]
+        self.assertEqual(solutions, [(1, 3, 5, 0, 2, 4), (2, 5, 1, 4, 0, 3), (3, 0, 4, 1, 5, 2), (4, 2, 0, 5, 3, 1)])
+
+    def test_fused_loop_matches_template(self):
+        """Test the fused loop finds the same goal and path, with the same counters and problem calls."""
+        for reachable_goal in (True, False):
+            searches, problems = [], []
+            for fused in (True, False):
+                problem = make_test_graph(0.2, seed=1, reachable_goal=reachable_goal)
+                search = DepthFirstSearch()
+                search.use_fused_loop = fused
+                self.assertEqual(search.search(problem), reachable_goal)
+                searches.append(search)
+                problems.append(problem)
+            fused, template = searches
+            self.assertEqual(fused.retrieve_path(), template.retrieve_path())
+            self.assertEqual(fused.parents, template.parents)
+            self.assertEqual((fused.get_nodes_retrieved(), fused.get_nodes_evaluated(), fused.get_nodes_expanded()),
+                             (template.get_nodes_retrieved(), template.get_nodes_evaluated(), template.get_nodes_expanded()))
+            self.assertEqual(problems[0].discovered_transitions, problems[1].discovered_transitions)
+
+    def test_goal_test_policies(self):
+        """Test DFS finds the same solution under every goal test policy, counting the tests run."""
+        for policy in ("generation", "retrieval", "batch"):
+            for lazy in (False, True):
+                search = DepthFirstSearch(lazy=lazy)
+                search.goal_test = policy
+                if lazy and policy == "batch":
+                    self.assertRaises(ValueError, search.search, EightQueensProblem(6, compact=True))
+                    continue
+                self.assertTrue(search.search(EightQueensProblem(6, compact=True)))
+                self.assertEqual(search.retrieve_result().queens_positions, (1, 3, 5, 0, 2, 4))
+                self.assertGreater(search.get_goal_tests(), 0)
+                if policy == "retrieval":
+                    self.assertEqual(search.get_goal_tests(), search.get_nodes_retrieved())
+
+    def test_lazy_backtracking(self):
+        """Test lazy DFS descends into each child before generating its siblings and keeps one
+        successor generator per state on the path."""
+        search = DepthFirstSearch(lazy=True)
+        frontier_sizes = []
+        observer = SearchObserver()
+        observer.on_node = lambda algorithm: frontier_sizes.append(algorithm.frontier_size())
+        search.add_observer(observer)
+        self.assertTrue(search.search(self.simple_problem))
+        self.assertEqual(search.retrieve_path(), ([3, 8], 2))
+        self.assertEqual(self.simple_problem.discovered_transitions,
+                         [(1, 2), (2, 5), (5, 11), (5, 12), (2, 6), (6, 13), (6, 14), (1, 3), (3, 7), (3, 8)])
+        self.assertLessEqual(max(frontier_sizes), 3)  # Depth of the deepest state expanded
+
+    def test_lazy_matches_eager(self):
+        """Test lazy DFS finds the same goals in the same order as the eager search."""
+        solutions = [state.queens_positions for state in
+                     DepthFirstSearch(lazy=True).search_iter(EightQueensProblem(6, compact=True))]
+        eager = [state.queens_positions for state in self.search.search_iter(EightQueensProblem(6, compact=True))]
+        self.assertEqual(solutions, eager)
+        for reachable_goal in (True, False):
+            problem = make_test_graph(0.2, seed=1, reachable_goal=reachable_goal)
+            lazy = DepthFirstSearch(lazy=True)
+            self.assertEqual(lazy.search(problem), reachable_goal)
+        self.assertTrue(DepthFirstSearch(lazy=True).search(self.initial_is_goal_problem))
+        self.assertFalse(DepthFirstSearch(lazy=True).search(self.unreachable_goal_problem))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+from algorithms import DepthLimitedSearch
+from problems.mock_problem import MockProblem
+from basic_test_problem import BasicTestProblem
+
+class TestDepthLimitedSearch(BasicTestProblem):
+
+    def setUp(self):
+        super().setUp()
+        self.search = DepthLimitedSearch(depth_limit=10)
+
+    def test_single_path_to_goal(self):
+        """Test DLS explores children in the same order as DFS."""
+        success = self.search.search(self.simple_problem)
+        self.assertTrue(success)
+        self.assertTrue(self.simple_problem.is_goal(self.search.retrieve_result()))
+        self.assertEqual(self.search.get_nodes_retrieved(), 9)
+        self.assertEqual(self.simple_problem.discovered_transitions,
+                         [(1,2), (1,3), (1,4), (2,5), (2,6), (5,11),
+                          (5,12), (6,13), (6,14), (3,7), (3,8)])
+
+    def test_no_path_to_goal(self):
+        """Test DLS exhausts the tree without a cutoff when the limit is deep enough."""
+        success = self.search.search(self.unreachable_goal_problem)
+        self.assertFalse(success)
+        self.assertIsNone(self.search.retrieve_result())
+        self.assertEqual(self.search.get_nodes_retrieved(), 14)
+        self.assertFalse(self.search.cutoff_occurred)
+
+    def test_depth_limit_cuts_off(self):
+        """Test states at the depth limit are not expanded."""
+        search = DepthLimitedSearch(depth_limit=1)
+        success = search.search(self.simple_problem)
+        self.assertFalse(success)
+        self.assertTrue(search.cutoff_occurred)
+        self.assertEqual(search.get_nodes_retrieved(), 4)
+        self.assertEqual(search.get_nodes_expanded(), 1)
+        self.assertEqual(self.simple_problem.discovered_transitions, [(1,2), (1,3), (1,4)])
+
+    def test_cutoff_without_probing_children(self):
+        """Test states at the limit set the cutoff without any successor call, even when they are leaves."""
+        class CountingProblem(MockProblem):
+            def get_actions(self, state):
+                self.action_calls += 1
+                return super().get_actions(state)
+
+        problem = CountingProblem(self.unreachable_goal_problem.transitions, initial_state_id=1, goal_state_id=15)
+        problem.action_calls = 0
+        search = DepthLimitedSearch(depth_limit=3)
+        self.assertFalse(search.search(problem))
+        self.assertTrue(search.cutoff_occurred)
+        self.assertEqual(problem.action_calls, search.get_nodes_expanded())
+
+    def test_goal_test_policy(self):
+        """Test goal tests other than on generation are rejected rather than ignored."""
+        for policy in ("retrieval", "batch"):
+            self.search.goal_test = policy
+            self.assertRaises(ValueError, self.search.search, self.simple_problem)
+
+    def test_cycles_only_checked_on_path(self):
+        """Test a cycle is not followed while a state reachable by two paths is explored twice."""
+        problem = MockProblem(
+            transitions={
+                1: [(2, 1), (3, 1)],
+                2: [(4, 1)],
+                3: [(4, 1)],
+                4: [(1, 1)]  # Cycle back to the initial state
+            },
+            initial_state_id=1,
+            goal_state_id=5
+        )
+        success = self.search.search(problem)
+        self.assertFalse(success)
+        self.assertEqual(self.search.get_nodes_retrieved(), 5)  # 1, 2, 4, 3, 4
+        self.assertEqual(problem.discovered_transitions, [(1,2), (1,3), (2,4), (4,1), (3,4), (4,1)])
+
+    def test_initial_state_is_goal(self):
+        """Test DLS when the initial state is the goal."""
+        success = self.search.search(self.initial_is_goal_problem)
+        self.assertTrue(success)
+        self.assertEqual(self.search.retrieve_result(), self.initial_is_goal_problem.get_initial_state())
+        self.assertEqual(self.search.get_nodes_retrieved(), 0)
+    def test_retrieve_path(self):
+        """Test DLS reads the solution path off the current path."""
+        self.search.search(self.simple_problem)
+        self.assertEqual(self.search.retrieve_path(), ([3, 8], 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
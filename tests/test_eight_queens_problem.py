@@ -66,6 +66,23 @@ class TestEightQueensProblem(unittest.TestCase):
         self.assertTrue(set(actions) == set(correct_actions))
 
 
+    def test_iter_successors(self):
+        """Test the lazy successors match get_actions / get_result and test columns only on demand."""
+        for compact in (False, True):
+            problem = EightQueensProblem(board_dimension=8, compact=compact)
+            state = problem.make_state([3, 6, 2])
+            expected = [(col, *problem.get_result(state, col)) for col in problem.get_actions(state)]
+            self.assertEqual(list(problem.iter_successors(state)), expected)
+
+        problem = EightQueensProblem(board_dimension=8)
+        checked = []
+        is_safe = problem._is_safe
+        problem._is_safe = lambda state, row, col: checked.append(col) or is_safe(state, row, col)
+        action, child, cost = next(problem.iter_successors(problem.get_initial_state()))
+        self.assertEqual((action, child.queens_positions, cost), (0, [0], 1.0))
+        self.assertEqual(checked, [0])
+        self.assertTrue(problem.implements("iter_successors"))
+
     def test_get_result(self):
         """Test get_result to ensure it produces a new state with an additional queen."""
         problem = EightQueensProblem(board_dimension=8)
@@ -89,6 +106,108 @@ class TestEightQueensProblem(unittest.TestCase):
         except ValueError:
             self.fail("State should not raise ValueError in non-strict mode")
 
+    def test_compact_state_validation(self):
+        """Test CompactState raises the same conflict errors as State in strict mode."""
+        for positions in ([0,0], [0,1], [1,0]):
+            with self.assertRaises(ValueError):
+                EightQueensProblem.CompactState(board_dimension=8, queens_positions=positions, strict=True)
+        state = EightQueensProblem.CompactState(board_dimension=8, queens_positions=[0,1], strict=False)
+        self.assertEqual(state.queens_positions, (0,1))
+
+    def test_compact_state_bulk_validation(self):
+        """Test long placements, validated with numpy, give the same masks and errors as short ones."""
+        n = 100
+        positions = list(range(1, n, 2)) + list(range(0, n, 2))  # Valid for n % 6 not in (2, 3)
+        state = EightQueensProblem.CompactState(board_dimension=n, queens_positions=positions)
+        expected = EightQueensProblem.CompactState(board_dimension=n)
+        for col in positions:
+            expected = expected.extend(col)
+        self.assertEqual((state.columns, state.main_diagonals, state.anti_diagonals),
+                         (expected.columns, expected.main_diagonals, expected.anti_diagonals))
+        with self.assertRaisesRegex(ValueError, "column"):
+            EightQueensProblem.CompactState(board_dimension=n, queens_positions=positions[:-1] + [1])
+        with self.assertRaisesRegex(ValueError, "main diagonal"):
+            EightQueensProblem.CompactState(board_dimension=n, queens_positions=list(range(n)))
+        with self.assertRaisesRegex(ValueError, "outside"):
+            EightQueensProblem.CompactState(board_dimension=n, queens_positions=positions[:-1] + [n])
+
+
+    def test_compact_state_matches_state(self):
+        """Test the compact problem produces the same actions and boards as the numpy-backed one."""
+        problem = EightQueensProblem(board_dimension=8)
+        compact_problem = EightQueensProblem(board_dimension=8, compact=True)
+        state = problem.get_initial_state()
+        compact_state = compact_problem.get_initial_state()
+        for col in self.SOLUTION:
+            self.assertEqual(compact_problem.get_actions(compact_state), problem.get_actions(state))
+            state, _ = problem.get_result(state, col)
+            compact_state, cost = compact_problem.get_result(compact_state, col)
+            self.assertEqual(cost, 1.0)
+            self.assertTrue((compact_state.board == state.board).all())
+        self.assertTrue(compact_problem.is_goal(compact_state))
+        self.assertEqual(compact_problem.get_actions(compact_state), [])
+
+
+    def test_compact_state_is_immutable(self):
+        """Test CompactState rejects attribute assignment and unsafe extensions."""
+        state = EightQueensProblem.CompactState(board_dimension=8, queens_positions=[3])
+        with self.assertRaises(AttributeError):
+            state.queens_positions = (4,)
+        with self.assertRaises(ValueError):
+            state.extend(4)  # Diagonal to the queen in row 0
+        self.assertFalse(state.board.flags.writeable)
+
+    def test_state_hashing(self):
+        """Test states with the same queen positions are equal and deduplicated in a set."""
+        for state_class in (EightQueensProblem.State, EightQueensProblem.CompactState):
+            first = state_class(board_dimension=8, queens_positions=[3,6,2])
+            second = state_class(board_dimension=8, queens_positions=[3,6,2])
+            other = state_class(board_dimension=8, queens_positions=[3,6,4])
+            self.assertEqual(first, second)
+            self.assertNotEqual(first, other)
+            self.assertEqual(len({first, second, other}), 2)
+
+
+    def test_symmetry_reduced_key(self):
+        """Test symmetric placements compare equal only when symmetry reduction is enabled."""
+        mirrored = [7 - col for col in self.SOLUTION]
+        rotated = [0] * 8  # Quarter turn clockwise: (row, col) -> (col, 7 - row)
+        for row, col in enumerate(self.SOLUTION):
+            rotated[col] = 7 - row
+        for state_class in (EightQueensProblem.State, EightQueensProblem.CompactState):
+            solution = state_class(board_dimension=8, queens_positions=self.SOLUTION, symmetry_reduced=True)
+            for positions in (mirrored, rotated):
+                self.assertEqual(solution, state_class(board_dimension=8, queens_positions=positions,
+                                                       symmetry_reduced=True))
+                self.assertNotEqual(state_class(board_dimension=8, queens_positions=self.SOLUTION),
+                                    state_class(board_dimension=8, queens_positions=positions))
+            self.assertEqual(state_class(board_dimension=8, queens_positions=[1,3], symmetry_reduced=True),
+                             state_class(board_dimension=8, queens_positions=[6,4], symmetry_reduced=True))
+
+    def test_encode_decode(self):
+        """Test encode pads empty rows and decode restores an equal state."""
+        problem = EightQueensProblem(board_dimension=8)
+        state = problem.State(board_dimension=8, queens_positions=[3,6,2])
+        encoding = problem.encode(state)
+        self.assertEqual(list(encoding), [3,6,2,8,8,8,8,8])
+        self.assertEqual(problem.decode(encoding), state)
+
+
+    def test_expand_batch(self):
+        """Test expand_batch returns the same children, in the same order, as get_actions/get_result."""
+        problem = EightQueensProblem(board_dimension=8)
+        states = [problem.State(board_dimension=8, queens_positions=positions)
+                  for positions in ([], [3,6,2], [0], self.SOLUTION, [3,6])]
+        parents, actions, children, costs = problem.expand_batch(states)
+
+        expected = [(index, action, problem.get_result(state, action)[0])
+                    for index, state in enumerate(states)
+                    for action in problem.get_actions(state)]
+        self.assertEqual(list(parents), [index for index, _, _ in expected])
+        self.assertEqual(list(actions), [action for _, action, _ in expected])
+        self.assertEqual([problem.decode(child) for child in children], [child for _, _, child in expected])
+        self.assertTrue((costs == 1.0).all())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,127 @@
+import os
+import tempfile
+import unittest
+from problems.eight_queens_problem import EightQueensProblem
+from problems.eight_queens_solvers import BacktrackingQueensSolver, MinConflictsQueensSolver, QueensSolutionCounter
+
+
+class TestBacktrackingQueensSolver(unittest.TestCase):
+    # Number of solutions for n = 1..10
+    SOLUTION_COUNTS = [1, 0, 0, 2, 10, 4, 40, 92, 352, 724]
+
+    def test_count_solutions(self):
+        """Test the bitmask counter matches the known N-queens solution counts."""
+        for n, expected in enumerate(self.SOLUTION_COUNTS, start=1):
+            solver = BacktrackingQueensSolver(EightQueensProblem(board_dimension=n))
+            self.assertEqual(solver.count_solutions(), expected, f"Wrong count for n={n}")
+
+    def test_solutions_are_distinct_and_valid(self):
+        """Test the MRV search enumerates every solution exactly once."""
+        problem = EightQueensProblem(board_dimension=6)
+        solutions = list(BacktrackingQueensSolver(problem).solutions())
+        self.assertEqual(len(solutions), 4)
+        self.assertEqual(len({tuple(state.queens_positions) for state in solutions}), 4)
+        self.assertTrue(all(problem.is_goal(state) for state in solutions))
+
+    def test_solve(self):
+        """Test solve returns a goal state of the problem's kind, or None when there is no solution."""
+        problem = EightQueensProblem(board_dimension=8)
+        state = BacktrackingQueensSolver(problem).solve()
+        self.assertIsInstance(state, EightQueensProblem.State)
+        self.assertTrue(problem.is_goal(state))
+
+        compact_problem = EightQueensProblem(board_dimension=100, compact=True)
+        state = BacktrackingQueensSolver(compact_problem).solve()
+        self.assertIsInstance(state, EightQueensProblem.CompactState)
+        self.assertTrue(compact_problem.is_goal(state))
+
+        for n in (2, 3):
+            self.assertIsNone(BacktrackingQueensSolver(EightQueensProblem(board_dimension=n)).solve())
+
+
+class TestQueensSolutionCounter(unittest.TestCase):
+    # Number of solutions distinct up to rotations and reflections for n = 1..10
+    UNIQUE_COUNTS = [1, 0, 0, 1, 2, 1, 6, 12, 46, 92]
+
+    def test_counts(self):
+        """Test the half-board counts, weighted by mirror orbit, match the known totals for any split."""
+        for split_rows in (1, 2, 3):
+            counter = QueensSolutionCounter(split_rows=split_rows)
+            for n, expected in enumerate(TestBacktrackingQueensSolver.SOLUTION_COUNTS, start=1):
+                self.assertEqual(counter.count(n), expected, f"Wrong count for n={n}")
+        self.assertEqual(QueensSolutionCounter().count(11), 2680)
+
+    def test_unique_counts(self):
+        """Test counting solutions up to the 8 board symmetries."""
+        counter = QueensSolutionCounter()
+        for n, expected in enumerate(self.UNIQUE_COUNTS, start=1):
+            self.assertEqual(counter.count(n, unique=True), expected, f"Wrong unique count for n={n}")
+
+    def test_parallel_count(self):
+        """Test subproblems counted in worker processes give the same total."""
+        self.assertEqual(QueensSolutionCounter(max_workers=2).count(9), 352)
+
+    def test_cache(self):
+        """Test subproblem counts are written per n and split, and reused instead of recounted."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            counter = QueensSolutionCounter(cache_dir=cache_dir)
+            saves = []
+            save = counter._save
+            counter._save = lambda n, cache: saves.append(n) or save(n, cache)
+            self.assertEqual(counter.count(8), 92)
+            self.assertEqual(saves, [8])  # Fast runs are saved once, at the end
+            self.assertTrue(os.path.exists(os.path.join(cache_dir, "queens_8_split2.json")))
+            counter.count(8, unique=True)  # Fills in the orbit sums of the cached subproblems
+
+            cached = QueensSolutionCounter(cache_dir=cache_dir)
+            cached._run = lambda n, prefixes, unique: self.fail("Cached subproblems were recounted")
+            self.assertEqual(cached.count(8), 92)
+            self.assertEqual(cached.count(8, unique=True), 12)
+
+            resplit = QueensSolutionCounter(cache_dir=cache_dir, split_rows=3)
+            self.assertEqual(resplit.count(8), 92)
+            self.assertTrue(os.path.exists(os.path.join(cache_dir, "queens_8_split3.json")))
+
+    def test_sample(self):
+        """Test samples are distinct valid solutions, reproducible with a seed."""
+        counter = QueensSolutionCounter()
+        problem = EightQueensProblem(board_dimension=8)
+        samples = counter.sample(8, 20, seed=3)
+        self.assertEqual(len({tuple(positions) for positions in samples}), 20)
+        self.assertTrue(all(problem.is_goal(problem.make_state(positions)) for positions in samples))
+        self.assertEqual(counter.sample(8, 20, seed=3), samples)
+        self.assertEqual(len(counter.sample(6, 4)), 4)
+        self.assertRaises(ValueError, counter.sample, 6, 5)
+        self.assertEqual(counter.sample(0, 1), [[]])  # Like count(0), the empty board has one solution
+        self.assertRaises(ValueError, counter.sample, 0, 2)
+
+
+class TestMinConflictsQueensSolver(unittest.TestCase):
+
+    def test_small_boards(self):
+        """Test small solvable boards are solved and unsolvable ones return None."""
+        for n in (1, 4, 5, 8, 10):
+            problem = EightQueensProblem(board_dimension=n)
+            state = MinConflictsQueensSolver(problem, seed=n).solve()
+            self.assertTrue(problem.is_goal(state), f"No solution for n={n}")
+        for n in (2, 3):
+            self.assertIsNone(MinConflictsQueensSolver(EightQueensProblem(board_dimension=n), seed=0).solve())
+
+    def test_large_board(self):
+        """Test a board far beyond tree search is solved into a valid (strictly checked) CompactState."""
+        problem = EightQueensProblem(board_dimension=5000, compact=True)
+        state = MinConflictsQueensSolver(problem, seed=0).solve()
+        self.assertIsInstance(state, EightQueensProblem.CompactState)
+        self.assertTrue(problem.is_goal(state))
+        self.assertEqual(sorted(state.queens_positions), list(range(5000)))
+
+    def test_seed_is_deterministic(self):
+        """Test the same seed reproduces the same solution."""
+        problem = EightQueensProblem(board_dimension=200, compact=True)
+        first = MinConflictsQueensSolver(problem, seed=3).solve_positions()
+        second = MinConflictsQueensSolver(problem, seed=3).solve_positions()
+        self.assertEqual(first, second)
+
+
+if __name__ == '__main__':
+    unittest.main()
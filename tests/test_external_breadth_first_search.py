@@ -0,0 +1,114 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from algorithms import BreadthFirstSearch, ExternalBreadthFirstSearch
+from algorithms.external_breadth_first_search import merge_unique
+from problems.mock_problem import MockProblem
+from problems.eight_queens_problem import EightQueensProblem
+from basic_test_problem import BasicTestProblem, make_test_graph
+
+class TestExternalBreadthFirstSearch(BasicTestProblem):
+
+    def setUp(self):
+        super().setUp()
+        # A 16-byte budget holds two int64 encodings, so every layer spills several runs
+        self.search = ExternalBreadthFirstSearch(ram_budget=16)
+
+    def test_single_path_to_goal(self):
+        """Test the external search finds the goal like BFS."""
+        success = self.search.search(self.simple_problem)
+        self.assertTrue(success)
+        self.assertTrue(self.simple_problem.is_goal(self.search.retrieve_result()))
+        self.assertEqual(self.search.get_nodes_retrieved(), 4)  # Goals are tested when their layer is closed
+
+    def test_no_path_to_goal(self):
+        """Test the external search exhausts the graph like BFS."""
+        success = self.search.search(self.unreachable_goal_problem)
+        self.assertFalse(success)
+        self.assertIsNone(self.search.retrieve_result())
+        self.assertEqual(self.search.get_nodes_retrieved(), 14)
+
+    def test_duplicates_detected_on_disk(self):
+        """Test states reached through several paths or cycles are expanded only once."""
+        problem = MockProblem(
+            transitions={
+                1: [(2, 1), (3, 1), (4, 1)],
+                2: [(5, 1), (3, 1), (1, 1)],
+                3: [(5, 1), (6, 1)],
+                4: [(6, 1), (5, 1), (2, 1)],
+                5: [(7, 1)],
+                6: [(7, 1), (1, 1)],
+            },
+            initial_state_id=1,
+            goal_state_id=8
+        )
+        self.assertFalse(self.search.search(problem))
+        self.assertEqual(self.search.get_nodes_retrieved(), 7)
+        self.assertEqual(self.search.get_goal_tests(), 7)  # Duplicates are dropped before their goal test
+
+    def test_workdir_segments(self):
+        """Test segment files are written to a given working directory and kept there."""
+        with tempfile.TemporaryDirectory() as directory:
+            search = ExternalBreadthFirstSearch(workdir=directory, ram_budget=16)
+            search.search(self.unreachable_goal_problem)
+            self.assertEqual(search.visited_size(), 14)
+            self.assertIn(os.path.basename(search.visited_path), os.listdir(directory))
+
+    def test_workdir_keeps_only_frontier_and_visited(self):
+        """Test consumed layers and runs are deleted, leaving the last layer and the visited file."""
+        with tempfile.TemporaryDirectory() as directory:
+            search = ExternalBreadthFirstSearch(workdir=directory, ram_budget=16)
+            self.assertTrue(search.search(EightQueensProblem(8, compact=True)))
+            self.assertEqual(sorted(os.listdir(directory)),
+                             sorted([os.path.basename(search.layer_path), os.path.basename(search.visited_path)]))
+            self.assertEqual(search.visited_path, os.path.join(directory, "visited.bin"))
+            self.assertEqual(len(search.visited_runs), 9)  # One appended run per layer
+
+    def test_chunked_merge_matches_bfs(self):
+        """Test merging runs a few records at a time reaches exactly the states BFS reaches."""
+        bfs = BreadthFirstSearch()
+        self.assertFalse(bfs.search(make_test_graph(0.3, seed=2, reachable_goal=False)))
+        search = ExternalBreadthFirstSearch(ram_budget=64, read_chunk=3)
+        self.assertFalse(search.search(make_test_graph(0.3, seed=2, reachable_goal=False)))
+        self.assertEqual(search.visited_size(), len(bfs.visited | {bfs.initial_state}))
+        self.assertEqual(search.get_nodes_retrieved(), bfs.get_nodes_retrieved())
+        self.assertEqual(search.get_goal_tests(), search.visited_size())
+
+    def test_merge_unique(self):
+        """Test the chunked merge emits sorted, non-overlapping chunks of the distinct records."""
+        dtype = np.dtype((np.void, 2))
+        rng = np.random.default_rng(0)
+        runs = [np.unique(rng.integers(0, 50, size=(n, 2), dtype=np.uint8).view(dtype).ravel())
+                for n in (40, 5, 0, 25)]
+        chunks = list(merge_unique(runs, 4))
+        merged = np.concatenate(chunks)
+        self.assertTrue(np.array_equal(merged, np.unique(np.concatenate(runs))))
+        self.assertTrue(all(0 < len(chunk) <= 12 for chunk in chunks))
+
+    def test_buffer_fits_ram_budget(self):
+        """Test children are buffered in one preallocated array no larger than the RAM budget."""
+        search = ExternalBreadthFirstSearch(ram_budget=100)
+        self.assertTrue(search.search(EightQueensProblem(6, compact=True)))  # 6-byte uint8 encodings
+        self.assertEqual(search.buffer.shape, (16, 6))
+        self.assertLessEqual(search.buffer.nbytes, 100)
+
+    def test_eight_queens(self):
+        """Test the external search solves N-queens with uint8 encodings."""
+        problem = EightQueensProblem(6, compact=True)
+        self.assertTrue(self.search.search(problem))
+        self.assertTrue(problem.is_goal(self.search.retrieve_result()))
+
+    def test_goal_test_policy(self):
+        """Test new states are tested in batches, and other goal test policies are rejected rather than ignored."""
+        for policy in ("generation", "retrieval"):
+            self.search.goal_test = policy
+            self.assertRaises(ValueError, self.search.search, self.simple_problem)
+
+    def test_initial_state_is_goal(self):
+        """Test the external search when the initial state is the goal."""
+        self.assertTrue(self.search.search(self.initial_is_goal_problem))
+        self.assertEqual(self.search.get_nodes_retrieved(), 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+import numpy as np
+from algorithms import EncodedQueue
+from problems.mock_problem import MockProblem
+from basic_test_problem import BasicTestProblem
+
+class TestEncodedQueue(BasicTestProblem):
+
+    def make_queue(self, initial_capacity=4):
+        return EncodedQueue(lambda state_id: np.array([state_id], dtype=np.int64),
+                            lambda encoding: int(encoding[0]), initial_capacity)
+
+    def test_fifo_and_lifo_order(self):
+        """Test popleft returns states in insertion order and pop in reverse order."""
+        queue = self.make_queue()
+        queue.extend(range(10))
+        self.assertEqual(len(queue), 10)
+        self.assertEqual([queue.popleft() for _ in range(3)], [0, 1, 2])
+        self.assertEqual([queue.pop() for _ in range(3)], [9, 8, 7])
+        self.assertEqual(list(queue), [3, 4, 5, 6])
+        self.assertEqual(list(reversed(queue)), [6, 5, 4, 3])
+
+    def test_wraparound_and_growth(self):
+        """Test the ring buffer keeps the order when it wraps around and when it grows while wrapped."""
+        queue = self.make_queue(initial_capacity=4)
+        queue.extend([0, 1, 2])
+        queue.popleft()
+        queue.popleft()
+        queue.extend([3, 4, 5])  # Wraps around the end of the buffer
+        self.assertEqual(len(queue.buffer), 4)
+        queue.extend([6, 7])  # Grows while wrapped
+        self.assertEqual(len(queue.buffer), 8)
+        self.assertEqual(list(queue), [2, 3, 4, 5, 6, 7])
+        self.assertEqual(queue.memory_usage(), 8 * 8)
+
+    def test_empty_queue(self):
+        """Test popping an empty queue raises IndexError, as with a deque, and clear empties it."""
+        queue = self.make_queue()
+        self.assertFalse(queue)
+        self.assertRaises(IndexError, queue.popleft)
+        queue.extend([1, 2])
+        queue.clear()
+        self.assertRaises(IndexError, queue.pop)
+        self.assertEqual(queue.memory_usage(), 4 * 8)
+
+    def test_decoded_states(self):
+        """Test states are rebuilt with the problem's decode."""
+        problem = MockProblem({0: [(1, 1.0)]}, 0, 1)
+        queue = EncodedQueue(problem.encode, problem.decode)
+        queue.append(MockProblem.State(5))
+        self.assertEqual(queue.popleft(), MockProblem.State(5))
+
+if __name__ == "__main__":
+    unittest.main()
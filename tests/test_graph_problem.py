@@ -0,0 +1,120 @@
+import os
+import pickle
+import tempfile
+import unittest
+import numpy as np
+from algorithms import BreadthFirstSearch, DepthFirstSearch, UniformCostSearch, BidirectionalSearch, BitmapVisitedSet
+from problems.graph_problem import GraphProblem
+from problems.mock_problem import MockProblem
+
+TRANSITIONS = {
+    0: [(1, 4), (2, 1)],
+    1: [(3, 1)],
+    2: [(1, 1), (4, 5)],
+    3: [(5, 1)],
+    4: [(5, 1)],
+    5: [(0, 2)],
+}
+
+
+class TestGraphProblem(unittest.TestCase):
+
+    def setUp(self):
+        self.problem = GraphProblem.from_transitions(TRANSITIONS, initial_state=0, goal_states=[5])
+
+    def test_goal_batch(self):
+        """Test batched goal tests of children go through the vectorized `is_goal_batch`."""
+        self.assertEqual(self.problem.is_goal_batch([5, 0, 5, 3]).tolist(), [True, False, True, False])
+        search = BreadthFirstSearch()
+        search.goal_test = "batch"
+        is_goal, calls = self.problem.is_goal, []
+        self.problem.is_goal = lambda state: calls.append(state) or is_goal(state)
+        self.assertTrue(search.search(self.problem))
+        self.assertEqual(search.retrieve_path(), ([0, 2, 5], 6.0))
+        self.assertEqual(calls, [0])  # Only the initial state is tested on its own
+        self.assertEqual(search.get_goal_tests(), 6)  # 0, then the new children 1 and 2, 3, 4 and 5
+
+    def test_csr_layout(self):
+        """Test edges are grouped per source in their original order, and actions are edge ids."""
+        self.assertEqual(self.problem.offsets.tolist(), [0, 2, 3, 5, 6, 7, 8])
+        self.assertEqual(self.problem.targets.tolist(), [1, 2, 3, 1, 4, 5, 5, 0])
+        self.assertEqual(list(self.problem.get_actions(2)), [3, 4])
+        self.assertEqual(self.problem.get_result(2, 4), (4, 5.0))
+        with self.assertRaises(ValueError):
+            self.problem.get_result(2, 0)  # Edge 0 leaves state 0
+
+    def test_from_edges_validates_ids(self):
+        """Test edges leaving or reaching states outside the graph are rejected when it is built."""
+        with self.assertRaisesRegex(ValueError, "targets"):
+            GraphProblem.from_edges(3, [0, 1], [1, 3])
+        with self.assertRaisesRegex(ValueError, "sources"):
+            GraphProblem.from_edges(3, [0, -1], [1, 2])
+        with self.assertRaisesRegex(ValueError, "one entry per edge"):
+            GraphProblem.from_edges(3, [0, 1], [1])
+        self.assertEqual(GraphProblem.from_edges(3, [], []).num_states, 3)
+
+    def test_searches_match_mock_problem(self):
+        """Test searches over the CSR graph find the same goals and paths as over the MockProblem graph."""
+        for algorithm_class in (BreadthFirstSearch, DepthFirstSearch, UniformCostSearch):
+            mock = algorithm_class()
+            mock.search(MockProblem(TRANSITIONS, initial_state_id=0, goal_state_id=5))
+            graph = algorithm_class()
+            self.assertTrue(graph.search(self.problem))
+            self.assertEqual(graph.retrieve_result(), 5)
+            actions, cost = graph.retrieve_path()
+            self.assertEqual(cost, mock.retrieve_path()[1])
+            self.assertEqual([int(self.problem.targets[edge]) for edge in actions], mock.retrieve_path()[0])
+
+    def test_bitmap_visited_and_batch_expansion(self):
+        """Test BFS with a bitmap visited store matches the default search, with and without expand_batch."""
+        plain = BreadthFirstSearch()
+        plain.use_batch = False
+        plain.search(self.problem)
+        for batch_lookahead in (1, 256):
+            search = BreadthFirstSearch(visited=BitmapVisitedSet)
+            search.batch_lookahead = batch_lookahead
+            self.assertTrue(search.search(self.problem))
+            self.assertTrue(search.use_batch)
+            self.assertEqual(search.retrieve_path(), plain.retrieve_path())
+            self.assertEqual(search.nodes_expanded, plain.nodes_expanded)
+
+    def test_expand_batch(self):
+        """Test expand_batch lists the same edges as get_actions/get_result, grouped by parent."""
+        parents, actions, children, costs = self.problem.expand_batch([2, 0, 5])
+        self.assertEqual(parents.tolist(), [0, 0, 1, 1, 2])
+        self.assertEqual(actions.tolist(), [3, 4, 0, 1, 7])
+        self.assertEqual([self.problem.decode(child) for child in children], [1, 4, 1, 2, 0])
+        self.assertEqual(costs.tolist(), [1.0, 5.0, 4.0, 1.0, 2.0])
+
+    def test_predecessors(self):
+        """Test the reverse index inverts every edge, so bidirectional search can run on the graph."""
+        predecessors = self.problem.get_predecessors(1)
+        self.assertEqual(predecessors, [(0, 0, 4.0), (2, 3, 1.0)])
+        for source, edge, cost in predecessors:
+            self.assertEqual(self.problem.get_result(source, edge), (1, cost))
+        self.assertEqual(self.problem.get_goal_state(), 5)
+        search = BidirectionalSearch()
+        self.assertTrue(search.search(self.problem))
+        self.assertEqual(len(search.retrieve_path()[0]), 3)
+
+    def test_save_and_load(self):
+        """Test a saved graph loads memory-mapped and pickles by path rather than by content."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "graph")
+            self.problem.save(path)
+            loaded = GraphProblem.load(path)
+            self.assertIsInstance(loaded.targets, np.memmap)
+            self.assertEqual(loaded.goal_states, {5})
+            data = pickle.dumps(loaded)
+            self.assertLess(len(data), 1000)
+            copy = pickle.loads(data)
+            self.assertEqual(copy.targets.tolist(), self.problem.targets.tolist())
+            search = BreadthFirstSearch()
+            self.assertTrue(search.search(copy))
+            in_memory = GraphProblem.load(path, mmap=False)
+            self.assertNotIsInstance(in_memory.targets, np.memmap)
+            del loaded, copy, in_memory, search
+
+
+if __name__ == '__main__':
+    unittest.main()
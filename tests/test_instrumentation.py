@@ -0,0 +1,77 @@
+import unittest
+from algorithms import BreadthFirstSearch, DepthLimitedSearch, PhaseProfiler, SearchObserver
+from problems.eight_queens_problem import EightQueensProblem
+from basic_test_problem import BasicTestProblem
+
+class RecordingObserver(SearchObserver):
+
+    def __init__(self):
+        self.events = []
+
+    def on_search_start(self, algorithm):
+        self.events.append("start")
+
+    def on_node(self, algorithm):
+        self.events.append(algorithm.frontier_size())
+
+    def on_search_end(self, algorithm):
+        self.events.append("end")
+
+
+class TestInstrumentation(BasicTestProblem):
+
+    def test_profiler_counts_phases(self):
+        """Test the profiler sees every loop phase and every problem call of a BFS run."""
+        bfs = BreadthFirstSearch()
+        profiler = PhaseProfiler(sample_every=2)
+        bfs.add_observer(profiler)
+        self.assertTrue(bfs.search(self.simple_problem))
+        self.assertEqual(bfs.get_nodes_retrieved(), 3)
+        self.assertEqual(profiler.phase_calls["retrieve"], 3)
+        self.assertEqual(profiler.phase_calls["expand"], 3)
+        self.assertEqual(profiler.phase_calls["get_actions"], 3)
+        self.assertEqual(profiler.phase_calls["get_result"], 7)
+        self.assertEqual(profiler.phase_calls["is_goal"], 8)  # Initial state and 7 children
+        self.assertEqual(len(profiler.samples), 2)  # After node 2 and at the end
+        self.assertEqual(profiler.samples[-1][1:4], (3, 4, 6))
+        self.assertIn("algorithm (self)", profiler.report())
+
+    def test_profiler_times_lazy_successors(self):
+        """Test each step of a problem's own `iter_successors` is timed in place of get_actions / get_result."""
+        bfs = BreadthFirstSearch()
+        profiler = PhaseProfiler()
+        bfs.add_observer(profiler)
+        self.assertTrue(bfs.search(EightQueensProblem(4, compact=True)))
+        self.assertNotIn("get_actions", profiler.phase_calls)
+        # One step per child plus the final one per expanded state, which ends the generator
+        self.assertGreaterEqual(profiler.phase_calls["iter_successors"], bfs.get_nodes_expanded())
+        # Successor time is problem time, not the algorithm's own
+        self.assertAlmostEqual(profiler.problem_seconds(),
+                               profiler.phase_seconds["iter_successors"] + profiler.phase_seconds["is_goal"])
+        loop_seconds = sum(profiler.phase_seconds[phase] for phase in ("retrieve", "evaluate", "expand"))
+        report = {line.split()[0]: line.split() for line in profiler.report().splitlines()[1:]}
+        self.assertEqual(int(report["iter_successors"][1]), profiler.phase_calls["iter_successors"])
+        self.assertAlmostEqual(float(report["algorithm"][2]), loop_seconds - profiler.problem_seconds(), places=4)
+
+    def test_observer_callbacks(self):
+        """Test observers are notified around the search and after each node."""
+        search = DepthLimitedSearch(depth_limit=10)
+        observer = RecordingObserver()
+        search.add_observer(observer)
+        search.search(self.simple_problem)
+        self.assertEqual(observer.events, ["start", 3, 4, 5, 4, 3, 4, 3, 2, 1, "end"])
+
+    def test_same_result_without_observers(self):
+        """Test removing the observer restores the bare loop with identical results."""
+        bfs = BreadthFirstSearch()
+        observer = SearchObserver()
+        bfs.add_observer(observer)
+        bfs.search(self.multi_path_problem)
+        observed_path = bfs.retrieve_path()
+        bfs.remove_observer(observer)
+        bfs.search(self.multi_path_problem)
+        self.assertEqual(bfs.retrieve_path(), observed_path)
+        self.assertIs(bfs.problem, self.multi_path_problem)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from algorithms import IterativeDeepeningSearch
+from problems.eight_queens_problem import EightQueensProblem
+from basic_test_problem import BasicTestProblem
+
+class TestIterativeDeepeningSearch(BasicTestProblem):
+
+    def setUp(self):
+        super().setUp()
+        self.search = IterativeDeepeningSearch()
+
+    def test_single_path_to_goal(self):
+        """Test IDS deepens until the goal is generated, accumulating counters over passes."""
+        success = self.search.search(self.simple_problem)
+        self.assertTrue(success)
+        self.assertTrue(self.simple_problem.is_goal(self.search.retrieve_result()))
+        self.assertEqual(self.search.depth_limit, 2)
+        self.assertEqual(self.search.get_nodes_retrieved(), 1 + 4 + 5)
+
+    def test_no_path_to_goal(self):
+        """Test IDS stops once a pass finishes without cutting off any state."""
+        success = self.search.search(self.unreachable_goal_problem)
+        self.assertFalse(success)
+        self.assertIsNone(self.search.retrieve_result())
+        # The leaves at depth 3 count as a cutoff, so the pass with limit 4 is the first one without
+        self.assertEqual(self.search.depth_limit, 4)
+
+    def test_max_depth(self):
+        """Test IDS gives up after the pass with the maximum depth limit."""
+        search = IterativeDeepeningSearch(max_depth=1)
+        self.assertFalse(search.search(self.simple_problem))
+        self.assertEqual(search.depth_limit, 1)
+
+    def test_initial_state_is_goal(self):
+        """Test IDS when the initial state is the goal."""
+        success = self.search.search(self.initial_is_goal_problem)
+        self.assertTrue(success)
+        self.assertEqual(self.search.get_nodes_retrieved(), 0)
+
+    def test_eight_queens(self):
+        """Test IDS finds a complete N-queens placement."""
+        problem = EightQueensProblem(6, compact=True)
+        self.assertTrue(self.search.search(problem))
+        self.assertTrue(problem.is_goal(self.search.retrieve_result()))
+    def test_search_iter_reports_each_goal_once(self):
+        """Test streaming IDS does not report goals again in deeper passes."""
+        problem = EightQueensProblem(6, compact=True)
+        solutions = list(self.search.search_iter(problem))
+        self.assertEqual(len(solutions), 4)
+        self.assertEqual(list(self.search.search_iter(self.multi_path_problem)), [self.multi_path_problem.goal_state] * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import time
+import unittest
+from algorithms import MonteCarloTreeSearch, SearchObserver
+from problems.eight_queens_problem import EightQueensProblem
+from problems.mock_problem import MockProblem
+
+
+class TestMonteCarloTreeSearch(unittest.TestCase):
+
+    def test_finds_queens_solution(self):
+        """Test MCTS finds an N-queens solution whose path replays to it."""
+        problem = EightQueensProblem(8, compact=True)
+        search = MonteCarloTreeSearch(iterations=2000, seed=0)
+        self.assertTrue(search.search(problem))
+        self.assertTrue(problem.is_goal(search.retrieve_result()))
+        state = problem.get_initial_state()
+        actions, cost = search.retrieve_path()
+        for action in actions:
+            state, _ = problem.get_result(state, action)
+        self.assertEqual(state, search.retrieve_result())
+        self.assertEqual(cost, 8.0)
+        self.assertLessEqual(search.get_nodes_retrieved(), 2000)
+
+    def test_exhausted_tree(self):
+        """Test a space without goals is exhausted and marked dead before the iteration budget."""
+        search = MonteCarloTreeSearch(iterations=1000, seed=0)
+        self.assertFalse(search.search(EightQueensProblem(3, compact=True)))
+        self.assertTrue(search.dead[0])
+        self.assertLess(search.get_nodes_retrieved(), 1000)
+        self.assertIsNone(search.retrieve_path())
+
+    def test_keeps_cheapest_goal(self):
+        """Test that without stop_on_goal the search keeps the cheapest path found to the goal."""
+        problem = MockProblem({1: [(3, 5), (2, 1)], 2: [(4, 1)], 3: [(4, 1)]}, initial_state_id=1, goal_state_id=4)
+        search = MonteCarloTreeSearch(iterations=50, stop_on_goal=False, seed=0)
+        self.assertTrue(search.search(problem))
+        self.assertEqual(search.retrieve_path(), ([2, 4], 2.0))
+        self.assertEqual(search.get_nodes_retrieved(), 50)
+
+    def test_goal_test_policy(self):
+        """Test goal tests other than of the selected state are rejected rather than ignored."""
+        search = MonteCarloTreeSearch(iterations=10, seed=0)
+        search.goal_test = "generation"
+        self.assertRaises(ValueError, search.search, EightQueensProblem(4, compact=True))
+
+    def test_root_statistics_and_pool_growth(self):
+        """Test the node pool grows past its capacity and the root statistics favour solvable moves."""
+        search = MonteCarloTreeSearch(iterations=3000, stop_on_goal=False, seed=0, capacity=4)
+        search.search(EightQueensProblem(6, compact=True))
+        self.assertGreater(search.size, 4)
+        self.assertEqual(len(search.visits), len(search.dead))
+        statistics = search.root_statistics()
+        self.assertEqual([action for action, _, _ in statistics], list(range(6)))
+        # Every iteration but the first (which expanded the root) went through a root child
+        self.assertEqual(sum(visits for _, visits, _ in statistics), search.visits[0] - 1)
+        self.assertIn(search.best_action(), (1, 2, 3, 4))  # First queen columns of the 6-queens solutions
+
+    def test_time_limit(self):
+        """Test the time limit stops an unbounded search."""
+        search = MonteCarloTreeSearch(iterations=None, time_limit=0.05, stop_on_goal=False, seed=0)
+        start = time.perf_counter()
+        search.search(EightQueensProblem(30, compact=True))
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertGreater(search.get_nodes_retrieved(), 0)
+
+    def test_root_parallel(self):
+        """Test root-parallel search merges the root statistics of every worker tree."""
+        search = MonteCarloTreeSearch(iterations=100, stop_on_goal=False, seed=0, root_workers=2)
+        self.assertTrue(search.search(EightQueensProblem(6, compact=True)))
+        self.assertEqual(search.get_nodes_retrieved(), 200)
+        self.assertEqual(sum(visits for _, visits, _ in search.root_statistics()), 198)  # 99 per tree
+        self.assertEqual(search.visits[0], 198)
+
+    def test_root_parallel_seeds_and_budgets(self):
+        """Test worker seeds come from the search's generator and budgets or observers are rejected."""
+        problem = EightQueensProblem(6, compact=True)
+        seeds = []
+        for seed in (0, 0, None, None):
+            search = MonteCarloTreeSearch(seed=seed, root_workers=2)
+            search.initialize(problem)
+            seeds.append(search.worker_seeds())
+        self.assertEqual(seeds[0], seeds[1])
+        self.assertNotEqual(seeds[2], seeds[3])
+        self.assertEqual(len(set(seeds[2])), 2)
+
+        search = MonteCarloTreeSearch(iterations=10, root_workers=2)
+        self.assertRaises(ValueError, search.search, problem, max_nodes=5)
+        search.add_observer(SearchObserver())
+        self.assertRaises(ValueError, search.search, problem)
+
+
+if __name__ == '__main__':
+    unittest.main()
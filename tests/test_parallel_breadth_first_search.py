@@ -0,0 +1,62 @@
+import unittest
+from algorithms import BreadthFirstSearch, ParallelBreadthFirstSearch
+from problems.eight_queens_problem import EightQueensProblem
+from basic_test_problem import BasicTestProblem, make_test_graph
+
+class TestParallelBreadthFirstSearch(BasicTestProblem):
+
+    def setUp(self):
+        super().setUp()
+        # Force every layer through the process pool
+        self.search = ParallelBreadthFirstSearch(max_workers=2, chunk_size=2, min_parallel_layer=1)
+
+    def assertMatchesSerial(self, problem, serial_problem):
+        success = self.search.search(problem)
+        serial = BreadthFirstSearch()
+        self.assertEqual(success, serial.search(serial_problem))
+        self.assertEqual(self.search.retrieve_result(), serial.retrieve_result())
+        self.assertEqual(self.search.get_nodes_retrieved(), serial.get_nodes_retrieved())
+        self.assertEqual(self.search.get_nodes_expanded(), serial.get_nodes_expanded())
+        self.assertEqual(self.search.get_goal_tests(), serial.get_goal_tests())
+        self.assertIsNone(self.search.executor)
+
+    def test_single_path_to_goal(self):
+        """Test parallel BFS finds the goal with the serial counters."""
+        self.assertMatchesSerial(self.simple_problem, self.simple_problem)
+        self.assertEqual(self.search.get_nodes_retrieved(), 3)
+
+    def test_no_path_to_goal(self):
+        """Test parallel BFS exhausts the graph when there is no path to the goal."""
+        self.assertMatchesSerial(self.unreachable_goal_problem, self.unreachable_goal_problem)
+        self.assertIsNone(self.search.retrieve_result())
+
+    def test_multiple_paths_to_goal(self):
+        """Test parallel BFS on a problem with multiple paths to the goal."""
+        self.assertMatchesSerial(self.multi_path_problem, self.multi_path_problem)
+
+    def test_initial_state_is_goal(self):
+        """Test parallel BFS when the initial state is the goal."""
+        self.assertMatchesSerial(self.initial_is_goal_problem, self.initial_is_goal_problem)
+        self.assertEqual(self.search.get_nodes_retrieved(), 0)
+
+    def test_goal_tests(self):
+        """Test children the workers tested but the merge finds visited are not counted, as the
+        serial search skips them before their goal test, and deferred goal tests are rejected."""
+        for reachable_goal in (True, False):
+            self.setUp()
+            self.assertMatchesSerial(make_test_graph(0.3, seed=4, reachable_goal=reachable_goal),
+                                     make_test_graph(0.3, seed=4, reachable_goal=reachable_goal))
+        self.search.goal_test = "retrieval"
+        self.assertRaises(ValueError, self.search.search, self.simple_problem)
+
+    def test_eight_queens(self):
+        """Test parallel BFS on N-queens returns the same first solution as the serial search."""
+        self.assertMatchesSerial(EightQueensProblem(6, compact=True), EightQueensProblem(6, compact=True))
+    def test_retrieve_path(self):
+        """Test parallel BFS records the same parent links as the serial search."""
+        self.search.search(self.simple_problem)
+        self.assertEqual(self.search.retrieve_path(), ([3, 8], 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+from algorithms import BreadthFirstSearch, DepthFirstSearch, HashedVisitedSet, SearchAlgorithm, UniformCostSearch
+from basic_test_problem import BasicTestProblem
+
+class TestSearchBudgets(BasicTestProblem):
+
+    def test_node_budget_suspends_and_resumes(self):
+        """Test a node budget suspends the search and resume continues from the same frontier."""
+        bfs = BreadthFirstSearch()
+        self.assertFalse(bfs.search(self.simple_problem, max_nodes=2))
+        self.assertTrue(bfs.suspended)
+        self.assertEqual(bfs.get_nodes_retrieved(), 2)
+        self.assertTrue(bfs.resume())
+        self.assertFalse(bfs.suspended)
+        self.assertEqual(bfs.get_nodes_retrieved(), 3)
+        self.assertEqual(self.simple_problem.discovered_transitions,
+                         [(1,2), (1,3), (1,4), (2,5), (2,6), (3,7), (3,8)])
+
+    def test_time_and_memory_budgets(self):
+        """Test exhausted time and memory budgets suspend the search before any node."""
+        bfs = BreadthFirstSearch()
+        self.assertFalse(bfs.search(self.unreachable_goal_problem, max_seconds=0))
+        self.assertTrue(bfs.suspended)
+        self.assertFalse(bfs.resume(max_memory=1))
+        self.assertEqual(bfs.get_nodes_retrieved(), 0)
+        self.assertFalse(bfs.resume(max_seconds=60, max_memory=2 ** 60))
+        self.assertFalse(bfs.suspended)
+        self.assertEqual(bfs.get_nodes_retrieved(), 14)
+
+    def test_resume_requires_suspended_search(self):
+        """Test resume refuses to run once the search has completed."""
+        bfs = BreadthFirstSearch()
+        bfs.search(self.simple_problem)
+        with self.assertRaises(RuntimeError):
+            bfs.resume()
+
+    def test_checkpoint_round_trip(self):
+        """Test a suspended search saved to disk resumes to the same result as an uninterrupted one."""
+        bfs = BreadthFirstSearch()
+        bfs.search(self.unreachable_goal_problem, max_nodes=5)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bfs.ckpt")
+            bfs.save_checkpoint(path)
+            restored = SearchAlgorithm.load_checkpoint(path)
+        self.assertEqual(restored.queue, bfs.queue)
+        self.assertEqual(restored.visited, bfs.visited)
+        self.assertFalse(restored.resume())
+        self.assertEqual(restored.get_nodes_retrieved(), 14)
+        self.assertEqual(restored.problem.discovered_transitions,
+                         [(1,2), (1,3), (1,4), (2,5), (2,6), (3,7), (3,8), (4,9), (4,10),
+                          (5,11), (5,12), (6,13), (6,14)])
+    def test_uniform_cost_checkpoint(self):
+        """Test a best-first search with the default heuristic can be saved and resumed."""
+        ucs = UniformCostSearch()
+        ucs.search(self.multi_path_problem, max_nodes=3)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "ucs.ckpt")
+            ucs.save_checkpoint(path)
+            restored = SearchAlgorithm.load_checkpoint(path)
+        self.assertEqual(restored.frontier, ucs.frontier)
+        self.assertTrue(restored.resume())
+        self.assertTrue(ucs.resume())
+        self.assertEqual(restored.retrieve_path(), ucs.retrieve_path())
+        self.assertEqual(restored.get_nodes_retrieved(), ucs.get_nodes_retrieved())
+
+    def test_lazy_depth_first_checkpoint_rejected(self):
+        """Test a suspended lazy DFS refuses to checkpoint its generator stack."""
+        dfs = DepthFirstSearch(lazy=True)
+        dfs.search(self.unreachable_goal_problem, max_nodes=3)
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(NotImplementedError):
+                dfs.save_checkpoint(os.path.join(directory, "dfs.ckpt"))
+
+    def test_salted_visited_store_checkpoint_rejected(self):
+        """Test a search with a store keyed on the builtin hash refuses to checkpoint and leaves no file."""
+        bfs = BreadthFirstSearch(visited=HashedVisitedSet)
+        bfs.search(self.unreachable_goal_problem, max_nodes=3)
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(TypeError):
+                bfs.save_checkpoint(os.path.join(directory, "bfs.ckpt"))
+            self.assertEqual(os.listdir(directory), [])
+
+if __name__ == "__main__":
+    unittest.main()
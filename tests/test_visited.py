@@ -0,0 +1,156 @@
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import unittest
+from algorithms import (BreadthFirstSearch, DepthFirstSearch, ExactVisitedSet, HashedVisitedSet,
+                        BloomVisitedFilter, BitmapVisitedSet, EncodedVisitedSet, EncodedQueue)
+from problems.mock_problem import MockProblem
+from problems.eight_queens_problem import EightQueensProblem
+from problems.graph_problem import GraphProblem
+from basic_test_problem import BasicTestProblem, make_test_graph
+
+class TestVisitedStores(BasicTestProblem):
+
+    def test_exact_backends(self):
+        """Test the exact backends remember every added state and nothing else."""
+        for store in (ExactVisitedSet(), HashedVisitedSet(initial_capacity=8)):
+            for state_id in range(0, 2000, 2):
+                store.add(MockProblem.State(state_id))
+            store.add(MockProblem.State(0))
+            self.assertEqual(len(store), 1000)
+            self.assertTrue(all(MockProblem.State(i) in store for i in range(0, 2000, 2)))
+            self.assertFalse(any(MockProblem.State(i) in store for i in range(1, 2000, 2)))
+            self.assertGreater(store.memory_usage(), 0)
+
+    def test_hashed_set_grows(self):
+        """Test the hashed table keeps its load factor bounded while growing."""
+        store = HashedVisitedSet(initial_capacity=8)
+        for state_id in range(100):
+            store.add(MockProblem.State(state_id))
+        self.assertLessEqual(len(store), store.max_load * len(store.table))
+        self.assertEqual(store.memory_usage(), store.table.nbytes)
+
+    def test_bloom_filter_error_rate(self):
+        """Test the Bloom filter never misses an added state and stays near its false-positive rate."""
+        store = BloomVisitedFilter(capacity=5000, error_rate=0.01)
+        for state_id in range(5000):
+            store.add(MockProblem.State(state_id))
+        self.assertTrue(all(MockProblem.State(i) in store for i in range(5000)))
+        false_positives = sum(MockProblem.State(i) in store for i in range(5000, 15000))
+        self.assertLess(false_positives / 10000, 0.03)
+        self.assertLess(store.memory_usage(), 6500)
+
+    def test_salted_hash_stores_refuse_pickling(self):
+        """Test the stores keyed on the builtin hash cannot end up in a checkpoint, unlike the encoded store."""
+        for store in (HashedVisitedSet(), BloomVisitedFilter(capacity=100)):
+            store.add(MockProblem.State(1))
+            self.assertRaises(TypeError, pickle.dumps, store)
+        problem = EightQueensProblem(6)
+        store = EncodedVisitedSet(problem.encode)
+        store.add(problem.make_state([1, 3]))
+        self.assertIn(problem.make_state([1, 3]), pickle.loads(pickle.dumps(store)))
+
+    def test_searches_with_backends(self):
+        """Test BFS and DFS reach the same results with every backend and report the memory used."""
+        for algorithm_class in (BreadthFirstSearch, DepthFirstSearch):
+            plain = algorithm_class()
+            plain.search(EightQueensProblem(6, compact=True))
+            for factory in (ExactVisitedSet, HashedVisitedSet, BloomVisitedFilter):
+                search = algorithm_class(visited=factory)
+                search.record_paths = False
+                self.assertTrue(search.search(EightQueensProblem(6, compact=True)))
+                self.assertEqual(search.retrieve_result(), plain.retrieve_result())
+                self.assertEqual(search.get_nodes_expanded(), plain.get_nodes_expanded())
+                self.assertEqual(search.get_visited_memory(), search.visited.memory_usage())
+                self.assertEqual(search.parents, {search.initial_state: (None, None, 0.0)})
+            self.assertGreater(plain.get_visited_memory(), 0)
+
+    def test_bitmap_set(self):
+        """Test the bitmap store over integer ids, including ids beyond its initial capacity."""
+        store = BitmapVisitedSet(capacity=8)
+        for state_id in range(0, 2000, 2):
+            store.add(state_id)
+        store.add(0)
+        self.assertEqual(len(store), 1000)
+        self.assertTrue(all(i in store for i in range(0, 2000, 2)))
+        self.assertFalse(any(i in store for i in range(1, 5000, 2)))
+        self.assertEqual(store.memory_usage(), len(store.bits))
+        self.assertGreaterEqual(store.memory_usage(), 250)
+
+    def test_encoded_set(self):
+        """Test the encoded store identifies states by their encoding, not by object identity or __hash__."""
+        problem = EightQueensProblem(8)
+        store = EncodedVisitedSet(problem.encode, initial_capacity=8)
+        store.add(problem.make_state([0, 4, 7]))
+        store.add(problem.make_state([0, 4, 7]))
+        self.assertEqual(len(store), 1)
+        self.assertIn(problem.make_state([0, 4, 7]), store)
+        self.assertNotIn(problem.make_state([0, 4]), store)
+
+    def test_encoded_set_keys_survive_processes(self):
+        """Test a pickled encoded store keeps matching its states in a process with another hash seed."""
+        script = """if True:
+            import pickle, sys
+            from algorithms import EncodedVisitedSet
+            from problems.eight_queens_problem import EightQueensProblem
+            problem = EightQueensProblem(8)
+            states = [problem.make_state(positions) for positions in ([0, 4, 7], [1, 3], [5])]
+            if sys.argv[1] == "save":
+                store = EncodedVisitedSet(problem.encode)
+                for state in states:
+                    store.add(state)
+                with open(sys.argv[2], "wb") as file:
+                    pickle.dump(store, file)
+            else:
+                with open(sys.argv[2], "rb") as file:
+                    store = pickle.load(file)
+                print(all(state in store for state in states), problem.make_state([2]) in store)
+            print([store.key(state) for state in states])
+        """
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "store.pkl")
+            outputs = []
+            for seed, mode in (("1", "save"), ("2", "load")):
+                env = dict(os.environ, PYTHONHASHSEED=seed, PYTHONPATH=root)
+                outputs.append(subprocess.run([sys.executable, "-c", script, mode, path], env=env, cwd=root,
+                                              check=True, capture_output=True, text=True).stdout.splitlines())
+        self.assertEqual(outputs[1][0], "True False")
+        self.assertEqual(outputs[0][-1], outputs[1][-1])
+
+    def test_encoded_searches(self):
+        """Test BFS and DFS in encoded mode match the plain searches and store states as encodings."""
+        problems = (make_test_graph(0.2, seed=1),
+                    EightQueensProblem(6, compact=True),
+                    GraphProblem.from_edges(6, [0, 0, 1, 2, 3, 4], [1, 2, 3, 3, 4, 5], goal_states=[5]))
+        for algorithm_class in (BreadthFirstSearch, DepthFirstSearch):
+            for problem in problems:
+                for fused in (True, False):
+                    plain = algorithm_class()
+                    plain.use_fused_loop = fused
+                    encoded = algorithm_class(encoded=True)
+                    encoded.use_fused_loop = fused
+                    self.assertTrue(plain.search(problem))
+                    self.assertTrue(encoded.search(problem))
+                    self.assertIsInstance(encoded.queue, EncodedQueue)
+                    self.assertIsInstance(encoded.visited, EncodedVisitedSet)
+                    self.assertEqual(encoded.retrieve_result(), plain.retrieve_result())
+                    self.assertEqual(encoded.retrieve_path(), plain.retrieve_path())
+                    self.assertEqual(encoded.get_nodes_expanded(), plain.get_nodes_expanded())
+                    self.assertEqual(len(encoded.visited), len(plain.visited))
+
+    def test_encoded_mode_options(self):
+        """Test encoded mode is opt-in and an explicit `visited` factory still takes precedence."""
+        search = BreadthFirstSearch()
+        search.search(EightQueensProblem(5, compact=True))
+        self.assertNotIsInstance(search.queue, EncodedQueue)
+        self.assertIsInstance(search.visited, set)
+        search = DepthFirstSearch(visited=HashedVisitedSet, encoded=True)
+        search.search(EightQueensProblem(5, compact=True))
+        self.assertIsInstance(search.queue, EncodedQueue)
+        self.assertIs(type(search.visited), HashedVisitedSet)
+
+if __name__ == "__main__":
+    unittest.main()